@@ -6,6 +6,16 @@ __version__ = '0.3'
 #__author__ =  get_distribtion('dimensionalquantity').author
 
 from . dimensional import Dimensional
+from . checking import unchecked, sampled, dimensioned
 from . basedimquant import BaseDimQuant
-from . translator import BasicTranslator, Translator
+from . translator import BasicTranslator, Translator, CompiledUnit
 from . dimquant import DimQuant
+try:
+    from . dimquantarray import DimQuantArray
+    from . textio import read_quantities, write_quantities
+    from . mmapio import write_column, open_column
+except ImportError: # DimQuantArray, textio, and mmapio require numpy
+    pass
+from . formulas import formula
+from . reductions import dq_sum, dq_mean, dq_min, dq_max
+from . memoization import memoized
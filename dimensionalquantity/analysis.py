@@ -0,0 +1,687 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `analysis.py` checks the dimensions of quantities in Python source code
+without running it, e.g. before deployment:
+$ python3 -m dimensionalquantity.analysis src/
+src/pipeline.py:12:8: Operation + requires the two operands to have equal dimensions: ...
+
+The analysis parses each module with `ast` and infers the dimensions of
+    - quantities created from literals, e.g. `DimQuant('3 m/s')` or `DimQuant(2, {'L': 1})`,
+    - parameters annotated with unit strings, e.g. `def f(m: 'kg')`,
+      or declared with `dimensioned` (see `dimensionalquantity.checking`),
+    - variables annotated with unit strings, e.g. `x: 'm' = ...`,
+      (outside of `dimensioned` a string annotation naming something bound in the module,
+      e.g. a type variable 'T', is a forward reference rather than a unit),
+    - and the results of calls to such functions of the same module with a declared result,
+and propagates them through `+ - * / **`, unary `+ -`, and comparisons,
+with the rules `BaseDimQuant` enforces at runtime.
+Anything it can't infer (e.g. attributes, items, or results of other calls)
+is unknown and isn't reported;
+thus a module without findings has no dimension errors among the expressions inferred,
+which doesn't prove that none are left.
+Within a function the analysis follows the statements in order,
+and after branches and loops keeps only the dimensions all paths agree on.
+A function sees the names of the enclosing scope bound when it is defined,
+but not those bound again anywhere (or declared global or nonlocal),
+as they may have changed by the time it is called;
+likewise, names declared global or nonlocal are unknown after any call.
+
+`analyze_paths()` spreads the files over several processes,
+so that codebases of thousands of files are analysed in a few seconds.
+"""
+
+import ast
+import os
+import sys
+from collections import namedtuple
+from multiprocessing import Pool
+
+from . import Dimensional as D
+
+Finding = namedtuple('Finding', ['filename', 'line', 'column', 'message'])
+Finding.__doc__ = """A dimension error found by the analysis, at (line, column) of the file."""
+
+# the inferred "dimensions" of a plain number (int, float, or complex);
+# unknown values are None
+_NUMBER = 'number'
+
+_comparisons = {ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>='}
+
+def _merged(scopes):
+    # the values all scopes agree on
+    first, others = scopes[0], scopes[1:]
+    return {name: value for name, value in first.items()
+            if value is not None and all(scope.get(name) is value for scope in others)}
+
+def _bound_names(tree):
+    # names bound anywhere in a module: assigned, defined, or imported
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.alias):
+            names.add((node.asname or node.name).split('.')[0])
+    return names
+
+_match_captures = tuple(getattr(ast, name) for name in ('MatchAs', 'MatchStar') if hasattr(ast, name))
+
+def _late_bound_names(tree):
+    # the names whose values may change after a function (or lambda) reading them is defined:
+    # those declared global or nonlocal anywhere,
+    # and those bound more than once within a scope (a binding within a loop counts as several)
+    declared, rebound = set(), set()
+    def visit(node, counts, repeated):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.Global, ast.Nonlocal)):
+                declared.update(child.names)
+            if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+                names = [child.id]
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names = [child.name]
+            elif isinstance(child, ast.alias):
+                names = [(child.asname or child.name).split('.')[0]]
+            elif isinstance(child, (ast.ExceptHandler,)+_match_captures) and child.name:
+                names = [child.name]
+            else:
+                names = []
+            for name in names:
+                counts[name] = counts.get(name, 0)+(2 if repeated else 1)
+                if counts[name]>1:
+                    rebound.add(name)
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+                visit(child, {}, False) # a scope of its own
+            else:
+                visit(child, counts, repeated or isinstance(child, (ast.For, ast.AsyncFor, ast.While)))
+    visit(tree, {}, False)
+    return declared, rebound
+
+def _stored_names(node):
+    # names bound by a target (or any other node)
+    return [child.id for child in ast.walk(node)
+            if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del))]
+
+class _Analysis(object):
+    # infers the dimensions of one module, collecting the findings
+
+    def __init__(self, filename, translator):
+        self.filename = filename
+        self.translator = translator
+        self.findings = []
+        self.reported = set()
+        self.constructors = {'DimQuant'} # names of DimQuant (e.g. after `import DimQuant as DQ`)
+        self.dimensionals = {'Dimensional'}
+        self.modules = set() # names of the package (e.g. after `import dimensionalquantity as dq`)
+        self.functions = {} # name -> ([(name, position or None, dimensions or None)], result dimensions)
+        self.bound = set() # names bound in the module, which annotations may refer to
+        self.declared = set() # names declared global or nonlocal, which a call may rebind
+        self.late_bound = set() # names unknown within functions, see _late_bound_names()
+        self.scope = {}
+        self.function = None # name of the current function
+        self.returns = None # declared dimensions of its result
+
+    def report(self, node, message):
+        finding = Finding(self.filename, node.lineno, node.col_offset+1, message)
+        if finding not in self.reported: # loops are analysed repeatedly
+            self.reported.add(finding)
+            self.findings.append(finding)
+
+    def annotated(self, annotation, dimensioned=False):
+        # the unit of a string annotation, None for anything else,
+        # including the names bound in the module (e.g. 'T' of `T = TypeVar('T')`),
+        # unless the function is decorated with `dimensioned`, which takes every string as unit
+        if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str) \
+           and (dimensioned or annotation.value not in self.bound):
+            return annotation.value
+        return None
+
+    def translated(self, unit, node=None):
+        # the dimensions of a unit string; None if it can't be translated,
+        # which is reported for units known to be units (i.e. not for annotations,
+        # which may be forward references like 'MyClass')
+        try:
+            return self.translator.translate(unit).dimensions
+        except (KeyError, ValueError) as error:
+            if node is not None:
+                self.report(node, 'Unit \'{}\' can\'t be translated: {}'.format(unit, error.args[0]))
+            return None
+
+    # ---- modules and statements ----
+
+    def module(self, tree):
+        self.bound = _bound_names(tree)
+        self.declared, rebound = _late_bound_names(tree)
+        self.late_bound = self.declared|rebound
+        for statement in tree.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                self.statement(statement) # imports first, as functions are registered before
+        for statement in tree.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                signature = self.signature(statement)
+                if statement.name in self.functions: # redefined: ambiguous
+                    signature = None
+                self.functions[statement.name] = signature
+        self.block(tree.body)
+        return self.findings
+
+    def block(self, statements):
+        for statement in statements:
+            self.statement(statement)
+
+    def branches(self, *blocks):
+        # analyses each block starting from the current scope and merges the results
+        entry, exits = self.scope, []
+        for statements in blocks:
+            self.scope = dict(entry)
+            self.block(statements)
+            exits.append(self.scope)
+        self.scope = _merged(exits)
+
+    def loop(self, target, body, orelse):
+        # the body may run zero or several times: analyse it until the merged scope is stable
+        entry = self.scope
+        while True:
+            self.scope = dict(entry)
+            for name in target:
+                self.scope.pop(name, None)
+            self.block(body)
+            merged = _merged([entry, self.scope])
+            if merged==entry:
+                break
+            entry = merged
+        self.scope = entry
+        self.block(orelse)
+
+    def statement(self, node):
+        method = getattr(self, 'statement_'+type(node).__name__, None)
+        if method is not None:
+            method(node)
+            return
+        # anything else: check the expressions, forget the names bound
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                self.value(child)
+            elif isinstance(child, ast.stmt):
+                self.statement(child)
+        for name in _stored_names(node):
+            self.scope.pop(name, None)
+
+    def statement_Import(self, node):
+        for alias in node.names:
+            if alias.name=='dimensionalquantity':
+                self.modules.add(alias.asname or alias.name)
+            self.scope.pop((alias.asname or alias.name).split('.')[0], None)
+
+    def statement_ImportFrom(self, node):
+        if (node.module or '').split('.')[0]=='dimensionalquantity':
+            for alias in node.names:
+                if alias.name=='DimQuant':
+                    self.constructors.add(alias.asname or alias.name)
+                elif alias.name=='Dimensional':
+                    self.dimensionals.add(alias.asname or alias.name)
+        for alias in node.names:
+            self.scope.pop(alias.asname or alias.name, None)
+
+    def statement_Assign(self, node):
+        value = self.value(node.value)
+        for target in node.targets:
+            self.assign(target, value)
+
+    def statement_AnnAssign(self, node):
+        declared = None
+        if self.annotated(node.annotation) is not None:
+            declared = self.translated(node.annotation.value)
+        if node.value is not None:
+            value = self.value(node.value)
+            if declared is not None:
+                self.expect(node.value, value, declared,
+                            'Variable {}, declared in \'{}\', has to be'.format(ast.unparse(node.target),
+                                                                              node.annotation.value))
+        else:
+            value = None
+        self.assign(node.target, value if declared is None else declared)
+
+    def statement_AugAssign(self, node):
+        value = self.binary(node, self.value(node.target) if isinstance(node.target, ast.Name) else None,
+                            node.op, self.value(node.value), node.value)
+        self.assign(node.target, value)
+
+    def statement_Return(self, node):
+        if node.value is not None:
+            value = self.value(node.value)
+            if self.returns is not None:
+                self.expect(node.value, value, self.returns, 'The result of {}() has to be'.format(self.function))
+
+    def statement_If(self, node):
+        self.value(node.test)
+        self.branches(node.body, node.orelse)
+
+    def statement_For(self, node):
+        self.value(node.iter)
+        self.loop(_stored_names(node.target), node.body, node.orelse)
+    statement_AsyncFor = statement_For
+
+    def statement_While(self, node):
+        self.value(node.test)
+        self.loop([], node.body, node.orelse)
+
+    def statement_Try(self, node):
+        entry = self.scope
+        self.block(node.body)
+        self.block(node.orelse)
+        exits = [self.scope]
+        for handler in node.handlers: # may start anywhere in the body
+            self.scope = _merged([entry, exits[0]])
+            if handler.name:
+                self.scope.pop(handler.name, None)
+            self.block(handler.body)
+            exits.append(self.scope)
+        self.scope = _merged(exits)
+        self.block(node.finalbody)
+    statement_TryStar = statement_Try
+
+    def statement_With(self, node):
+        for item in node.items:
+            self.value(item.context_expr)
+            if item.optional_vars is not None:
+                self.assign(item.optional_vars, None)
+        self.block(node.body)
+    statement_AsyncWith = statement_With
+
+    def statement_FunctionDef(self, node):
+        for default in node.args.defaults+[d for d in node.args.kw_defaults if d is not None]:
+            self.value(default)
+        for decorator in node.decorator_list:
+            self.value(decorator)
+        signature = self.signature(node)
+        arguments, returns = signature if signature is not None else ([], None)
+        # the body sees the enclosing scope as it is now (but the names bound again later,
+        # which may have changed by the time the function is called), and its own parameters
+        scope, outer = self.scope, (self.function, self.returns)
+        self.scope = self.enclosed(scope)
+        self.function, self.returns = node.name, returns
+        declared = {name: dimensions for name, _, dimensions in arguments}
+        for name in self.parameter_names(node):
+            self.scope.pop(name, None)
+            if declared.get(name) is not None:
+                self.scope[name] = declared[name]
+        # defaults are checked against the declared dimensions
+        positional = node.args.posonlyargs+node.args.args
+        for argument, default in zip(positional[len(positional)-len(node.args.defaults):], node.args.defaults):
+            self.check_argument(default, node.name, argument.arg, declared.get(argument.arg))
+        for argument, default in zip(node.args.kwonlyargs, node.args.kw_defaults):
+            if default is not None:
+                self.check_argument(default, node.name, argument.arg, declared.get(argument.arg))
+        self.block(node.body)
+        self.scope, (self.function, self.returns) = scope, outer
+        self.scope.pop(node.name, None)
+    statement_AsyncFunctionDef = statement_FunctionDef
+
+    def statement_ClassDef(self, node):
+        for expression in node.bases+[keyword.value for keyword in node.keywords]+node.decorator_list:
+            self.value(expression)
+        scope = self.scope
+        self.scope = dict(scope)
+        self.block(node.body)
+        self.scope = scope
+        self.scope.pop(node.name, None)
+
+    def assign(self, target, value):
+        if isinstance(target, ast.Name):
+            if value is None:
+                self.scope.pop(target.id, None)
+            else:
+                self.scope[target.id] = value
+        else:
+            for child in ast.iter_child_nodes(target):
+                if isinstance(child, ast.expr) and not isinstance(child, ast.Name):
+                    self.value(child) # e.g. the index of a subscript
+            for name in _stored_names(target):
+                self.scope.pop(name, None)
+
+    # ---- functions ----
+
+    def parameter_names(self, node):
+        arguments = node.args
+        names = [argument.arg for argument in arguments.posonlyargs+arguments.args+arguments.kwonlyargs]
+        names += [argument.arg for argument in (arguments.vararg, arguments.kwarg) if argument is not None]
+        return names
+
+    def signature(self, node):
+        # ([(name, position or None, dimensions or None)], result dimensions)
+        # of the parameters declared by string annotations or `dimensioned`,
+        # None if a decorator other than `dimensioned` or `formula` may change the function
+        dimensioned = any(_called_name(decorator)=='dimensioned' for decorator in node.decorator_list)
+        units = {argument.arg: self.annotated(argument.annotation, dimensioned)
+                 for argument in node.args.posonlyargs+node.args.args+node.args.kwonlyargs}
+        units = {name: unit for name, unit in units.items() if unit is not None}
+        returns = self.annotated(node.returns, dimensioned)
+        known = True
+        for decorator in node.decorator_list:
+            name = _called_name(decorator)
+            if name=='dimensioned':
+                if isinstance(decorator, ast.Call):
+                    for keyword in decorator.keywords:
+                        if isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str):
+                            if keyword.arg=='returns':
+                                returns = keyword.value.value
+                            elif keyword.arg is not None:
+                                units[keyword.arg] = keyword.value.value
+            elif name!='formula':
+                known = False
+        positional = [argument.arg for argument in node.args.posonlyargs+node.args.args]
+        arguments = [(name, positional.index(name) if name in positional else None, self.translated(unit))
+                     for name, unit in units.items()]
+        returns = None if returns is None else self.translated(returns)
+        return (arguments, returns) if known else None
+
+    def check_argument(self, node, function, name, declared):
+        if declared is not None:
+            self.expect(node, self.value(node), declared,
+                        'Argument {} of {}() has to be'.format(name, function))
+
+    def call(self, node):
+        name = _called_name(node)
+        if isinstance(node.func, ast.Name) and name in self.constructors \
+                or isinstance(node.func, ast.Attribute) and name=='DimQuant' \
+                and isinstance(node.func.value, ast.Name) and node.func.value.id in self.modules:
+            return self.constructed(node)
+        self.value(node.func)
+        signature = self.functions.get(name) if isinstance(node.func, ast.Name) \
+                                                and name not in self.scope else None
+        if signature is None:
+            for argument in node.args+[keyword.value for keyword in node.keywords]:
+                self.value(argument.value if isinstance(argument, ast.Starred) else argument)
+            self.called()
+            return None
+        arguments, returns = signature
+        by_position = {position: (argument, dimensions) for argument, position, dimensions in arguments
+                       if position is not None}
+        by_name = {argument: dimensions for argument, _, dimensions in arguments}
+        starred = False
+        for position, argument in enumerate(node.args):
+            starred = starred or isinstance(argument, ast.Starred)
+            if starred:
+                self.value(argument.value if isinstance(argument, ast.Starred) else argument)
+            elif position in by_position:
+                self.check_argument(argument, name, *by_position[position])
+            else:
+                self.value(argument)
+        for keyword in node.keywords:
+            if keyword.arg in by_name:
+                self.check_argument(keyword.value, name, keyword.arg, by_name[keyword.arg])
+            else:
+                self.value(keyword.value)
+        self.called()
+        return returns
+
+    def called(self):
+        # a call may rebind the names declared global or nonlocal
+        for name in self.declared:
+            self.scope.pop(name, None)
+
+    def constructed(self, node):
+        # the dimensions of DimQuant('3 m/s') or DimQuant(numeric, {'L': 1})
+        for argument in node.args+[keyword.value for keyword in node.keywords]:
+            self.value(argument)
+        if len(node.args)==1 and not node.keywords and isinstance(node.args[0], ast.Constant) \
+                and isinstance(node.args[0].value, str):
+            parts = node.args[0].value.split(' ')
+            if len(parts)!=2:
+                self.report(node, 'DimQuant(\'{}\') isn\'t of the form \'<number> <unit>\'.'.format(
+                                  node.args[0].value))
+                return None
+            return self.translated(parts[1], node)
+        if len(node.args)==2 and not node.keywords:
+            dimensions = node.args[1]
+            if isinstance(dimensions, ast.Call) and isinstance(dimensions.func, ast.Name) \
+                    and dimensions.func.id in self.dimensionals and len(dimensions.args)==1:
+                dimensions = dimensions.args[0]
+            try:
+                return D(ast.literal_eval(dimensions))
+            except (ValueError, TypeError, SyntaxError):
+                return None
+        return None
+
+    # ---- expressions ----
+
+    def value(self, node):
+        # the dimensions of the expression, _NUMBER, or None if unknown
+        if isinstance(node, ast.Constant):
+            number = isinstance(node.value, (int, float, complex)) and not isinstance(node.value, bool)
+            return _NUMBER if number else None
+        if isinstance(node, ast.Name):
+            return self.scope.get(node.id)
+        if isinstance(node, ast.BinOp):
+            return self.binary(node, self.value(node.left), node.op, self.value(node.right), node.right)
+        if isinstance(node, ast.UnaryOp):
+            operand = self.value(node.operand)
+            return operand if isinstance(node.op, (ast.USub, ast.UAdd)) else None
+        if isinstance(node, ast.Compare):
+            self.compare(node)
+            return None
+        if isinstance(node, ast.Call):
+            return self.call(node)
+        if isinstance(node, ast.IfExp):
+            self.value(node.test)
+            body, orelse = self.value(node.body), self.value(node.orelse)
+            return body if body is orelse else None
+        if isinstance(node, ast.NamedExpr):
+            value = self.value(node.value)
+            self.assign(node.target, value)
+            return value
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp, ast.Lambda)):
+            self.nested(node)
+            return None
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                self.value(child)
+        return None
+
+    def enclosed(self, scope):
+        # the enclosing scope as a function (or lambda) defined now sees it when called
+        return {name: value for name, value in scope.items() if name not in self.late_bound}
+
+    def nested(self, node):
+        # comprehensions and lambdas bind their own names
+        scope = self.scope
+        self.scope = self.enclosed(scope) if isinstance(node, ast.Lambda) else dict(scope)
+        if isinstance(node, ast.Lambda):
+            for name in self.parameter_names(node):
+                self.scope.pop(name, None)
+            self.value(node.body)
+        else:
+            for generator in node.generators:
+                self.value(generator.iter)
+                self.assign(generator.target, None)
+                for condition in generator.ifs:
+                    self.value(condition)
+            for expression in ((node.key, node.value) if isinstance(node, ast.DictComp) else (node.elt,)):
+                self.value(expression)
+        self.scope = scope
+
+    def binary(self, node, left, operator, right, right_node=None):
+        symbol = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/', ast.Pow: '**'}.get(type(operator))
+        if left is None or right is None:
+            # a sum (or difference) of quantities passes only with equal dimensions
+            known = right if left is None else left
+            return known if symbol in ('+', '-') and known is not _NUMBER else None
+        if symbol is None: # e.g. // or %
+            return _NUMBER if left is _NUMBER and right is _NUMBER else None
+        if left is _NUMBER and right is _NUMBER:
+            return _NUMBER
+        if symbol in '+-':
+            if left is _NUMBER or right is _NUMBER:
+                self.report(node, 'Operation {} of a quantity of dimensions {} and a plain number.'.format(
+                                  symbol, left if right is _NUMBER else right))
+                return None
+            if left is not right: # Dimensional is interned
+                self.report(node, 'Operation {} requires the two operands to have equal dimensions: {} and {}.'.format(
+                                  symbol, left, right))
+            return left
+        if symbol=='*':
+            return left if right is _NUMBER else right if left is _NUMBER else left+right
+        if symbol=='/':
+            return left if right is _NUMBER else -1*right if left is _NUMBER else left-right
+        # **
+        if right is not _NUMBER:
+            if len(right)>0:
+                self.report(node, 'The exponent cannot be a dimensional quantity, not of dimensions {}.'.format(right))
+            return None
+        if left is _NUMBER:
+            return _NUMBER
+        exponent = _literal_number(right_node)
+        return None if exponent is None else left*exponent
+
+    def compare(self, node):
+        values = [self.value(node.left)]+[self.value(comparator) for comparator in node.comparators]
+        for operator, left, right in zip(node.ops, values[:-1], values[1:]):
+            symbol = _comparisons.get(type(operator))
+            if symbol is None or left is None or right is None or (left is _NUMBER and right is _NUMBER):
+                continue
+            if left is _NUMBER or right is _NUMBER:
+                quantity = right if left is _NUMBER else left
+                if len(quantity)>0:
+                    self.report(node, '\'{}\' not supported between a quantity of dimensions {} and a plain number.'.format(
+                                      symbol, quantity))
+            elif left is not right:
+                self.report(node, 'Comparison \'{}\' is not defined for quantities of dimensions {} and {}.'.format(
+                                  symbol, left, right))
+
+    def expect(self, node, value, declared, what):
+        if value is None or value is declared:
+            return
+        if value is _NUMBER:
+            if len(declared)>0:
+                self.report(node, '{} of dimensions {}, not a plain number.'.format(what, declared))
+        else:
+            self.report(node, '{} of dimensions {}, not {}.'.format(what, declared, value))
+
+def _called_name(node):
+    # 'f' of f(...), f, x.f(...), or x.f
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+def _literal_number(node):
+    # the value of a literal like 2, -0.5, or +3; None for anything else
+    sign = 1
+    while isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        sign *= -1 if isinstance(node.op, ast.USub) else 1
+        node = node.operand
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return sign*node.value
+    return None
+
+def _default_translator():
+    from . import DimQuant
+    return DimQuant._T
+
+def analyze_source(source, filename='<string>', translator=None):
+    """Checks the dimensions of the quantities in Python source code, without running it.
+    Example:
+    >>> analyze_source("from dimensionalquantity import DimQuant\\n"
+    ...                "x = DimQuant('1 m')+DimQuant('1 s')")
+    [Finding(filename='<string>', line=2, column=5, message="Operation + requires the two operands
+     to have equal dimensions: Dimensional({'L': 1}) and Dimensional({'t': 1}).")]
+
+    Args:
+        source (str or bytes): the source code of a module.
+        filename (str='<string>'): the name to report the findings with.
+        translator (BasicTranslator=None): translates the unit strings,
+            by default the one registered in DimQuant.
+
+    Return:
+        list of `Finding` instances, in the order found.
+
+    Raises:
+        SyntaxError: if the source can't be parsed.
+    """
+    tree = ast.parse(source, filename)
+    return _Analysis(filename, _default_translator() if translator is None else translator).module(tree)
+
+def _python_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, subdirectories, filenames in os.walk(path):
+                subdirectories.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith('.py'):
+                        yield os.path.join(directory, filename)
+        else:
+            yield path
+
+_worker_translator = None
+
+def _initialize_worker(translator):
+    global _worker_translator
+    _worker_translator = translator
+
+def _analyze_file(path, translator=None):
+    with open(path, 'rb') as stream:
+        source = stream.read()
+    translator = translator or _worker_translator
+    try:
+        return analyze_source(source, path, translator)
+    except (SyntaxError, ValueError) as error: # ValueError: e.g. null bytes
+        return [Finding(path, getattr(error, 'lineno', None) or 0, getattr(error, 'offset', None) or 0,
+                        'The file can\'t be parsed: {}'.format(error))]
+
+def analyze_paths(paths, processes=None, translator=None):
+    """Checks the dimensions of the quantities in Python files, without running them;
+    see `analyze_source()`.
+
+    Args:
+        paths (iterable): files and directories, the latter are searched for '*.py' files recursively.
+        processes (int=None): number of processes analysing the files,
+            by default the number of CPUs; 1 analyses all files in this process.
+        translator (BasicTranslator=None): translates the unit strings,
+            by default the one registered in DimQuant.
+
+    Return:
+        list of `Finding` instances, sorted by file and position;
+        files which can't be parsed are reported as a finding as well.
+    """
+    files = list(_python_files([paths] if isinstance(paths, (str, os.PathLike)) else paths))
+    translator = _default_translator() if translator is None else translator
+    processes = (os.cpu_count() or 1) if processes is None else processes
+    if processes<=1 or len(files)<=1:
+        results = [_analyze_file(path, translator) for path in files]
+    else:
+        with Pool(min(processes, len(files)), initializer=_initialize_worker, initargs=(translator,)) as pool:
+            # large chunks keep the overhead per file small
+            results = pool.map(_analyze_file, files, chunksize=max(1, len(files)//(4*processes)))
+    return sorted((finding for findings in results for finding in findings),
+                  key=lambda finding: (str(finding.filename), finding.line, finding.column))
+
+def main(arguments=None):
+    """Command line interface:
+    $ python3 -m dimensionalquantity.analysis [-j PROCESSES] PATH [PATH ...]
+    prints the findings of `analyze_paths()`, one per line as 'file:line:column: message'.
+
+    Args:
+        arguments (list=None): the command line arguments, by default `sys.argv[1:]`.
+
+    Return:
+        exit status: 0 without findings, 1 with findings.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog='python3 -m dimensionalquantity.analysis',
+                                     description='Checks the dimensions of quantities in Python files.')
+    parser.add_argument('paths', nargs='+', help='files, or directories to search for *.py files')
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help='number of processes (default: number of CPUs)')
+    options = parser.parse_args(arguments)
+    findings = analyze_paths(options.paths, options.processes)
+    for finding in findings:
+        print('{}:{}:{}: {}'.format(*finding))
+    return 1 if findings else 0
+
+if __name__=="__main__":
+    sys.exit(main())
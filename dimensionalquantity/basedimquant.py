@@ -7,9 +7,18 @@ This class builds the basis for DimQuant:
 combining a numerical value with an instance of Dimensional.
 """
 
+import operator
 from functools import wraps
 
 from . import Dimensional as D
+from .binaryio import _pack_quantity, _unpack_quantity
+from .checking import _with_switchable_checks, _DimensionsDiffer, _DimensionsIncomparable
+
+class _QuantityContainer(object):
+    # base class of containers holding many quantities at once (e.g. DimQuantArray);
+    # BaseDimQuant leaves operations involving such a container
+    # to the container's (reflected) operators
+    __slots__ = ()
 
 # like compatible_with_operation() for Dimensional but expl. only for __add__ and __sub__
 def compatible_with_linear_operation(operation='<undefined>'):
@@ -17,42 +26,74 @@ def compatible_with_linear_operation(operation='<undefined>'):
         @wraps(method)
         def decorated(self, other, **kwargs):
             if not isinstance(other, BaseDimQuant):
+                if isinstance(other, _QuantityContainer):
+                    return NotImplemented
                 raise TypeError(''.join(['unsupported operand type(s) for {}:'.format(operation),
                                          ' \'{}\' and \'{}\''.format(type(self).__name__,
                                                                      type(other).__name__)]))
-            elif self.dimensions!=other.dimensions:
-                raise ValueError(''.join(['Operation {} requires'.format(operation),
+            elif self.dimensions is not other.dimensions: # Dimensional is interned
+                raise _DimensionsDiffer(''.join(['Operation {} requires'.format(operation),
                                           'the two operands to have equal dimensions.']))
             else:
                 return method(self, other)
+        # variant without the check for equal dimensions, see dimensionalquantity.checking
+        @wraps(method)
+        def unchecked(self, other, **kwargs):
+            if isinstance(other, BaseDimQuant):
+                return method(self, other)
+            return decorated(self, other)
+        decorated._unchecked, unchecked._checked = unchecked, decorated
         return decorated
     return decorate_specified_operation
 
+# comparison of a non-dimensional quantity with a plain number
+# is delegated to the comparison of the numeric with said number
+_numeric_comparisons = {'==': operator.eq,
+                        '>': operator.gt,
+                        '>=': operator.ge,
+                        '<': operator.lt,
+                        '<=': operator.le,
+                        }
+
 def compatible_with_comparison(comparison_name='<undefined>'):
     def comparison(compare):
+        numeric_comparison = _numeric_comparisons[comparison_name]
         @wraps(compare)
         def decorated(self, other, **kwargs):
             if not isinstance(other, BaseDimQuant):
+                if isinstance(other, _QuantityContainer):
+                    return NotImplemented
                 if self.is_non_dimensional():
-                    # how to access (e.g.) self.numeric.__eq__(other)?
-                    # 'return self.numeric.compare(other)' doesn't work
-                    # because 'self.numeric' doesn't have a method called 'compare'
-                    # this hack works, but looks ugly:
-                    return eval('self.numeric.{}(other)'.format(compare.__name__))
+                    return numeric_comparison(self.numeric, other)
                 else:
                     raise TypeError(' '.join(['\'{}\' not supported'.format(comparison_name),
                                               'between instances of',
                                               '\'{}\' and \'{}\''.format(type(self).__name__,
                                                                          type(other).__name__)]))
             else:
-                if (self.dimensions!=other.dimensions):
-                    raise NotImplementedError(' '.join(['Comparison \'{}\' is not defined'.format(comparison_name),
+                if self.dimensions is not other.dimensions: # Dimensional is interned
+                    raise _DimensionsIncomparable(' '.join(['Comparison \'{}\' is not defined'.format(comparison_name),
                                                         'for dimensional quantities of different dimension!']))
                 else:
                     return compare(self, other)
+        # variant without the check for equal dimensions, see dimensionalquantity.checking
+        @wraps(compare)
+        def unchecked(self, other, **kwargs):
+            if isinstance(other, BaseDimQuant):
+                return compare(self, other)
+            return decorated(self, other)
+        decorated._unchecked, unchecked._checked = unchecked, decorated
         return decorated
     return comparison
 
+def _checked_numeric(value):
+    if isinstance(value, (int, float, complex)) \
+            and not isinstance(value, bool): # note: bool is instance of int but that doesn't make sense here!
+        return value
+    else:
+        raise TypeError('Numeric value isn\'t a numeric type but of \'{}\' instead.'.format(type(value).__name__))
+
+@_with_switchable_checks
 class BaseDimQuant(object):
     """Base class for working with dimensional quantities.
     
@@ -65,26 +106,36 @@ class BaseDimQuant(object):
         Nonetheless, this class isn't intended to be be used on its own:
         DimQuant (which is derived from BaseDimQuant) offers a more convenient string based constructor.
         :py:meth: `dimensionalquantity.DimQuant`"""
+
+    __slots__ = ('__numeric', '__dimensions')
+
     def __init__(self, numeric=0, dimensions=D({})):
         self.numeric=numeric
         self.dimensions=dimensions
 
+    @classmethod
+    def _trusted(cls, numeric, dimensions):
+        # fast path for results of operations on already validated quantities:
+        # skips __init__ and the property setters,
+        # i.e. numeric has to be a valid number and dimensions an (interned) Dimensional
+        self = object.__new__(cls)
+        self.__numeric = numeric
+        self.__dimensions = dimensions
+        return self
+
     @property
     def numeric(self):
         """A number (int, float, complex) representing the amount of the dimensional quantity."""
         return self.__numeric
     @numeric.setter
     def numeric(self, value):
-        if isinstance(value, (int, float, complex)) \
-                and not isinstance(value, bool): # note: bool is instance of int but that doesn't make sense here!
-            self.__numeric = value
-        else:
-            raise TypeError('Numeric value isn\'t a numeric type but of \'{}\' instead.'.format(type(value).__name__))
+        self.__numeric = _checked_numeric(value)
 
     @property
     def dimensions(self):
         """The dimensions (dict, Dimensional) of the quantity in the format of a dict.
-        It is e.g. for '1 m': dimensions = {'L': 1}."""
+        It is e.g. for '1 m': dimensions = {'L': 1}.
+        Quantities of equal dimensions share one (immutable) Dimensional instance."""
         return self.__dimensions
     @dimensions.setter
     def dimensions(self, dims):
@@ -93,10 +144,12 @@ class BaseDimQuant(object):
         else:
             raise TypeError('Dimensions aren\'t of type \'Dimensional\' but of \'{}\' instead.'.format(type(dims).__name__))
     
+    # the operators below build their result via _trusted():
+    # if both operands are quantities, the result is valid by construction;
+    # otherwise only the numeric needs to be checked.
     @compatible_with_linear_operation('+')
     def __add__(self, other):
-        return self.__class__(numeric = self.numeric+other.numeric,\
-                              dimensions = D(self.dimensions))
+        return self._trusted(self.__numeric+other.__numeric, self.__dimensions)
     # the __radd__ isn't actually necessary
     # because the compatible_with_linear_operation decorator
     # anyway only accepts other's of BaseDimQuant type
@@ -108,8 +161,7 @@ class BaseDimQuant(object):
 
     @compatible_with_linear_operation('-')
     def __sub__(self, other):
-        return self.__class__(numeric = self.numeric-other.numeric,\
-                              dimensions = D(self.dimensions))
+        return self._trusted(self.__numeric-other.__numeric, self.__dimensions)
     # not implementing __rsub__ for same reason as __radd__
     #@compatible_with_linear_operation('-')
     #def __rsub__(self, other):
@@ -117,47 +169,109 @@ class BaseDimQuant(object):
 
     def __mul__(self, other):
         if isinstance(other, BaseDimQuant):
-            #return BaseDimQuant(numeric = self.numeric*other.numeric,\
-            #                dimensions = self.dimensions+other.dimensions)
-            return self.__class__(numeric = self.numeric*other.numeric,\
-                                  dimensions = self.dimensions+other.dimensions)
+            return self._trusted(self.__numeric*other.__numeric,
+                                 self.__dimensions+other.__dimensions)
+        elif isinstance(other, _QuantityContainer):
+            return NotImplemented
         else:
-            return self.__class__(numeric = self.numeric*other,\
-                                  dimensions = D(self.dimensions))
+            return self._trusted(_checked_numeric(self.__numeric*other),
+                                 self.__dimensions)
     def __rmul__(self, other):
         return self*other
 
     def __truediv__(self, other):
         if isinstance(other, BaseDimQuant): 
-            return self.__class__(numeric = self.numeric/other.numeric,\
-                                  dimensions = self.dimensions-other.dimensions)
+            return self._trusted(self.__numeric/other.__numeric,
+                                 self.__dimensions-other.__dimensions)
+        elif isinstance(other, _QuantityContainer):
+            return NotImplemented
         else:
-            return self.__class__(numeric = self.numeric/other,\
-                                  dimensions = D(self.dimensions))
+            return self._trusted(_checked_numeric(self.__numeric/other),
+                                 self.__dimensions)
 
     def __rtruediv__(self, other):
         # if isinstance(other, BaseDimQuant): this case is covered by __truediv__
-        return self.__class__(numeric = other/self.numeric,\
-                              dimensions = -1*D(self.dimensions))
+        return self._trusted(_checked_numeric(other/self.__numeric),
+                             -1*self.__dimensions)
 
     # __pow__ makes sense only if the exponent is either not an instance of BaseDimQuant
     # or if all entries of BaseDimQuant.dimensions are 0
     def __pow__(self, other):
+        if isinstance(other, _QuantityContainer):
+            return NotImplemented
         if not isinstance(other, BaseDimQuant):
-            return self.__class__(numeric = self.numeric**other,\
-                                  dimensions = self.dimensions*other)
+            return self._trusted(_checked_numeric(self.__numeric**other),
+                                 self.__dimensions*other)
         else:
             if not other.is_non_dimensional():
                 raise NotImplementedError(' '.join(['The exponent cannot be a dimensional quantity,',\
                                                     'it has to be a purely numerical value!']))
             else:
                 if self.is_non_dimensional():
-                    return self.numeric**other.numeric
+                    return self.__numeric**other.__numeric
                 else:
-                    return self**other.numeric
+                    return self**other.__numeric
     def __rpow__(self, other):
         return self.__class__(other)**self
 
+    # the in-place operators update the quantity itself instead of building a new one,
+    # i.e. (like for a numpy array) every name bound to the quantity sees the update;
+    # they accept the same operands as the operators above
+    # and leave the quantity unchanged if they raise.
+    # An operand holding many quantities (e.g. DimQuantArray) results in a new container,
+    # via NotImplemented and the container's reflected operator.
+    @compatible_with_linear_operation('+=')
+    def __iadd__(self, other):
+        self.__numeric = self.__numeric+other.__numeric
+        return self
+
+    @compatible_with_linear_operation('-=')
+    def __isub__(self, other):
+        self.__numeric = self.__numeric-other.__numeric
+        return self
+
+    def __imul__(self, other):
+        if isinstance(other, BaseDimQuant):
+            if other.__dimensions: # a non-dimensional factor leaves the dimensions as they are
+                self.__numeric, self.__dimensions = (self.__numeric*other.__numeric,
+                                                     self.__dimensions+other.__dimensions)
+            else:
+                self.__numeric = self.__numeric*other.__numeric
+        elif isinstance(other, _QuantityContainer):
+            return NotImplemented
+        else:
+            self.__numeric = _checked_numeric(self.__numeric*other)
+        return self
+
+    def __itruediv__(self, other):
+        if isinstance(other, BaseDimQuant):
+            if other.__dimensions:
+                self.__numeric, self.__dimensions = (self.__numeric/other.__numeric,
+                                                     self.__dimensions-other.__dimensions)
+            else:
+                self.__numeric = self.__numeric/other.__numeric
+        elif isinstance(other, _QuantityContainer):
+            return NotImplemented
+        else:
+            self.__numeric = _checked_numeric(self.__numeric/other)
+        return self
+
+    def __ipow__(self, other):
+        if isinstance(other, BaseDimQuant):
+            # as for __pow__, a non-dimensional quantity raised to a non-dimensional quantity
+            # results in a plain number, which can't be stored in place
+            if other.is_non_dimensional() and not self.is_non_dimensional():
+                other = other.__numeric
+            else:
+                return self**other
+        elif isinstance(other, _QuantityContainer):
+            return NotImplemented
+        numeric = _checked_numeric(self.__numeric**other)
+        if self.__dimensions and other!=1:
+            self.__dimensions = self.__dimensions*other
+        self.__numeric = numeric
+        return self
+
     @compatible_with_comparison('==')
     def __eq__(self, other):
         """according to https://docs.python.org/3/reference/datamodel.html
@@ -165,6 +279,19 @@ class BaseDimQuant(object):
         """
         return (self.numeric == other.numeric)
 
+    def __hash__(self):
+        """Consistent with `__eq__`: equal quantities hash equally,
+        and a non-dimensional quantity hashes like its numeric, which it equals.
+        Like any object used as key of a dict or member of a set,
+        a quantity must not be changed (e.g. by `+=`) while used as such.
+
+        .. seealso::
+            :py:meth: `dimensionalquantity.memoization.memoized`
+        """
+        if self.__dimensions: # Dimensional drops entries that are 0
+            return hash((self.__numeric, self.__dimensions))
+        return hash(self.__numeric)
+
     @compatible_with_comparison('>')
     def __gt__(self, other):
         return (self.numeric > other.numeric)
@@ -200,7 +327,35 @@ class BaseDimQuant(object):
             It doesn't make sense to have a dimensional exponent;
             e.g. 2**'1 m' isn't defined.
         """
-        return ( (len(self.dimensions)==0) or not any(self.dimensions.values()) )
+        return len(self.__dimensions)==0 # Dimensional drops entries that are 0
+
+    def to_bytes(self):
+        """Encodes the quantity in a compact binary format:
+        a header with the dimensions, followed by the packed numeric;
+        see `dimensionalquantity.binaryio` for the layout.
+        >>> BaseDimQuant(2.5, Dimensional({'L':1, 't':-1})).to_bytes()
+        b'DQ\\x01q\\x02b\\x01L\\x01t\\x01\\xffd\\x00\\x00\\x00\\x00\\x00\\x00\\x04@'
+
+        Return:
+            bytes, which `from_bytes()` decodes.
+        """
+        return _pack_quantity(self.__numeric, self.__dimensions)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decodes a quantity encoded by `to_bytes()`.
+
+        Args:
+            data (bytes-like): the encoded quantity.
+
+        Return:
+            instance of this class.
+
+        Raises:
+            ValueError: if the data isn't a single encoded quantity.
+        """
+        numeric, dimensions = _unpack_quantity(data)
+        return cls._trusted(numeric, dimensions)
 
     def __repr__(self):
         """Example:
@@ -208,3 +363,8 @@ class BaseDimQuant(object):
         >>> print(q)
         BaseDimQuant(1, Dimensional({'L':1, 't':-1})"""
         return 'BaseDimQuant({}, {})'.format(self.numeric,self.dimensions)
+
+# read the slots of many quantities without going through the properties,
+# see dimensionalquantity.reductions
+_get_numeric = operator.attrgetter('_BaseDimQuant__numeric')
+_get_dimensions = operator.attrgetter('_BaseDimQuant__dimensions')
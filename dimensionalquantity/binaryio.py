@@ -0,0 +1,167 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `binaryio.py` defines the compact binary format
+behind `BaseDimQuant.to_bytes()` and `DimQuantArray.to_bytes()`.
+
+Every encoding starts with a header:
+    the magic bytes b'DQ', the format version, and the kind
+    (b'q' for a single quantity, b'a' for an array),
+    followed by the signature of the dimensions:
+    the number of dimensions, the type of the exponents
+    (b'b' for int8, b'd' for float64), the names
+    (each preceded by its length), and the packed exponents.
+A single quantity continues with the type of its numeric
+(b'q' int64, b'd' float64, b'D' complex as two float64) and the packed numeric.
+An array continues with its dtype (as in `numpy.dtype.str`), its shape,
+padding to a multiple of 8 bytes, and the raw numerics in C order,
+which `numpy.frombuffer` decodes without copying.
+A column file (kind b'c', see `dimensionalquantity.mmapio`) is an array
+with the unit of its numerics (preceded by its length as uint16)
+between the signature and the dtype.
+All numbers of the header are little-endian.
+"""
+
+import math
+import struct
+from functools import lru_cache
+
+from . import Dimensional as D
+from .dimensional import _slots
+
+_MAGIC = b'DQ'
+_VERSION = 1
+_prefix = struct.Struct('<2sBc')
+_numeric_formats = {'q': struct.Struct('<q'), 'd': struct.Struct('<d'), 'D': struct.Struct('<dd')}
+_kinds = {b'q': 'a single quantity', b'a': 'an array', b'c': 'a column file'}
+
+# the signatures encoded and decoded are cached in bounded caches
+# (which keep the cached Dimensional instances, see `Dimensional`);
+# as decoded data may be anything, the dimension names not registered yet
+# (each taking a slot for good, see `Dimensional`) that it may introduce are limited, too
+_MAX_ENCODED_SIGNATURES = 1024
+_MAX_DECODED_SIGNATURES = 1024
+_MAX_DECODED_NAMES = 64
+_decoded_names = set()
+
+@lru_cache(maxsize=_MAX_ENCODED_SIGNATURES)
+def _pack_signature(dimensions):
+    names = [name.encode('utf-8') for name in dimensions]
+    exponents = list(dimensions.values())
+    code = 'b' if all(isinstance(value, int) and -128<=value<128 for value in exponents) else 'd'
+    return b''.join([
+        struct.pack('<Bc', len(names), code.encode('ascii')),
+        b''.join(struct.pack('<B', len(name))+name for name in names),
+        struct.pack('<{}{}'.format(len(exponents), code), *exponents)])
+
+def _pack_header(kind, dimensions):
+    return _prefix.pack(_MAGIC, _VERSION, kind)+_pack_signature(dimensions)
+
+def _unpack_header(data, kind):
+    # returns the Dimensional and the offset of what follows the header
+    try:
+        magic, version, found_kind = _prefix.unpack_from(data, 0)
+        if magic!=_MAGIC or version!=_VERSION:
+            raise ValueError('The data isn\'t in the binary format (version {}) of dimensionalquantity.'.format(
+                             _VERSION))
+        if found_kind!=kind:
+            raise ValueError('The data encodes {} instead of {}.'.format(_kinds[found_kind], _kinds[kind]))
+        start = offset = _prefix.size
+        count, code = struct.unpack_from('<Bc', data, offset)
+        offset += 2
+        name_offsets = []
+        for _ in range(count):
+            length = data[offset]
+            name_offsets.append((offset+1, offset+1+length))
+            offset += 1+length
+        exponents_format = '<{}{}'.format(count, code.decode('ascii'))
+        end = offset+struct.calcsize(exponents_format)
+        if end>len(data):
+            raise struct.error('the signature exceeds the data')
+    except (struct.error, KeyError, IndexError, UnicodeDecodeError) as error:
+        raise ValueError('Truncated or corrupted data: {}'.format(error))
+    return _decoded_dimensions(bytes(data[start:end])), end
+
+@lru_cache(maxsize=_MAX_DECODED_SIGNATURES)
+def _decoded_dimensions(signature):
+    # the Dimensional of an encoded signature (see _pack_signature())
+    try:
+        count, code = struct.unpack_from('<Bc', signature, 0)
+        offset = 2
+        names = []
+        for _ in range(count):
+            length = signature[offset]
+            names.append(signature[offset+1:offset+1+length].decode('utf-8'))
+            offset += 1+length
+        exponents = struct.unpack_from('<{}{}'.format(count, code.decode('ascii')), signature, offset)
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise ValueError('Truncated or corrupted data: {}'.format(error))
+    if len(set(names))!=count or not all(name in _slots or name.isidentifier() for name in names):
+        raise ValueError('Corrupted data: invalid dimension names {}.'.format(names))
+    if not all(math.isfinite(exponent) for exponent in exponents):
+        raise ValueError('Corrupted data: invalid exponents {}.'.format(exponents))
+    new_names = set(names)-set(_slots)
+    if len(_decoded_names|new_names)>_MAX_DECODED_NAMES:
+        raise ValueError(' '.join(['The data introduces the dimension(s) {},'.format(', '.join(sorted(new_names))),
+                                   'beyond the {} new dimensions decoded data may introduce;'.format(_MAX_DECODED_NAMES),
+                                   'register them with Dimensional.register_dimension() first.']))
+    _decoded_names.update(new_names)
+    return D(dict(zip(names, exponents)))
+
+def _pack_quantity(numeric, dimensions):
+    # see BaseDimQuant.to_bytes()
+    if isinstance(numeric, complex):
+        code, values = 'D', (numeric.real, numeric.imag)
+    elif isinstance(numeric, int):
+        if not -2**63<=numeric<2**63:
+            raise OverflowError('The numeric {} doesn\'t fit into 64 bits.'.format(numeric))
+        code, values = 'q', (numeric,)
+    else:
+        code, values = 'd', (float(numeric),)
+    return b''.join([_pack_header(b'q', dimensions), code.encode('ascii'),
+                     _numeric_formats[code].pack(*values)])
+
+def _unpack_quantity(data):
+    # see BaseDimQuant.from_bytes(); returns (numeric, Dimensional)
+    dimensions, offset = _unpack_header(data, b'q')
+    try:
+        code = bytes(data[offset:offset+1]).decode('ascii')
+        values = _numeric_formats[code].unpack_from(data, offset+1)
+        end = offset+1+_numeric_formats[code].size
+    except (struct.error, KeyError, UnicodeDecodeError) as error:
+        raise ValueError('Truncated or corrupted data: {}'.format(error))
+    if end!=len(data):
+        raise ValueError('{} bytes of data beyond the encoded quantity.'.format(len(data)-end))
+    return (complex(*values) if code=='D' else values[0]), dimensions
+
+def _pack_array_header(dtype, shape, dimensions, unit=None):
+    # everything of an array but the raw numerics, see DimQuantArray.to_bytes();
+    # with a unit that of a column file
+    parts = [_pack_header(b'a' if unit is None else b'c', dimensions)]
+    if unit is not None:
+        encoded_unit = unit.encode('utf-8')
+        parts.extend([struct.pack('<H', len(encoded_unit)), encoded_unit])
+    parts.extend([struct.pack('<B', len(dtype.str)), dtype.str.encode('ascii'),
+                  struct.pack('<B{}Q'.format(len(shape)), len(shape), *shape)])
+    header = b''.join(parts)
+    return header+b'\0'*(-len(header)%8)
+
+def _unpack_array_header(data, kind=b'a'):
+    # returns (dtype string, shape, Dimensional, unit, offset of the raw numerics),
+    # the unit being None unless kind is b'c'
+    dimensions, offset = _unpack_header(data, kind)
+    unit = None
+    try:
+        if kind==b'c':
+            length, = struct.unpack_from('<H', data, offset)
+            unit = bytes(data[offset+2:offset+2+length]).decode('utf-8')
+            offset += 2+length
+        length, = struct.unpack_from('<B', data, offset)
+        dtype = bytes(data[offset+1:offset+1+length]).decode('ascii')
+        offset += 1+length
+        ndim, = struct.unpack_from('<B', data, offset)
+        shape = struct.unpack_from('<{}Q'.format(ndim), data, offset+1)
+        offset += 1+8*ndim
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ValueError('Truncated or corrupted data: {}'.format(error))
+    return dtype, shape, dimensions, unit, offset+(-offset%8)
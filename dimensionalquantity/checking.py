@@ -0,0 +1,364 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `checking.py` controls whether operations check the dimensions of their operands.
+By default every addition, subtraction, and comparison of two quantities
+checks that both have the same dimensions (see `compatible_with_linear_operation()`
+and `compatible_with_comparison()` in `dimensionalquantity.basedimquant`).
+Code whose dimensions have been verified already (e.g. by tests)
+can skip these checks:
+>>> with unchecked():
+...     hot_loop()
+or check only a sample of the operations, counting the checks run and failed:
+>>> with sampled(every=100) as counts:
+...     serve_requests()
+>>> counts
+SampledChecks(checked=12, failed=0)
+
+A mode applies to the thread running the with-block only, other threads keep checking.
+While any thread is in a mode, the decorated operations of the quantity classes
+are replaced by dispatchers, which look up the mode of the calling thread
+and call the operation without the checks (in place of the wrapper doing them),
+or, when sampling, a variant deciding per call whether to check,
+or the checked operation in threads without a mode;
+the checked operations are installed again once the last mode has ended,
+i.e. outside of the modes the checks cost as much as ever.
+Multiplication, division, and exponentiation propagate the dimensions as always.
+
+Furthermore, the decorator `dimensioned` checks the dimensions
+of the arguments and the result of a function.
+"""
+
+import inspect
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from operator import attrgetter, itemgetter
+from random import random
+
+from . import Dimensional as D
+
+# (class, name, checked operation) of every operation checking dimensions
+_operations = []
+
+# raised by the checks for equal dimensions of the decorated operations
+# (rather than by the operations themselves, e.g. numpy failing to broadcast),
+# as `sampled()` counts the failed checks
+class _DimensionsDiffer(ValueError):
+    pass
+
+class _DimensionsIncomparable(NotImplementedError):
+    pass
+
+# the mode of unchecked(); that of sampled() is the list of its variants of the operations
+_UNCHECKED = 'unchecked'
+
+class _ThreadModes(threading.local):
+    # the modes of a thread: those active, the latest last, and the latest (None without)
+    def __init__(self):
+        self.active = []
+        self.mode = None
+_local = _ThreadModes()
+
+# the dispatchers (once built), installed while any thread is in a mode
+_dispatchers = []
+_active = [0] # number of modes active in all threads
+_active_lock = threading.Lock()
+
+def _with_switchable_checks(cls):
+    # class decorator registering the operations decorated with
+    # compatible_with_linear_operation() or compatible_with_comparison(),
+    # which provide their unchecked variant as attribute `_unchecked`
+    for name, attribute in vars(cls).items():
+        if hasattr(attribute, '_unchecked'):
+            _operations.append((cls, name, attribute))
+    return cls
+
+def _install(operations):
+    for (cls, name, _), operation in zip(_operations, operations):
+        setattr(cls, name, operation)
+
+def _dispatcher(position, checked):
+    # the operation as of the mode of the calling thread;
+    # unchecked, operands of the same type are quantities and go straight to the operation
+    method, unchecked = checked.__wrapped__, checked._unchecked
+    @wraps(checked)
+    def dispatching(self, other):
+        mode = _local.mode
+        if mode is None:
+            return checked(self, other)
+        if mode is _UNCHECKED:
+            if type(other) is type(self):
+                return method(self, other)
+            return unchecked(self, other)
+        return mode[position](self, other)
+    dispatching._checked = checked
+    return dispatching
+
+@contextmanager
+def _installed(mode):
+    # enters the mode in this thread (with-blocks may exit in any order);
+    # the dispatchers are installed while any thread is in a mode
+    _local.active.append(mode)
+    _local.mode = mode
+    with _active_lock:
+        if len(_dispatchers)!=len(_operations):
+            _dispatchers[:] = [_dispatcher(position, checked) for position, (_, _, checked) in enumerate(_operations)]
+        _active[0] += 1
+        if _active[0]==1:
+            _install(_dispatchers)
+    try:
+        yield
+    finally:
+        _local.active.remove(mode)
+        _local.mode = _local.active[-1] if _local.active else None
+        with _active_lock:
+            _active[0] -= 1
+            if _active[0]==0:
+                _install([checked for _, _, checked in _operations])
+
+def unchecked():
+    """Context manager skipping the check for equal dimensions
+    in additions, subtractions, and comparisons of quantities.
+    The result of an operation gets the dimensions of the left operand.
+    Multiplication, division, and exponentiation still propagate the dimensions.
+    Example:
+    >>> with unchecked():
+    ...     DimQuant('1 m')+DimQuant('1 s')
+    DimQuant(2.0, Dimensional({'L': 1}))
+    Operands which aren't quantities are handled as usual, e.g. `DimQuant('1 m')+1` raises a TypeError.
+    The mode applies to the current thread (other threads keep checking)
+    and ends with the with-block; with-blocks can be nested.
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.basedimquant.compatible_with_linear_operation`
+    """
+    return _installed(_UNCHECKED)
+
+class SampledChecks(object):
+    """Counters of the dimension checks run in a `sampled()` mode.
+
+    Attributes:
+        checked (int): number of operations whose dimensions were checked.
+        failed (int): number of those checks that failed,
+            i.e. that raised because of different dimensions.
+    """
+
+    def __init__(self):
+        self.checked = 0
+        self.failed = 0
+
+    def __repr__(self):
+        return 'SampledChecks(checked={}, failed={})'.format(self.checked, self.failed)
+
+def sampled(fraction=None, every=None):
+    """Context manager checking the dimensions of only a sample of
+    the additions, subtractions, and comparisons of quantities;
+    the other operations are unchecked, as with `unchecked()`.
+    A check that fails raises (and is counted) as usual.
+    Example:
+    >>> with sampled(every=100) as counts:
+    ...     serve_requests()
+    >>> counts
+    SampledChecks(checked=12, failed=0)
+
+    Args:
+        fraction (float=None): check each operation with this probability,
+        every (int=None): or check every Nth call of each operation (e.g. of `BaseDimQuant.__add__`),
+            starting with the Nth; exactly one of both has to be given.
+
+    Return:
+        context manager, yielding the `SampledChecks` counting the checks.
+        The mode applies to the current thread (other threads keep checking)
+        and ends with the with-block.
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.checking.unchecked`
+    """
+    if (fraction is None)==(every is None):
+        raise TypeError('sampled() takes either a fraction or every, not both nor neither.')
+    if fraction is not None and not 0<=fraction<=1:
+        raise ValueError('The fraction has to be within [0, 1], not {}.'.format(fraction))
+    if every is not None and (not isinstance(every, int) or every<1):
+        raise ValueError('every has to be a positive integer, not {}.'.format(every))
+    counts = SampledChecks()
+    def variant(checked, unchecked):
+        # the skipped checks cost a countdown (or a random number) and a type comparison:
+        # operands of the same type are quantities and go straight to the operation,
+        # anything else takes the usual way
+        method = checked.__wrapped__
+        def check(self, other):
+            counts.checked += 1
+            try:
+                return checked(self, other)
+            except (_DimensionsDiffer, _DimensionsIncomparable):
+                counts.failed += 1
+                raise
+        if fraction is None:
+            countdown = every
+            @wraps(checked)
+            def sampled_operation(self, other):
+                nonlocal countdown
+                countdown -= 1
+                if countdown:
+                    if type(other) is type(self):
+                        return method(self, other)
+                    return unchecked(self, other)
+                countdown = every
+                return check(self, other)
+        else:
+            @wraps(checked)
+            def sampled_operation(self, other):
+                if random()>=fraction:
+                    if type(other) is type(self):
+                        return method(self, other)
+                    return unchecked(self, other)
+                return check(self, other)
+        sampled_operation._checked = checked
+        return sampled_operation
+    return _counted(_installed([variant(checked, checked._unchecked) for _, _, checked in _operations]), counts)
+
+@contextmanager
+def _counted(installed, counts):
+    with installed:
+        yield counts
+
+class _Missing(object):
+    # type of an argument not passed (i.e. left to its default)
+    pass
+_missing = _Missing()
+
+def dimensioned(function=None, returns=None, **units):
+    """Decorator checking the dimensions of the arguments and the result of a function,
+    declared as unit strings, either as arguments of the decorator
+    or as (string) annotations of the function.
+    Example:
+    >>> @dimensioned(m='kg', v='m/s', returns='J')
+    ... def kinetic_energy(m, v):
+    ...     return 0.5*m*v**2
+    or, equivalently,
+    >>> @dimensioned
+    ... def kinetic_energy(m: 'kg', v: 'm/s') -> 'J':
+    ...     return 0.5*m*v**2
+    >>> kinetic_energy(DimQuant('1 kg'), DimQuant('1 s'))
+    ValueError: kinetic_energy expects argument v in 'm/s', i.e. of dimensions ...
+
+    The unit strings are translated on the first call,
+    by the translator registered to DimQuant.
+    The verdict on the dimensions of the arguments is remembered
+    for each combination of their dimensions,
+    so that a call with a known combination merely looks that up.
+    An empty unit string declares a non-dimensional argument,
+    which may be a plain number, too.
+    Arguments not passed (i.e. left to their defaults) aren't checked.
+
+    Args:
+        function (callable): the function to check.
+        returns (str=None): unit of the result; by default the return annotation, if any.
+        **units (str): unit of the argument of the same name,
+            overriding its annotation.
+
+    Return:
+        the decorated function.
+
+    Raises:
+        TypeError: if a unit is declared for an argument the function doesn't have,
+            or for a variadic argument (*args or **kwargs).
+        ValueError: (when called) if the dimensions of an argument or the result differ from the declared ones.
+        TypeError: (when called) if an argument or the result isn't a quantity
+            but the declared unit isn't non-dimensional.
+    """
+    if function is None:
+        return lambda function: dimensioned(function, returns, **units)
+    parameters = list(inspect.signature(function).parameters.values())
+    names = [parameter.name for parameter in parameters]
+    declared = {name: unit for name, unit in getattr(function, '__annotations__', {}).items()
+                if isinstance(unit, str)}
+    declared.update(units)
+    annotated_return = declared.pop('return', None)
+    returns = annotated_return if returns is None else returns
+    unknown = set(declared)-set(names)
+    if unknown:
+        raise TypeError('{} has no argument(s) {}.'.format(function.__name__, ', '.join(sorted(unknown))))
+    variadic = [parameter.name for parameter in parameters if parameter.name in declared and
+                parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)]
+    if variadic:
+        raise TypeError('{} declares a unit for the variadic argument(s) {}, which can\'t be checked.'.format(
+                        function.__name__, ', '.join(variadic)))
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    # (name, position (or None for keyword-only), unit) of each checked argument
+    checked_arguments = [(parameter.name,
+                          names.index(parameter.name) if parameter.kind in positional else None,
+                          declared[parameter.name])
+                         for parameter in parameters if parameter.name in declared]
+    # fast path: all checked arguments passed positionally, all of them quantities
+    positions = [position for _, position, _ in checked_arguments]
+    if None in positions or not positions:
+        last_position = float('inf')
+    else:
+        last_position = max(positions)
+        picked = itemgetter(*positions) if len(positions)>1 else lambda args: (args[positions[0]],)
+    dimensions_of = attrgetter('dimensions')
+    expected = [] # the translated units, once translated
+    verdicts = {} # signature of the arguments -> None, or the exception to raise
+    return_verdicts = {}
+
+    def translated():
+        # both published at once: threads calling for the first time concurrently
+        # translate the units each, and store the same
+        from . import DimQuant
+        arguments = [DimQuant._T.translate(unit).dimensions for _, _, unit in checked_arguments]
+        result = None if returns is None else DimQuant._T.translate(returns).dimensions
+        expected[:] = [arguments, result]
+        return expected
+
+    @wraps(function)
+    def checked(*args, **kwargs):
+        try:
+            if len(args)<=last_position:
+                raise AttributeError
+            signature = tuple(map(dimensions_of, picked(args)))
+        except AttributeError:
+            # the dimensions of the quantities, the types of anything else
+            signature = tuple([getattr(value, 'dimensions', type(value)) for value in
+                               [args[position] if position is not None and position<len(args)
+                                else kwargs.get(name, _missing)
+                                for name, position, _ in checked_arguments]])
+        try:
+            verdict = verdicts[signature]
+        except KeyError:
+            dimensions, _ = expected or translated()
+            verdict = verdicts[signature] = _verdict(function, signature,
+                                                     [('argument '+name, unit) for name, _, unit in checked_arguments],
+                                                     dimensions)
+        if verdict is not None:
+            raise verdict[0](verdict[1])
+        result = function(*args, **kwargs)
+        if returns is not None:
+            signature = getattr(result, 'dimensions', type(result))
+            try:
+                verdict = return_verdicts[signature]
+            except KeyError:
+                _, dimensions = expected or translated()
+                verdict = return_verdicts[signature] = _verdict(function, (signature,),
+                                                                [('the result', returns)], [dimensions])
+            if verdict is not None:
+                raise verdict[0](verdict[1])
+        return result
+    return checked
+
+def _verdict(function, signature, declared, expected):
+    # None if the signature matches the expected dimensions, otherwise (exception class, message)
+    for found, (what, unit), dimensions in zip(signature, declared, expected):
+        if found is _Missing or found is dimensions: # Dimensional is interned
+            continue
+        if not isinstance(found, (D, type)): # an attribute `dimensions` of something else
+            found = object
+        if not isinstance(found, D):
+            if len(dimensions)==0 and found is not bool and issubclass(found, (int, float, complex)):
+                continue # a plain number where a non-dimensional quantity is expected
+            return TypeError, '{} expects {} in \'{}\', not an instance of {}.'.format(
+                              function.__name__, what, unit, found.__name__)
+        return ValueError, ' '.join(['{} expects {} in \'{}\','.format(function.__name__, what, unit),
+                                     'i.e. of dimensions {}, not {}.'.format(dimensions, found)])
+    return None
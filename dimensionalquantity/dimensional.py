@@ -11,9 +11,45 @@ Hence, the Dimensional of a volume is represented by {'L':3}.
 This representation is simple enough and doesn't need its own class.
 The class Dimensional provides the functionality
 to add, subtract, multiply, etc. instances of Dimensional.
+Instances of Dimensional are immutable and interned (as long as they are in use):
+exponents equal to 0 are dropped,
+so that e.g. {'L':1, 't':0} and {'L':1} result in the very same object.
+Hence, all quantities of the same dimensions share one Dimensional.
+Internally, the exponents are kept in a fixed-width tuple:
+each dimension name is registered to a slot position
+(the SI base dimensions first, any other name when first seen),
+so that adding, subtracting, and scaling are plain vector operations.
 """
 
 from functools import wraps
+from operator import add, sub
+from weakref import WeakValueDictionary
+
+# registry of dimension name -> slot position in Dimensional._vector;
+# the SI base dimensions, as used by the Translator, get the first slots.
+# The registry only ever grows, hence a slot never changes its meaning.
+_slot_names = ['L', 't', 'M', 'T', 'i', 'N', 'J']
+_slots = {name: slot for slot, name in enumerate(_slot_names)}
+
+def _slot(name):
+    try:
+        return _slots[name]
+    except KeyError:
+        _slot_names.append(name)
+        _slots[name] = len(_slot_names)-1
+        return _slots[name]
+
+def _canonical_exponent(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value) # {'L':2.0} and {'L':2} have to be the same object
+    return value
+
+def _strip(vector):
+    # canonical vectors have no trailing 0 entries, e.g. {'L':1} is (1,) not (1, 0, 0)
+    end = len(vector)
+    while end and vector[end-1]==0:
+        end -= 1
+    return vector if end==len(vector) else vector[:end]
 
 # wrapper for Dimensional operations (such as __add__, __sub__) to
 # i.   make code more readable by putting reoccuring stuff here,
@@ -50,14 +86,123 @@ class Dimensional(dict):
     Args:
         Any valid dictionary argument.
         The keys represent the name of the dimension,
-        while the values how often said a certain dimension is referred to."""
+        while the values how often said a certain dimension is referred to.
+
+    Instances are immutable, hashable, and interned:
+    entries with exponent 0 are dropped (integral float exponents become int)
+    and equal dimensions are represented by one and the same object.
+    The dict entries are kept for reading only,
+    arithmetic works on the exponent vector."""
+
+    __slots__ = ('_vector', '_hash', '__weakref__')
+
+    # (class, exponent vector) -> instance;
+    # weak, so that signatures no longer in use (e.g. of q**x for many x) don't pile up,
+    # while every signature in use is one and the same object
+    _interned = WeakValueDictionary()
+    # the signatures used last are kept (and looked up first),
+    # so that intermediate results, e.g. of a*b/c, aren't rebuilt on every evaluation
+    _recent = {}
+    _RECENT_SIZE = 256
+
+    def __new__(cls, *args, **kwargs):
+        if len(args)==1 and not kwargs and type(args[0]) is cls:
+            return args[0] # already canonical and interned
+        if len(args)==1 and not kwargs and isinstance(args[0], dict):
+            mapping = args[0]
+        else:
+            mapping = dict(*args, **kwargs)
+        vector = []
+        for key, value in mapping.items():
+            if value==0: continue
+            slot = _slots.get(key)
+            if slot is None:
+                slot = _slot(key)
+            if slot>=len(vector):
+                vector.extend([0]*(1+slot-len(vector)))
+            vector[slot] = value
+        return cls._from_vector(tuple(vector))
+
+    @classmethod
+    def _from_vector(cls, vector):
+        # vector has to be canonical, i.e. without trailing 0 entries
+        key = (cls, vector)
+        self = Dimensional._recent.get(key)
+        if self is not None:
+            return self
+        self = cls._interned.get(key)
+        if self is None:
+            self = super(Dimensional, cls).__new__(cls)
+            vector = tuple(_canonical_exponent(value) for value in vector)
+            dict.update(self, {_slot_names[slot]: value for slot, value in enumerate(vector) if value!=0})
+            self._vector = vector
+            self._hash = hash(vector)
+            cls._interned[key] = self
+        recent = Dimensional._recent
+        recent[key] = self
+        if len(recent)>Dimensional._RECENT_SIZE:
+            recent.pop(next(iter(recent)), None) # the oldest (unless another thread was first)
+        return self
+
+    def __init__(self, *args, **kwargs):
+        # everything is taken care of in __new__;
+        # dict.__init__ would otherwise (re-)insert the dropped 0 entries
+        pass
+
+    @staticmethod
+    def register_dimension(name):
+        """Registers a dimension name, e.g. 'L' for length, to a slot in the exponent vector.
+        There's no need to call this explicitly:
+        unknown names are registered when they are first used.
+        Registering your own dimensions upfront merely fixes their order.
+
+        Args:
+            name (str): name of the dimension.
+
+        Return:
+            int: the slot position of the dimension."""
+        return _slot(name)
 
     def __getitem__(self, key):
         return super(Dimensional, self).get(key,0)
-    
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Dimensional):
+            return self._vector==other._vector
+        if isinstance(other, dict):
+            return self._vector==Dimensional(other)._vector
+        return NotImplemented
+
+    def __ne__(self, other):
+        if self is other:
+            return False
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return self._hash
+
+    def _immutable(self, *args, **kwargs):
+        """Dimensional instances are shared between quantities, hence they must not change."""
+        raise TypeError('\'{}\' object is immutable.'.format(type(self).__name__))
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = __ior__ = _immutable
+
+    def __reduce__(self):
+        # pickle by name rather than by slot, slots may differ between processes
+        return (self.__class__, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     @compatible_with_operation('+')
     def __add__(self, other):
-        return Dimensional({key:self[key]+other[key] for key in set(self.keys()).union(other.keys())})
+        return Dimensional._from_vector(_strip(tuple(map(add, *_aligned(self._vector, other._vector)))))
 
     @compatible_with_operation('+')
     def __radd__(self, other):
@@ -65,15 +210,15 @@ class Dimensional(dict):
         
     @compatible_with_operation('-')
     def __sub__(self, other):
-        return Dimensional({key:self[key]-other[key] for key in set(self.keys()).union(other.keys())})
+        return Dimensional._from_vector(_strip(tuple(map(sub, *_aligned(self._vector, other._vector)))))
     
     @compatible_with_operation('-')
     def __rsub__(self, other):
-        return Dimensional({key:other[key]-self[key] for key in set(self.keys()).union(other.keys())})
+        return Dimensional._from_vector(_strip(tuple(map(sub, *_aligned(other._vector, self._vector)))))
         
     def __mul__(self, other):
         if isinstance(other, (int, float, complex)):
-            return Dimensional({key:other*value for key, value in self.items()})
+            return Dimensional._from_vector(_strip(tuple([other*value for value in self._vector])))
         else:
             raise TypeError(''.join(['unsupported operand type(s) for /:',
                                      ' \'{}\' and \'{}\''.format(type(self).__name__,
@@ -84,3 +229,12 @@ class Dimensional(dict):
     def __repr__(self):
         """default (because derived from dict): {'a':1, 'b':2, ...}"""
         return 'Dimensional({})'.format(super(Dimensional, self).__repr__())
+
+def _aligned(vector, other):
+    # pad the shorter vector with 0 entries
+    difference = len(vector)-len(other)
+    if difference>0:
+        return vector, other+(0,)*difference
+    if difference<0:
+        return vector+(0,)*(-difference), other
+    return vector, other
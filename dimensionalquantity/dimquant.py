@@ -30,6 +30,8 @@ class DimQuant(BaseDimQuant):
         can be found in
         :py:meth: `dimensionalquantity.Translator`"""
 
+    __slots__ = ()
+
     _T = Translator()
 
     def __init__(self, *args, **kwargs):
@@ -85,3 +87,45 @@ class DimQuant(BaseDimQuant):
             :py:meth: `dimensionalquantity.Translator`
         """
         cls._T = translator
+
+    @classmethod
+    def compile(cls, unit_string):
+        """Translates a unit string once, by means of the registered translator,
+        for creating many DimQuant instances of that unit without parsing it again.
+        >>> kgms2 = DimQuant.compile('kg.m/s2')
+        >>> kgms2(3)
+        DimQuant(3.0, Dimensional({'L': 1, 't': -2, 'M': 1}))
+
+        Args:
+            unit_string (str): String of units, e.g. 'kg.m/s2'.
+
+        Return:
+            CompiledUnit creating DimQuant instances
+            (or a DimQuantArray when called with an ndarray).
+
+        .. seealso::
+            :py:meth: `dimensionalquantity.BasicTranslator.compile`
+        """
+        return cls._T.compile(unit_string, cls)
+
+    @classmethod
+    def from_strings(cls, strings, grouped=False):
+        """Creates many quantities from their string representations at once,
+        by means of the registered translator,
+        translating each distinct unit string only once.
+        >>> DimQuant.from_strings(['1 m', '2 km'])
+        DimQuantArray([1.e+00 2.e+03], Dimensional({'L': 1}))
+
+        Args:
+            strings (iterable of str): quantities like '1 m/s'.
+            grouped (bool=False): whether to group quantities of different dimensions
+                instead of rejecting them.
+
+        Return:
+            DimQuantArray, or, if `grouped`, a dict mapping each Dimensional to a DimQuantArray.
+            Requires NumPy.
+
+        .. seealso::
+            :py:meth: `dimensionalquantity.BasicTranslator.parse_many`
+        """
+        return cls._T.parse_many(strings, grouped)
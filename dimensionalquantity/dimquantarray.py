@@ -0,0 +1,708 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+This file defines the class DimQuantArray.
+Instead of holding many DimQuant instances,
+each with its own numeric and (a reference to) its Dimensional,
+a DimQuantArray holds one NumPy array of numerics
+together with a single Dimensional shared by all elements.
+The rules are the same as for BaseDimQuant,
+but the dimensions are checked once per operation,
+not once per element.
+NumPy functions (ufuncs like numpy.sqrt, and e.g. numpy.sum, numpy.concatenate)
+work on a DimQuantArray directly:
+a table of dimension rules states for each of them
+how the dimensions of the result follow from those of the operands.
+This module requires NumPy.
+"""
+
+from functools import wraps
+
+import numpy as np
+
+from . import Dimensional as D
+from . import BaseDimQuant
+from . import DimQuant
+from .basedimquant import _QuantityContainer, _numeric_comparisons
+from .binaryio import _pack_array_header, _unpack_array_header
+from .checking import _with_switchable_checks, _DimensionsDiffer, _DimensionsIncomparable
+
+def _is_quantity(other):
+    return isinstance(other, (BaseDimQuant, DimQuantArray))
+
+def _numerics_of(other):
+    # the numeric(s) of a quantity operand; plain operands are used as they are
+    if isinstance(other, DimQuantArray):
+        return other.numerics
+    if isinstance(other, BaseDimQuant):
+        return other.numeric
+    return other
+
+def _checked_numerics(values):
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.number):
+        raise TypeError('Numerics aren\'t of a numeric dtype but of \'{}\' instead.'.format(values.dtype))
+    return values
+
+def _updated(ufunc, numerics, other):
+    # ufunc(numerics, other) written into numerics where numpy can
+    # (i.e. numerics is writable, of the result's shape, and of a dtype the result casts to),
+    # otherwise a new array as from the binary operator (e.g. an int array divided);
+    # numpy raises before writing anything
+    try:
+        return ufunc(numerics, other, out=numerics)
+    except (TypeError, ValueError):
+        return _checked_numerics(ufunc(numerics, other))
+
+def _updated_to(dimensions, previous, ufunc, numerics, other):
+    # as _updated(), unless the result changes the dimensions:
+    # then new numerics, which nothing else shares (e.g. a view, or a memory-mapped file)
+    if dimensions is previous: # Dimensional is interned
+        return _updated(ufunc, numerics, other)
+    return _checked_numerics(ufunc(numerics, other))
+
+# like compatible_with_linear_operation() for BaseDimQuant,
+# accepting BaseDimQuant and DimQuantArray operands
+def compatible_with_linear_operation(operation='<undefined>'):
+    def decorate_specified_operation(method):
+        @wraps(method)
+        def decorated(self, other, **kwargs):
+            if not _is_quantity(other):
+                raise TypeError(''.join(['unsupported operand type(s) for {}:'.format(operation),
+                                         ' \'{}\' and \'{}\''.format(type(self).__name__,
+                                                                     type(other).__name__)]))
+            elif self.dimensions is not other.dimensions: # Dimensional is interned
+                raise _DimensionsDiffer(''.join(['Operation {} requires'.format(operation),
+                                          'the two operands to have equal dimensions.']))
+            else:
+                return method(self, other)
+        # variant without the check for equal dimensions, see dimensionalquantity.checking
+        @wraps(method)
+        def unchecked(self, other, **kwargs):
+            if _is_quantity(other):
+                return method(self, other)
+            return decorated(self, other)
+        decorated._unchecked, unchecked._checked = unchecked, decorated
+        return decorated
+    return decorate_specified_operation
+
+# like compatible_with_comparison() for BaseDimQuant, comparing element-wise
+def compatible_with_comparison(comparison_name='<undefined>'):
+    def comparison(compare):
+        numeric_comparison = _numeric_comparisons[comparison_name]
+        @wraps(compare)
+        def decorated(self, other, **kwargs):
+            if not _is_quantity(other):
+                if self.is_non_dimensional():
+                    return numeric_comparison(self.numerics, other)
+                else:
+                    raise TypeError(' '.join(['\'{}\' not supported'.format(comparison_name),
+                                              'between instances of',
+                                              '\'{}\' and \'{}\''.format(type(self).__name__,
+                                                                         type(other).__name__)]))
+            else:
+                if self.dimensions is not other.dimensions: # Dimensional is interned
+                    raise _DimensionsIncomparable(' '.join(['Comparison \'{}\' is not defined'.format(comparison_name),
+                                                        'for dimensional quantities of different dimension!']))
+                else:
+                    return compare(self, other)
+        # variant without the check for equal dimensions, see dimensionalquantity.checking
+        @wraps(compare)
+        def unchecked(self, other, **kwargs):
+            if _is_quantity(other):
+                return compare(self, other)
+            return decorated(self, other)
+        decorated._unchecked, unchecked._checked = unchecked, decorated
+        return decorated
+    return comparison
+
+@_with_switchable_checks
+class DimQuantArray(_QuantityContainer):
+    """Class for working with many dimensional quantities of the same dimensions at once.
+
+    Args:
+        numerics (array_like): either numbers (int, float, complex),
+            in which case they share the `dimensions` argument,
+            or quantities (BaseDimQuant, e.g. DimQuant) which all have the same dimensions,
+            in which case the `dimensions` argument is to be omitted.
+            An ndarray is used as is, i.e. without copying it.
+        dimensions (dict, Dimensional): The dimensions shared by all elements.
+            Without quantities (or dimensions) given, the elements are non-dimensional.
+
+    Example:
+        >>> a = DimQuantArray([DimQuant('1 m'), DimQuant('2 m')])
+        >>> b = DimQuantArray(numpy.array([1., 2.]), Dimensional({'L': 1}))
+        >>> a+b
+        DimQuantArray([2. 4.], Dimensional({'L': 1}))
+        >>> (a*b)[0]
+        DimQuant(1.0, Dimensional({'L': 2}))
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.BaseDimQuant`
+        :py:meth: `dimensionalquantity.DimQuant`"""
+
+    __slots__ = ('__numerics', '__dimensions')
+
+    def __init__(self, numerics=(), dimensions=None):
+        if dimensions is None and not isinstance(numerics, np.ndarray):
+            numerics, dimensions = self._from_quantities(numerics)
+        self.numerics = numerics
+        self.dimensions = D() if dimensions is None else dimensions
+
+    @staticmethod
+    def _from_quantities(quantities):
+        quantities = list(quantities)
+        if not any(isinstance(q, BaseDimQuant) for q in quantities):
+            return quantities, None
+        dimensions = None
+        for position, q in enumerate(quantities):
+            if not isinstance(q, BaseDimQuant):
+                raise TypeError(' '.join(['Cannot mix quantities and \'{}\''.format(type(q).__name__),
+                                          '(at position {}).'.format(position)]))
+            if dimensions is None:
+                dimensions = q.dimensions
+            elif q.dimensions is not dimensions: # Dimensional is interned
+                raise ValueError(' '.join(['All quantities have to have equal dimensions,',
+                                           'but {} at position {}'.format(q.dimensions, position),
+                                           'differs from {}.'.format(dimensions)]))
+        return [q.numeric for q in quantities], dimensions
+
+    @classmethod
+    def _trusted(cls, numerics, dimensions):
+        # fast path like BaseDimQuant._trusted():
+        # numerics has to be a numeric ndarray and dimensions an (interned) Dimensional
+        self = object.__new__(cls)
+        self.__numerics = numerics
+        self.__dimensions = dimensions
+        return self
+
+    @property
+    def numerics(self):
+        """The ndarray (of int, float, complex) representing the amounts of the dimensional quantities."""
+        return self.__numerics
+    @numerics.setter
+    def numerics(self, values):
+        self.__numerics = _checked_numerics(values)
+
+    @property
+    def dimensions(self):
+        """The dimensions (dict, Dimensional) shared by all quantities of the array."""
+        return self.__dimensions
+    @dimensions.setter
+    def dimensions(self, dims):
+        if isinstance(dims, (D, dict)):
+            self.__dimensions = D(dims)
+        else:
+            raise TypeError('Dimensions aren\'t of type \'Dimensional\' but of \'{}\' instead.'.format(type(dims).__name__))
+
+    @property
+    def shape(self):
+        """Shape of the numerics array."""
+        return self.__numerics.shape
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the numerics array (unrelated to the physical dimensions)."""
+        return self.__numerics.ndim
+
+    @property
+    def size(self):
+        """Number of elements of the numerics array."""
+        return self.__numerics.size
+
+    def __len__(self):
+        return len(self.__numerics)
+
+    def __getitem__(self, index):
+        numerics = self.__numerics[index]
+        if isinstance(numerics, np.ndarray):
+            return self._trusted(numerics, self.__dimensions)
+        return DimQuant._trusted(numerics.item(), self.__dimensions)
+
+    def __setitem__(self, index, value):
+        if _is_quantity(value):
+            if value.dimensions is not self.__dimensions:
+                raise ValueError(' '.join(['Cannot assign a quantity of dimensions {}'.format(value.dimensions),
+                                           'to an array of dimensions {}.'.format(self.__dimensions)]))
+        elif not self.is_non_dimensional():
+            raise TypeError(' '.join(['Cannot assign \'{}\''.format(type(value).__name__),
+                                      'to a dimensional array, assign quantities instead.']))
+        self.__numerics[index] = _checked_numerics(_numerics_of(value))
+
+    def __iter__(self):
+        # along the first axis, like an ndarray: quantities of a 1-d array, rows (arrays) else
+        dimensions = self.__dimensions
+        if self.__numerics.ndim>1:
+            for row in self.__numerics:
+                yield self._trusted(row, dimensions)
+            return
+        for numeric in self.__numerics.tolist():
+            yield DimQuant._trusted(numeric, dimensions)
+
+    @compatible_with_linear_operation('+')
+    def __add__(self, other):
+        return self._trusted(self.__numerics+_numerics_of(other), self.__dimensions)
+
+    @compatible_with_linear_operation('+')
+    def __radd__(self, other):
+        return self._trusted(_numerics_of(other)+self.__numerics, self.__dimensions)
+
+    @compatible_with_linear_operation('-')
+    def __sub__(self, other):
+        return self._trusted(self.__numerics-_numerics_of(other), self.__dimensions)
+
+    @compatible_with_linear_operation('-')
+    def __rsub__(self, other):
+        return self._trusted(_numerics_of(other)-self.__numerics, self.__dimensions)
+
+    def __mul__(self, other):
+        if _is_quantity(other):
+            return self._trusted(self.__numerics*_numerics_of(other),
+                                 self.__dimensions+other.dimensions)
+        else:
+            return self._trusted(_checked_numerics(self.__numerics*other),
+                                 self.__dimensions)
+    def __rmul__(self, other):
+        return self*other
+
+    def __truediv__(self, other):
+        if _is_quantity(other):
+            return self._trusted(self.__numerics/_numerics_of(other),
+                                 self.__dimensions-other.dimensions)
+        else:
+            return self._trusted(_checked_numerics(self.__numerics/other),
+                                 self.__dimensions)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, BaseDimQuant):
+            return self._trusted(other.numeric/self.__numerics,
+                                 other.dimensions-self.__dimensions)
+        return self._trusted(_checked_numerics(other/self.__numerics),
+                             -1*self.__dimensions)
+
+    # like for BaseDimQuant, the exponent has to be non-dimensional;
+    # moreover, all elements share one Dimensional,
+    # hence the exponent of a dimensional array has to be a single number
+    def __pow__(self, other):
+        if _is_quantity(other):
+            if not other.is_non_dimensional():
+                raise NotImplementedError(' '.join(['The exponent cannot be a dimensional quantity,',
+                                                    'it has to be a purely numerical value!']))
+            other = _numerics_of(other)
+            if self.is_non_dimensional():
+                return self.__numerics**other
+        if self.is_non_dimensional():
+            return self._trusted(_checked_numerics(self.__numerics**other), self.__dimensions)
+        if np.ndim(other)!=0:
+            raise ValueError(' '.join(['The exponent of a dimensional array has to be a single number,',
+                                       'because all its elements share the same dimensions.']))
+        return self._trusted(_checked_numerics(self.__numerics**other),
+                             self.__dimensions*np.asarray(other).item())
+
+    def __rpow__(self, other):
+        if not self.is_non_dimensional():
+            raise NotImplementedError(' '.join(['The exponent cannot be a dimensional quantity,',
+                                                'it has to be a purely numerical value!']))
+        if _is_quantity(other) and not other.is_non_dimensional():
+            # as for numpy.power: the elements would differ in their dimensions
+            raise ValueError(' '.join(['The exponent of a dimensional array has to be a single number,',
+                                       'because all its elements share the same dimensions.']))
+        return _numerics_of(other)**self.__numerics
+
+    # the in-place operators update the array itself and, where numpy can
+    # and the dimensions stay the same, its numerics,
+    # i.e. (like for an ndarray) every name bound to the array or its numerics (e.g. a view) sees the update,
+    # for a memory-mapped column opened with mode 'r+' also the file;
+    # operations changing the dimensions (e.g. *= DimQuant('2 m')) result in new numerics,
+    # as views, or the file, sharing the numerics would keep the old dimensions;
+    # read-only numerics (e.g. of from_bytes()) are replaced by new ones, too
+    @compatible_with_linear_operation('+=')
+    def __iadd__(self, other):
+        self.__numerics = _updated(np.add, self.__numerics, _numerics_of(other))
+        return self
+
+    @compatible_with_linear_operation('-=')
+    def __isub__(self, other):
+        self.__numerics = _updated(np.subtract, self.__numerics, _numerics_of(other))
+        return self
+
+    def __imul__(self, other):
+        if _is_quantity(other):
+            dimensions = self.__dimensions+other.dimensions
+            self.__numerics = _updated_to(dimensions, self.__dimensions,
+                                          np.multiply, self.__numerics, _numerics_of(other))
+            self.__dimensions = dimensions
+        else:
+            self.__numerics = _updated(np.multiply, self.__numerics, other)
+        return self
+
+    def __itruediv__(self, other):
+        if _is_quantity(other):
+            dimensions = self.__dimensions-other.dimensions
+            self.__numerics = _updated_to(dimensions, self.__dimensions,
+                                          np.true_divide, self.__numerics, _numerics_of(other))
+            self.__dimensions = dimensions
+        else:
+            self.__numerics = _updated(np.true_divide, self.__numerics, other)
+        return self
+
+    def __ipow__(self, other):
+        if _is_quantity(other):
+            if not other.is_non_dimensional() or self.is_non_dimensional():
+                return self**other # raises, or results in a plain ndarray as for __pow__
+            other = _numerics_of(other)
+        if self.is_non_dimensional():
+            self.__numerics = _updated(np.power, self.__numerics, other)
+            return self
+        if np.ndim(other)!=0:
+            raise ValueError(' '.join(['The exponent of a dimensional array has to be a single number,',
+                                       'because all its elements share the same dimensions.']))
+        dimensions = self.__dimensions*np.asarray(other).item()
+        self.__numerics = _updated_to(dimensions, self.__dimensions, np.power, self.__numerics, other)
+        self.__dimensions = dimensions
+        return self
+
+    @compatible_with_comparison('==')
+    def __eq__(self, other):
+        return (self.__numerics == _numerics_of(other))
+
+    @compatible_with_comparison('>')
+    def __gt__(self, other):
+        return (self.__numerics > _numerics_of(other))
+
+    @compatible_with_comparison('>=')
+    def __ge__(self, other):
+        return (self.__numerics >= _numerics_of(other))
+
+    @compatible_with_comparison('<')
+    def __lt__(self, other):
+        return (self.__numerics < _numerics_of(other))
+
+    @compatible_with_comparison('<=')
+    def __le__(self, other):
+        return (self.__numerics <= _numerics_of(other))
+
+    def __ne__(self, other):
+        return np.logical_not(self.__eq__(other))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if ufunc not in _ufunc_rules or method not in ('__call__', 'reduce', 'accumulate'):
+            return NotImplemented
+        rule = _ufunc_rules[ufunc]
+        dimensions = [_dimensions_of(operand) for operand in inputs]
+        if method!='__call__':
+            # reducing along an axis only keeps the dimensions for ufuncs like add, or maximum
+            if rule is not _same_dimensions:
+                return NotImplemented
+            result_dimensions = dimensions[0]
+        elif rule is _power:
+            result_dimensions = _power(ufunc.__name__, dimensions, inputs)
+        else:
+            result_dimensions = rule(ufunc.__name__, dimensions)
+        out = kwargs.get('out')
+        if out is not None:
+            kwargs['out'] = tuple(_unwrapped_out(o, result_dimensions) for o in out)
+        result = getattr(ufunc, method)(*[_numerics_of(operand) for operand in inputs], **kwargs)
+        if out is not None:
+            return out[0] if len(out)==1 else out
+        return _wrapped(result, result_dimensions)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _array_functions:
+            return NotImplemented
+        if not all(issubclass(t, (np.ndarray, DimQuantArray)) for t in types):
+            return NotImplemented
+        return _array_functions[func](*args, **kwargs)
+
+    def is_non_dimensional(self):
+        """Method to test whether the quantities of this array are dimension-free.
+
+        .. seealso:
+            :py:meth: `dimensionalquantity.BaseDimQuant.is_non_dimensional`
+        """
+        return len(self.__dimensions)==0 # Dimensional drops entries that are 0
+
+    def to_bytes(self):
+        """Encodes the array in a compact binary format:
+        a header with the dimensions, dtype and shape,
+        followed by the raw numerics;
+        see `dimensionalquantity.binaryio` for the layout.
+
+        Return:
+            bytes, which `from_bytes()` decodes.
+        """
+        numerics = self.__numerics
+        header = _pack_array_header(numerics.dtype, numerics.shape, self.__dimensions)
+        if not numerics.flags.c_contiguous:
+            numerics = np.ascontiguousarray(numerics)
+        return b''.join([header, memoryview(numerics).cast('B')]) # copies the numerics once
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decodes an array encoded by `to_bytes()`.
+        The numerics aren't copied but are a view into `data`,
+        thus read-only if `data` is (as e.g. bytes are).
+
+        Args:
+            data (bytes-like): the encoded array.
+
+        Return:
+            DimQuantArray
+
+        Raises:
+            ValueError: if the data isn't an encoded array.
+        """
+        dtype, shape, dimensions, _, offset = _unpack_array_header(data)
+        size = 1
+        for length in shape:
+            size *= length
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError as error:
+            raise ValueError('Corrupted data: {}'.format(error))
+        if offset+size*dtype.itemsize!=len(memoryview(data).cast('B')):
+            raise ValueError('The data doesn\'t hold the {} numerics of shape {}.'.format(size, shape))
+        numerics = np.frombuffer(data, dtype=dtype, count=size, offset=offset).reshape(shape)
+        return cls._trusted(_checked_numerics(numerics), dimensions)
+
+    def __repr__(self):
+        """Example:
+        >>> q = DimQuantArray([DimQuant('1 m/s'), DimQuant('2 m/s')])
+        >>> print(repr(q))
+        DimQuantArray([1. 2.], Dimensional({'L': 1, 't': -1}))"""
+        return 'DimQuantArray({}, {})'.format(self.__numerics, self.__dimensions)
+
+    def __str__(self):
+        """Example:
+        >>> q = DimQuantArray([DimQuant('1 m/s'), DimQuant('2 m/s')])
+        >>> str(q)
+        '[1. 2.] m.s-1'
+        The unit string is looked up by the translator registered to DimQuant.
+        .. seealso::
+            :py:meth: `dimensionalquantity.DimQuant.register_translator`
+        """
+        unit_string = DimQuant._T.reverse_unit_lookup(self.__dimensions)
+        return ' '.join([str(self.__numerics), unit_string])
+
+
+# NumPy protocols
+
+def _dimensions_of(operand):
+    # None marks a plain (i.e. not a quantity) operand
+    return operand.dimensions if _is_quantity(operand) else None
+
+def _wrapped(result, dimensions):
+    if dimensions is None:
+        return result # e.g. the boolean result of a comparison
+    if np.ndim(result)==0:
+        return DimQuant._trusted(np.asarray(result).item(), dimensions)
+    return DimQuantArray._trusted(result, dimensions)
+
+def _unwrapped_out(out, dimensions):
+    if isinstance(out, DimQuantArray):
+        if out.dimensions is not dimensions:
+            raise ValueError(' '.join(['Cannot write a result of dimensions {}'.format(dimensions),
+                                       'to an array of dimensions {}.'.format(out.dimensions)]))
+        return out.numerics
+    if dimensions:
+        raise TypeError(' '.join(['Cannot write a result of dimensions {}'.format(dimensions),
+                                  'to \'{}\'.'.format(type(out).__name__)]))
+    return out
+
+# dimension rules:
+# each rule takes the name of the operation and the dimensions of the operands
+# (None for plain operands) and returns the dimensions of the result
+# (None for a plain result)
+
+def _same_dimensions(name, dimensions):
+    # like __add__: all quantities have to be of equal dimensions,
+    # plain numbers are only allowed alongside non-dimensional quantities;
+    # without any quantity (e.g. numpy.where of plain values) the result is plain
+    quantity_dimensions = set(d for d in dimensions if d is not None)
+    if not quantity_dimensions:
+        return None
+    if len(quantity_dimensions)>1:
+        raise ValueError(' '.join(['Operation {} requires'.format(name),
+                                   'the operands to have equal dimensions.']))
+    result = quantity_dimensions.pop()
+    if result and None in dimensions:
+        raise TypeError(' '.join(['Operation {} requires'.format(name),
+                                  'all operands to be quantities of dimensions {}.'.format(result)]))
+    return result
+
+def _compared(name, dimensions):
+    _same_dimensions(name, dimensions)
+    return None
+
+def _same_to_non_dimensional(name, dimensions):
+    _same_dimensions(name, dimensions)
+    return D()
+
+def _first(name, dimensions):
+    return dimensions[0]
+
+def _plain(name, dimensions):
+    return None
+
+def _multiplied(name, dimensions):
+    result = D()
+    for d in dimensions:
+        if d is not None:
+            result += d
+    return result
+
+def _divided(name, dimensions):
+    numerator, denominator = [D() if d is None else d for d in dimensions]
+    return numerator-denominator
+
+def _scaled(factor):
+    def scaled(name, dimensions):
+        return dimensions[0]*factor
+    return scaled
+
+def _non_dimensional(name, dimensions):
+    if any(dimensions):
+        raise TypeError(' '.join(['Operation {} is only defined'.format(name),
+                                  'for non-dimensional quantities.']))
+    return D()
+
+def _power(name, dimensions, inputs):
+    base, exponent = dimensions
+    if exponent:
+        raise NotImplementedError(' '.join(['The exponent cannot be a dimensional quantity,',
+                                            'it has to be a purely numerical value!']))
+    if not base:
+        return D()
+    exponent = _numerics_of(inputs[1])
+    if np.ndim(exponent)!=0:
+        raise ValueError(' '.join(['The exponent of a dimensional array has to be a single number,',
+                                   'because all its elements share the same dimensions.']))
+    return base*np.asarray(exponent).item()
+
+_ufunc_rules = {np.add: _same_dimensions,
+                np.subtract: _same_dimensions,
+                np.maximum: _same_dimensions,
+                np.minimum: _same_dimensions,
+                np.fmax: _same_dimensions,
+                np.fmin: _same_dimensions,
+                np.remainder: _same_dimensions,
+                np.fmod: _same_dimensions,
+                np.hypot: _same_dimensions,
+                np.equal: _compared,
+                np.not_equal: _compared,
+                np.less: _compared,
+                np.less_equal: _compared,
+                np.greater: _compared,
+                np.greater_equal: _compared,
+                np.arctan2: _same_to_non_dimensional,
+                np.negative: _first,
+                np.positive: _first,
+                np.absolute: _first,
+                np.fabs: _first,
+                np.conjugate: _first,
+                np.rint: _first,
+                np.floor: _first,
+                np.ceil: _first,
+                np.trunc: _first,
+                np.copysign: _first,
+                np.isnan: _plain,
+                np.isinf: _plain,
+                np.isfinite: _plain,
+                np.signbit: _plain,
+                np.sign: _plain,
+                np.multiply: _multiplied,
+                np.matmul: _multiplied,
+                np.divide: _divided,
+                np.floor_divide: _divided,
+                np.sqrt: _scaled(1/2),
+                np.cbrt: _scaled(1/3),
+                np.square: _scaled(2),
+                np.reciprocal: _scaled(-1),
+                np.power: _power,
+                np.float_power: _power,
+                }
+for _ufunc in (np.exp, np.exp2, np.expm1, np.log, np.log2, np.log10, np.log1p,
+               np.sin, np.cos, np.tan, np.arcsin, np.arccos, np.arctan,
+               np.sinh, np.cosh, np.tanh, np.arcsinh, np.arccosh, np.arctanh):
+    _ufunc_rules[_ufunc] = _non_dimensional
+
+# implementations of NumPy functions (numpy.sum, numpy.concatenate, ...) for DimQuantArray
+_array_functions = {}
+
+def _implements(*functions):
+    def register(implementation):
+        for function in functions:
+            _array_functions[function] = implementation
+        return implementation
+    return register
+
+def _keeping_dimensions(function, factor=1):
+    # function of a single array whose result has the (scaled) dimensions of said array
+    def implementation(a, *args, **kwargs):
+        return _wrapped(function(_numerics_of(a), *args, **kwargs), _dimensions_of(a)*factor)
+    return implementation
+
+def _dropping_dimensions(function):
+    # function of a single array whose result is plain, e.g. indices
+    def implementation(a, *args, **kwargs):
+        return function(_numerics_of(a), *args, **kwargs)
+    return implementation
+
+for _function in (np.sum, np.nansum, np.mean, np.nanmean, np.median, np.nanmedian,
+                  np.min, np.max, np.amin, np.amax, np.nanmin, np.nanmax, np.ptp,
+                  np.std, np.nanstd, np.percentile, np.quantile,
+                  np.cumsum, np.diff, np.sort, np.round, np.around,
+                  np.copy, np.ravel, np.reshape, np.transpose, np.squeeze,
+                  np.take, np.repeat, np.tile, np.flip, np.roll,
+                  np.atleast_1d, np.atleast_2d, np.real, np.imag):
+    _implements(_function)(_keeping_dimensions(_function))
+for _function in (np.var, np.nanvar):
+    _implements(_function)(_keeping_dimensions(_function, factor=2))
+for _function in (np.argmin, np.argmax, np.argsort, np.nonzero, np.shape, np.ndim, np.size,
+                  np.count_nonzero, np.isreal, np.iscomplex):
+    _implements(_function)(_dropping_dimensions(_function))
+
+def _joining(function):
+    # function of a sequence of arrays, e.g. numpy.concatenate
+    def implementation(arrays, *args, **kwargs):
+        arrays = list(arrays)
+        dimensions = _same_dimensions(function.__name__, [_dimensions_of(a) for a in arrays])
+        return _wrapped(function([_numerics_of(a) for a in arrays], *args, **kwargs), dimensions)
+    return implementation
+
+for _function in (np.concatenate, np.stack, np.vstack, np.hstack, np.column_stack):
+    _implements(_function)(_joining(_function))
+
+@_implements(np.where)
+def _where(condition, *values):
+    if not values:
+        return np.where(_numerics_of(condition))
+    x, y = values
+    dimensions = _same_dimensions('where', [_dimensions_of(x), _dimensions_of(y)])
+    return _wrapped(np.where(_numerics_of(condition), _numerics_of(x), _numerics_of(y)), dimensions)
+
+@_implements(np.clip)
+def _clip(a, a_min=None, a_max=None, **kwargs):
+    # NumPy 2.1 names the bounds min and max, too
+    if a_min is None:
+        a_min = kwargs.pop('min', None)
+    if a_max is None:
+        a_max = kwargs.pop('max', None)
+    dimensions = _same_dimensions('clip', [_dimensions_of(v) for v in (a, a_min, a_max) if v is not None])
+    return _wrapped(np.clip(*[_numerics_of(v) for v in (a, a_min, a_max)], **kwargs), dimensions)
+
+@_implements(np.dot)
+def _dot(a, b, **kwargs):
+    return _wrapped(np.dot(_numerics_of(a), _numerics_of(b), **kwargs),
+                    _multiplied('dot', [_dimensions_of(a), _dimensions_of(b)]))
+
+def _comparing(function):
+    # function comparing two arrays of equal dimensions, e.g. numpy.isclose
+    def implementation(a, b, *args, **kwargs):
+        _same_dimensions(function.__name__, [_dimensions_of(a), _dimensions_of(b)])
+        return function(_numerics_of(a), _numerics_of(b), *args, **kwargs)
+    return implementation
+
+for _function in (np.isclose, np.allclose, np.array_equal):
+    _implements(_function)(_comparing(_function))
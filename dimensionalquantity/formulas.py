@@ -0,0 +1,191 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `formulas.py` provides the decorator `formula`,
+which evaluates a function of quantities on their plain numerics.
+The dimensions of the result are worked out once per signature,
+i.e. per combination of the dimensions of the arguments,
+by calling the function with stand-in quantities ("tracing" it),
+each of another numeric (so that e.g. `(x-x0)/(t-t0)` doesn't divide by zero),
+which also checks that the dimensions of the formula are consistent.
+It is traced twice, with other numerics the second time,
+to detect dimensions depending on the numerics (e.g. of a non-dimensional `n` in `x**n`).
+Every further call with the same signature calls the function with
+the numerics (numbers or NumPy arrays) of the arguments instead,
+and attaches the known dimensions to the result.
+"""
+
+import inspect
+from functools import wraps
+from itertools import count
+
+from . import BaseDimQuant
+from .basedimquant import _QuantityContainer
+from .translator import CacheInfo
+
+try:
+    import numpy as np
+    from .dimquantarray import DimQuantArray
+except ImportError: # DimQuantArray requires numpy
+    DimQuantArray = None
+
+def _stand_in(position):
+    # numeric of the stand-in for the quantity at this position:
+    # distinct, non-zero, and neither integer nor of simple ratios to each other,
+    # such that differences and quotients of the stand-ins don't degenerate
+    return 1.0+(position+1)*0.3183098861837907 # 1/pi
+
+def _traced(argument, position):
+    # stand-in for an argument while tracing: the same kind of quantity with another numeric
+    if isinstance(argument, BaseDimQuant):
+        return type(argument)._trusted(_stand_in(position), argument.dimensions)
+    if DimQuantArray is not None and isinstance(argument, DimQuantArray):
+        return DimQuantArray._trusted(np.full(1, _stand_in(position)), argument.dimensions)
+    return argument
+
+def _key_and_numerics(arguments):
+    # the signature of the arguments (their types and dimensions, flattened), and their numerics
+    key, numerics = [], []
+    for argument in arguments:
+        if isinstance(argument, BaseDimQuant):
+            key += (type(argument), argument.dimensions)
+            numerics.append(argument.numeric)
+        elif isinstance(argument, _QuantityContainer):
+            key += (type(argument), argument.dimensions)
+            numerics.append(argument.numerics)
+        else:
+            key.append(None)
+            numerics.append(argument)
+    return tuple(key), numerics
+
+def _result_dimensions(result):
+    # the dimensions of a traced result, to compare the results of two traces
+    if isinstance(result, (BaseDimQuant, _QuantityContainer)):
+        return result.dimensions
+    if isinstance(result, tuple):
+        return tuple(_result_dimensions(element) for element in result)
+    return None
+
+def _result_wrapper(result):
+    # from the traced result a function attaching its dimensions to the plain result
+    if isinstance(result, BaseDimQuant):
+        cls, dimensions = type(result), result.dimensions
+        return lambda numeric: cls._trusted(numeric, dimensions)
+    if DimQuantArray is not None and isinstance(result, DimQuantArray):
+        dimensions = result.dimensions
+        return lambda numerics: DimQuantArray._trusted(np.asarray(numerics), dimensions)
+    if isinstance(result, tuple):
+        wrappers = [_result_wrapper(element) for element in result]
+        return lambda results: tuple(element if wrap is None else wrap(element)
+                                     for wrap, element in zip(wrappers, results))
+    return None # not a quantity, returned as it is
+
+def _is_quantity(value):
+    return isinstance(value, (BaseDimQuant, _QuantityContainer)) or \
+           (isinstance(value, tuple) and any(_is_quantity(element) for element in value))
+
+def formula(function=None, static=()):
+    """Decorator evaluating a function of quantities on the plain numerics of its arguments.
+    The function is traced once per signature (the dimensions of its arguments)
+    to find the dimensions of its result.
+    Example:
+    >>> @formula
+    ... def kinetic_energy(m, v):
+    ...     return 0.5*m*v**2
+    >>> kinetic_energy(DimQuant('2 kg'), DimQuant('3 m/s'))
+    DimQuant(9.0, Dimensional({'M': 1, 'L': 2, 't': -2}))
+    With DimQuantArray arguments the function is evaluated on their ndarrays.
+
+    The function has to be built of operations
+    whose resulting dimensions don't depend on the numerics,
+    e.g. no branching on the values of quantities,
+    and it must not use quantities other than its arguments
+    (constants like `DimQuant('9.81 m/s2')` are to be passed as arguments).
+    Arguments which aren't quantities, and the arguments named in `static`,
+    are passed as they are;
+    if the dimensions of the result depend on the value of an argument
+    (e.g. an exponent `n` in `x**n`), name it in `static`,
+    which makes its value part of the signature
+    (otherwise a quantity argument is detected while tracing, a plain one isn't).
+
+    Args:
+        function (callable): the formula, taking quantities (and other) arguments
+            and returning a quantity, a tuple of quantities, or anything else
+            (which is returned as the function returns it on the numerics).
+        static (iterable of str=()): names of arguments whose values are part of the signature,
+            whether passed positionally, by keyword, or left to their defaults.
+
+    Return:
+        the decorated function, with the methods `cache_info()` and `cache_clear()`
+        of its cache of signatures.
+
+    Raises:
+        ValueError, NotImplementedError: (when tracing) if the dimensions of the formula are inconsistent,
+            or depend on the value of a quantity argument not named in `static`.
+        TypeError: if the function uses quantities other than its arguments,
+            or has no argument named in `static`.
+    """
+    if function is None:
+        return lambda function: formula(function, static)
+    static = sorted(set(static))
+    signature = inspect.signature(function)
+    unknown = set(static)-set(signature.parameters)
+    if unknown:
+        raise TypeError('{} has no argument(s) {}.'.format(function.__name__, ', '.join(sorted(unknown))))
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    static_positions = {position for position, parameter in enumerate(signature.parameters.values())
+                        if parameter.name in static and parameter.kind in positional}
+    signatures = {}
+    statistics = [0, 0] # hits, misses
+
+    def trace(args, kwargs, first):
+        # the function called with stand-ins for the quantity arguments (but the static ones)
+        positions = count(first)
+        return function(*[argument if position in static_positions else _traced(argument, next(positions))
+                          for position, argument in enumerate(args)],
+                        **{name: value if name in static else _traced(value, next(positions))
+                           for name, value in kwargs.items()})
+
+    @wraps(function)
+    def compiled(*args, **kwargs):
+        key, numerics = _key_and_numerics(args)
+        if kwargs:
+            names = sorted(kwargs)
+            keyword_key, keyword_numerics = _key_and_numerics([kwargs[name] for name in names])
+            key += (tuple(names), keyword_key)
+            keyword_numerics = dict(zip(names, keyword_numerics))
+        else:
+            keyword_numerics = {}
+        if static:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key += tuple([bound.arguments[name] for name in static])
+        try:
+            wrap = signatures[key]
+            statistics[0] += 1
+        except KeyError:
+            statistics[1] += 1
+            traced = trace(args, kwargs, 0)
+            if _result_dimensions(trace(args, kwargs, len(args)+len(kwargs)))!=_result_dimensions(traced):
+                raise ValueError(' '.join(['The dimensions of the result of {}'.format(function.__name__),
+                                           'depend on the value of an argument (e.g. an exponent),',
+                                           'name that argument in static.']))
+            wrap = signatures[key] = _result_wrapper(traced)
+        result = function(*numerics, **keyword_numerics)
+        if _is_quantity(result):
+            raise TypeError(' '.join(['{} returns a quantity when called with plain numerics:'.format(function.__name__),
+                                      'it has to take all quantities as arguments to be a formula.']))
+        return result if wrap is None else wrap(result)
+
+    def cache_info():
+        """Statistics of the cache of signatures, in the same format as `functools.lru_cache`."""
+        return CacheInfo(statistics[0], statistics[1], None, len(signatures))
+
+    def cache_clear():
+        """Empties the cache of signatures and resets its statistics."""
+        signatures.clear()
+        statistics[:] = [0, 0]
+
+    compiled.cache_info = cache_info
+    compiled.cache_clear = cache_clear
+    return compiled
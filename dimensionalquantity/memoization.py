@@ -0,0 +1,130 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `memoization.py` provides the decorator `memoized`,
+a bounded cache of the results of a function of quantities,
+e.g. of an expensive unit-aware computation called repeatedly with the same arguments:
+>>> @memoized(maxsize=1024)
+... def drag(v, area):
+...     return expensive_simulation(v, area)
+>>> drag.cache_info()
+MemoInfo(hits=12, misses=3, evictions=0, maxsize=1024, currsize=3)
+
+As `BaseDimQuant` is hashable, `functools.lru_cache` accepts quantities, too,
+and adds less overhead per call.
+`memoized` however keys a quantity argument by its class, numeric, and dimensions
+rather than by the quantity itself,
+which keeps the cache valid if an argument is changed in place (e.g. by +=) afterwards,
+and tells apart equal quantities of different classes;
+it returns quantity results as new instances, which can be changed in place likewise,
+and counts the evicted results.
+"""
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+from . import BaseDimQuant
+from .basedimquant import _QuantityContainer, _get_numeric, _get_dimensions
+
+MemoInfo = namedtuple('MemoInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+MemoInfo.__doc__ = """Statistics of a `memoized` function: cache hits, misses, and evictions,
+the maximum and the current number of cached results."""
+
+def _key(args, kwargs):
+    # the arguments flattened into a hashable tuple:
+    # (class, numeric, id of the Dimensional) for a quantity, (None, value) for anything else;
+    # Dimensional instances are interned, i.e. their id identifies them as long as they exist
+    # (see _kept()), and is hashed faster than they are
+    key = []
+    for argument in args:
+        if isinstance(argument, BaseDimQuant):
+            key += (type(argument), _get_numeric(argument), id(_get_dimensions(argument)))
+        elif isinstance(argument, _QuantityContainer):
+            raise TypeError('unhashable type: \'{}\''.format(type(argument).__name__))
+        else:
+            key += (None, argument)
+    if kwargs:
+        for name, argument in kwargs.items():
+            key.append(name)
+            key += _key((argument,), None)
+    return tuple(key)
+
+def _kept(args, kwargs):
+    # the Dimensional instances of the quantity arguments, stored along with their result
+    # so that they exist (and their ids aren't reused) as long as their key is cached
+    return [_get_dimensions(argument) for argument in list(args)+list(kwargs.values())
+            if isinstance(argument, BaseDimQuant)]
+
+def _copied(result):
+    # a quantity is returned as a new instance,
+    # so that changing it (e.g. by +=) doesn't change the cached result
+    if isinstance(result, BaseDimQuant):
+        return type(result)._trusted(_get_numeric(result), _get_dimensions(result))
+    return result
+
+def memoized(function=None, maxsize=128):
+    """Decorator caching the results of a function by its arguments,
+    keeping the `maxsize` most recently used results.
+    Example:
+    >>> @memoized(maxsize=1024)
+    ... def drag(v, area):
+    ...     return expensive_simulation(v, area)
+    >>> drag(DimQuant('3 m/s'), DimQuant('2 m2'))
+    computes the result, a second call with the same arguments (even new instances) looks it up.
+    Quantity arguments are keyed by their class, numeric, and dimensions,
+    other arguments by themselves, i.e. they have to be hashable;
+    (as for `functools.lru_cache`) `1` and `1.0` make the same key.
+    A quantity result is returned as a new instance on every call;
+    other results are returned as cached, and must not be changed.
+
+    Args:
+        function (callable): the function to cache the results of.
+        maxsize (int=128): maximum number of cached results,
+            the least recently used is evicted beyond that; None for an unbounded cache.
+
+    Return:
+        the decorated function, with the methods `cache_info()` (returning a `MemoInfo`)
+        and `cache_clear()`.
+
+    Raises:
+        TypeError: (when called) if an argument is unhashable, e.g. a DimQuantArray.
+    """
+    if function is None:
+        return lambda function: memoized(function, maxsize)
+    if maxsize is not None and maxsize<0:
+        raise ValueError('maxsize has to be None or non-negative, not {}.'.format(maxsize))
+    cache = OrderedDict()
+    statistics = [0, 0, 0] # hits, misses, evictions
+
+    @wraps(function)
+    def memoizing(*args, **kwargs):
+        key = _key(args, kwargs)
+        try:
+            result, _ = cache[key]
+        except KeyError:
+            statistics[1] += 1
+            result = function(*args, **kwargs)
+            if maxsize!=0:
+                cache[key] = (_copied(result), _kept(args, kwargs))
+                if maxsize is not None and len(cache)>maxsize:
+                    cache.popitem(last=False)
+                    statistics[2] += 1
+            return result
+        statistics[0] += 1
+        cache.move_to_end(key)
+        if isinstance(result, BaseDimQuant): # as _copied(), inlined for hits
+            return result._trusted(_get_numeric(result), _get_dimensions(result))
+        return result
+
+    def cache_info():
+        """Statistics of the cache, see `MemoInfo`."""
+        return MemoInfo(statistics[0], statistics[1], statistics[2], maxsize, len(cache))
+
+    def cache_clear():
+        """Empties the cache and resets its statistics."""
+        cache.clear()
+        statistics[:] = [0, 0, 0]
+
+    memoizing.cache_info = cache_info
+    memoizing.cache_clear = cache_clear
+    return memoizing
@@ -0,0 +1,146 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `mmapio.py` provides functions to store a column of quantities in a file,
+and to open such a file as a memory-mapped DimQuantArray.
+A column file consists of a small header
+(the Dimensional, the unit of the numerics, their dtype and shape;
+see `dimensionalquantity.binaryio` for the layout)
+followed by the raw numerics.
+Opening a column only reads its header:
+the numerics are a `numpy.memmap`,
+thus slicing and arithmetic only read the pages they need,
+and an operation with mismatching dimensions is rejected
+before any numeric is read.
+This module requires NumPy.
+"""
+
+import mmap
+
+import numpy as np
+
+from . import DimQuant
+from .binaryio import _pack_array_header, _unpack_array_header
+from .dimquantarray import DimQuantArray
+
+def write_column(path, quantities, unit='', translator=None):
+    """Writes a column of quantities to a file which `open_column()` maps into memory.
+    Example:
+    >>> write_column('pressure.dq', DimQuantArray(np.array([1e3, 2e3]), D({'M':1, 'L':-1, 't':-2})))
+    >>> open_column('pressure.dq')
+    DimQuantArray([1000. 2000.], Dimensional({'L': -1, 't': -2, 'M': 1}))
+
+    Args:
+        path (str or path): the file to (over)write.
+        quantities (DimQuantArray or sequence of quantities): the column.
+        unit (str=''): the unit to write the numerics in, e.g. 'kPa';
+            by default the numerics are written as they are (i.e. in base units),
+            which keeps opening the column free of any conversion.
+        translator (BasicTranslator=None): translates the unit,
+            by default the one registered in DimQuant.
+
+    Raises:
+        ValueError: if the unit doesn't match the dimensions of the column.
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.mmapio.open_column`
+    """
+    if not isinstance(quantities, DimQuantArray):
+        quantities = DimQuantArray(list(quantities))
+    numerics = quantities.numerics
+    if unit:
+        translator = DimQuant._T if translator is None else translator
+        _DQ = translator.translate(unit)
+        if _DQ.dimensions is not quantities.dimensions: # Dimensional is interned
+            raise ValueError('Quantities of dimensions {} can\'t be written in unit \'{}\'.'.format(
+                             quantities.dimensions, unit))
+        if _DQ.numeric!=1:
+            numerics = numerics/_DQ.numeric
+    numerics = np.ascontiguousarray(numerics)
+    with open(path, 'wb') as stream:
+        stream.write(_pack_array_header(numerics.dtype, numerics.shape, quantities.dimensions, unit))
+        stream.write(memoryview(numerics).cast('B'))
+
+def read_column_header(path):
+    """Reads only the header of a column file written by `write_column()`.
+
+    Args:
+        path (str or path): the column file.
+
+    Return:
+        (Dimensional, unit, numpy.dtype, shape) of the column.
+
+    Raises:
+        ValueError: if the file isn't a column file.
+    """
+    dtype, shape, dimensions, unit, _ = _read_header(path)
+    return dimensions, unit, dtype, shape
+
+def open_column(path, mode='r', translator=None):
+    """Opens a column file written by `write_column()` as a DimQuantArray,
+    the numerics of which are a `numpy.memmap` of the file.
+    If the column was written in a unit with a conversion factor other than 1 (e.g. 'kPa'),
+    the numerics have to be converted to base units,
+    which reads the whole column into memory,
+    and isn't possible with mode 'r+', as the converted numerics aren't the file's.
+
+    Args:
+        path (str or path): the column file.
+        mode (str='r'): as for `numpy.memmap`:
+            'r' read-only, 'r+' writing through to the file, 'c' copy-on-write.
+        translator (BasicTranslator=None): translates the unit of the column,
+            by default the one registered in DimQuant.
+
+    Return:
+        DimQuantArray
+
+    Raises:
+        ValueError: if the file isn't a column file,
+            or its unit doesn't match its dimensions,
+            if the mode isn't one of the above,
+            or if the column has to be converted but is opened with mode 'r+'.
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.mmapio.read_column_header`
+    """
+    if mode not in ('r', 'r+', 'c'): # e.g. 'w+' would truncate the file
+        raise ValueError('The mode has to be \'r\', \'r+\', or \'c\', not {!r}.'.format(mode))
+    dtype, shape, dimensions, unit, offset = _read_header(path)
+    if 0 in shape: # nothing to map
+        numerics = np.empty(shape, dtype)
+    else:
+        numerics = np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+    if unit:
+        translator = DimQuant._T if translator is None else translator
+        _DQ = translator.translate(unit)
+        if _DQ.dimensions is not dimensions: # Dimensional is interned
+            raise ValueError('The column of dimensions {} claims to be written in unit \'{}\'.'.format(
+                             dimensions, unit))
+        if _DQ.numeric!=1:
+            if mode=='r+':
+                raise ValueError(' '.join(['The column written in unit \'{}\' is converted'.format(unit),
+                                           'to base units in memory, writes wouldn\'t reach the file;',
+                                           'open it with mode \'r\' or \'c\'.']))
+            numerics = numerics*_DQ.numeric
+    return DimQuantArray._trusted(numerics, dimensions)
+
+def _read_header(path):
+    # mapping the file reads only the pages touched while parsing the header
+    with open(path, 'rb') as stream:
+        try:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # an empty file can't be mapped
+            raise ValueError('The file \'{}\' is empty.'.format(path))
+        with mapped:
+            dtype, shape, dimensions, unit, offset = _unpack_array_header(mapped, b'c')
+            try:
+                dtype = np.dtype(dtype)
+            except TypeError as error:
+                raise ValueError('Corrupted data: {}'.format(error))
+            size = 1
+            for length in shape:
+                size *= length
+            if offset+size*dtype.itemsize!=len(mapped):
+                raise ValueError('The file \'{}\' doesn\'t hold the {} numerics of shape {}.'.format(
+                                 path, size, shape))
+    return dtype, shape, dimensions, unit, offset
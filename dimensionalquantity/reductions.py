@@ -0,0 +1,178 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `reductions.py` provides the sum, mean, minimum, and maximum of many quantities,
+given as a list, a generator, or any other iterable, or as a DimQuantArray:
+>>> dq_sum([DimQuant('1 m'), DimQuant('2 km')])
+DimQuant(2001.0, Dimensional({'L': 1}))
+(whereas the builtin `sum()` fails, starting with 0+DimQuant('1 m')).
+Instead of one operation, and one intermediate quantity, per element,
+the dimensions of all quantities are checked at once
+(as Dimensional instances are interned, by identity),
+and then their numerics are reduced by the builtin `sum()`, `min()`, and `max()`,
+or by NumPy for a DimQuantArray.
+Iterables other than lists and tuples are consumed in chunks of some thousand quantities,
+i.e. a generator is reduced without holding all its quantities in memory.
+"""
+
+from itertools import islice
+
+from . import BaseDimQuant
+from . import DimQuant
+from .basedimquant import _QuantityContainer, _get_numeric, _get_dimensions
+
+_CHUNK_SIZE = 4096
+
+def _numerics(name, quantities):
+    # yields (class, Dimensional) of the first quantity (nothing if there are none),
+    # then lists of the numerics of all quantities, checking their dimensions chunk by chunk
+    if isinstance(quantities, (list, tuple)):
+        chunks = [quantities]
+    else:
+        iterator = iter(quantities)
+        chunks = iter(lambda: list(islice(iterator, _CHUNK_SIZE)), [])
+    dimensions = None
+    position = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if dimensions is None:
+            if not isinstance(chunk[0], BaseDimQuant):
+                raise _mismatch(name, chunk, position, None)
+            dimensions = _get_dimensions(chunk[0])
+            yield type(chunk[0]), dimensions
+        try:
+            equal = list(map(_get_dimensions, chunk)).count(dimensions)==len(chunk)
+        except AttributeError: # not a quantity
+            equal = False
+        if not equal:
+            raise _mismatch(name, chunk, position, dimensions)
+        yield list(map(_get_numeric, chunk))
+        position += len(chunk)
+
+def _mismatch(name, chunk, position, dimensions):
+    # the error of the first quantity in the chunk which isn't one, or has other dimensions
+    for offset, q in enumerate(chunk):
+        if not isinstance(q, BaseDimQuant):
+            return TypeError(' '.join(['{}() requires quantities, not \'{}\''.format(name, type(q).__name__),
+                                       '(at position {}).'.format(position+offset)]))
+        if q.dimensions is not dimensions: # Dimensional is interned
+            return ValueError(' '.join(['{}() requires all quantities to have equal dimensions,'.format(name),
+                                        'but {} at position {}'.format(q.dimensions, position+offset),
+                                        'differs from {}.'.format(dimensions)]))
+
+def _reduced(name, quantities, reduce_numerics, reduce_array, empty_array=False):
+    # the reduced quantities, of the class and dimensions of the first one;
+    # None if there are none (unless an empty array is reduced, too)
+    if isinstance(quantities, _QuantityContainer):
+        if quantities.size==0 and not empty_array:
+            return None
+        return DimQuant._trusted(reduce_array(quantities.numerics).item(), quantities.dimensions)
+    chunks = _numerics(name, quantities)
+    first = next(chunks, None)
+    if first is None:
+        return None
+    cls, dimensions = first
+    return cls._trusted(reduce_numerics(chunks), dimensions)
+
+def _mean(chunks):
+    total, count = 0, 0
+    for numerics in chunks:
+        total += sum(numerics)
+        count += len(numerics)
+    return total/count
+
+def dq_sum(quantities, start=None):
+    """Sum of many quantities of equal dimensions.
+    Example:
+    >>> dq_sum(DimQuant('{} m'.format(n)) for n in range(4))
+    DimQuant(6.0, Dimensional({'L': 1}))
+
+    Args:
+        quantities (iterable or DimQuantArray): the quantities to sum up,
+            e.g. a list or a generator.
+        start (BaseDimQuant=None): added to the sum, as for the builtin `sum()`;
+            the result if there are no quantities.
+
+    Return:
+        quantity of the class of the (first) quantities;
+        DimQuant for a DimQuantArray, the numerics of which are summed up by NumPy
+        (see `numpy.sum()` to sum along an axis); an empty array sums up to 0.
+
+    Raises:
+        ValueError: if the quantities (or start) differ in their dimensions,
+            or there are neither quantities nor a start.
+        TypeError: if an element isn't a quantity.
+    """
+    total = _reduced('dq_sum', quantities, lambda chunks: sum(sum(numerics) for numerics in chunks),
+                     lambda numerics: numerics.sum(), empty_array=True)
+    if start is None:
+        if total is None:
+            raise ValueError('dq_sum() of no quantities has no dimensions, pass a start.')
+        return total
+    return start if total is None else start+total
+
+def dq_mean(quantities):
+    """Arithmetic mean of many quantities of equal dimensions.
+    Example:
+    >>> dq_mean([DimQuant('1 m'), DimQuant('2 m')])
+    DimQuant(1.5, Dimensional({'L': 1}))
+
+    Args:
+        quantities (iterable or DimQuantArray): the quantities, e.g. a list or a generator.
+
+    Return:
+        quantity of the class of the (first) quantities, DimQuant for a DimQuantArray.
+
+    Raises:
+        ValueError: if the quantities differ in their dimensions, or there are none.
+        TypeError: if an element isn't a quantity.
+    """
+    mean = _reduced('dq_mean', quantities, _mean, lambda numerics: numerics.mean())
+    if mean is None:
+        raise ValueError('dq_mean() of no quantities.')
+    return mean
+
+def dq_min(quantities):
+    """Minimum of many quantities of equal dimensions.
+    Example:
+    >>> dq_min([DimQuant('1 m'), DimQuant('2 mm')])
+    DimQuant(0.002, Dimensional({'L': 1}))
+
+    Args:
+        quantities (iterable or DimQuantArray): the quantities, e.g. a list or a generator.
+
+    Return:
+        quantity of the class of the (first) quantities, DimQuant for a DimQuantArray.
+
+    Raises:
+        ValueError: if the quantities differ in their dimensions, or there are none.
+        TypeError: if an element isn't a quantity.
+    """
+    minimum = _reduced('dq_min', quantities, lambda chunks: min(min(numerics) for numerics in chunks),
+                       lambda numerics: numerics.min())
+    if minimum is None:
+        raise ValueError('dq_min() of no quantities.')
+    return minimum
+
+def dq_max(quantities):
+    """Maximum of many quantities of equal dimensions.
+    Example:
+    >>> dq_max([DimQuant('1 m'), DimQuant('2 mm')])
+    DimQuant(1.0, Dimensional({'L': 1}))
+
+    Args:
+        quantities (iterable or DimQuantArray): the quantities, e.g. a list or a generator.
+
+    Return:
+        quantity of the class of the (first) quantities, DimQuant for a DimQuantArray.
+
+    Raises:
+        ValueError: if the quantities differ in their dimensions, or there are none.
+        TypeError: if an element isn't a quantity.
+    """
+    maximum = _reduced('dq_max', quantities, lambda chunks: max(max(numerics) for numerics in chunks),
+                       lambda numerics: numerics.max())
+    if maximum is None:
+        raise ValueError('dq_max() of no quantities.')
+    return maximum
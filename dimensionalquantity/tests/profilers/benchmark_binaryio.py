@@ -0,0 +1,63 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares the size and the speed of to_bytes()/from_bytes()
+    with pickle and JSON, for a single quantity and for many quantities.
+    It is run with regular python (and requires numpy):
+    $ python3 benchmark_binaryio.py"""
+
+import json
+import pickle
+import timeit
+
+import numpy as np
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+
+def to_json(q):
+    return json.dumps({'numeric': q.numeric, 'dimensions': dict(q.dimensions)})
+
+def from_json(s):
+    decoded = json.loads(s)
+    return DQ(decoded['numeric'], D(decoded['dimensions']))
+
+def array_to_json(q):
+    return json.dumps({'numerics': q.numerics.tolist(), 'dimensions': dict(q.dimensions)})
+
+def array_from_json(s):
+    decoded = json.loads(s)
+    return DQA(np.array(decoded['numerics']), D(decoded['dimensions']))
+
+def seconds(statement, number, **namespace):
+    return min(timeit.Timer(statement, globals=namespace).repeat(repeat=5, number=number))/number
+
+def compare(label, obj, codecs, number):
+    print(label)
+    print('  {:<10} {:>10} {:>12} {:>12}'.format('format', 'bytes', 'encode [us]', 'decode [us]'))
+    for name, (encode, decode) in codecs.items():
+        encoded = encode(obj)
+        print('  {:<10} {:10d} {:12.2f} {:12.2f}'.format(
+              name, len(encoded),
+              seconds('encode(obj)', number, encode=encode, obj=obj)*1e6,
+              seconds('decode(encoded)', number, decode=decode, encoded=encoded)*1e6))
+
+if __name__=="__main__":
+    force = DQ('1.5 N')
+    compare('single quantity', force,
+            {'to_bytes': (DQ.to_bytes, DQ.from_bytes),
+             'pickle': (pickle.dumps, pickle.loads),
+             'json': (to_json, from_json)},
+            number=20000)
+    bigN = 100000
+    forces = DQA(np.random.random(bigN), force.dimensions)
+    compare('{} quantities'.format(bigN), forces,
+            {'to_bytes': (DQA.to_bytes, DQA.from_bytes),
+             'pickle': (pickle.dumps, pickle.loads),
+             'json': (array_to_json, array_from_json)},
+            number=10)
+    quantity_list = list(forces)
+    compare('{} quantities, pickled as list of DimQuant'.format(bigN), quantity_list,
+            {'pickle': (pickle.dumps, pickle.loads)},
+            number=1)
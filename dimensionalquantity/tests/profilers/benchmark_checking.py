@@ -0,0 +1,54 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script measures additions and comparisons of quantities
+    with the default dimension checks, without them, and with sampled checks,
+    as well as the cost of checking the arguments of a function with @dimensioned.
+    It is run with regular python:
+    $ python3 benchmark_checking.py"""
+
+import timeit
+
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import unchecked, sampled, dimensioned
+
+def per_operation(statement, number=200000):
+    a, b = DQ('1 m'), DQ('2 m')
+    return min(timeit.Timer(statement, globals={'a': a, 'b': b}).repeat(repeat=5, number=number))/number
+
+def compare(label, statement):
+    checked = per_operation(statement)
+    with unchecked():
+        skipped = per_operation(statement)
+    with sampled(every=100):
+        every = per_operation(statement)
+    with sampled(fraction=0.01):
+        fraction = per_operation(statement)
+    print('{:<6} checked: {:6.3f} us   unchecked: {:6.3f} us   every 100th: {:6.3f} us   1%: {:6.3f} us'.format(
+          label, checked*1e6, skipped*1e6, every*1e6, fraction*1e6))
+
+def kinetic_energy(m, v):
+    return 0.5*m*v**2
+
+def kinetic_energy_checked_per_call(m, v):
+    # what @dimensioned saves: translating and comparing on every call
+    if m.dimensions!=DQ._T.translate('kg').dimensions or v.dimensions!=DQ._T.translate('m/s').dimensions:
+        raise ValueError('wrong dimensions')
+    result = 0.5*m*v**2
+    if result.dimensions!=DQ._T.translate('J').dimensions:
+        raise ValueError('wrong dimensions')
+    return result
+
+def per_call(function, number=100000):
+    m, v = DQ('2 kg'), DQ('3 m/s')
+    timer = timeit.Timer('function(m, v)', globals={'function': function, 'm': m, 'v': v})
+    return min(timer.repeat(repeat=5, number=number))/number
+
+if __name__=="__main__":
+    compare('a+b', 'a+b')
+    compare('a-b', 'a-b')
+    compare('a<b', 'a<b')
+    compare('a==b', 'a==b')
+    print('0.5*m*v**2   unchecked: {:6.3f} us   checked per call: {:6.3f} us   @dimensioned: {:6.3f} us'.format(
+          per_call(kinetic_energy)*1e6, per_call(kinetic_energy_checked_per_call)*1e6,
+          per_call(dimensioned(m='kg', v='m/s', returns='J')(kinetic_energy))*1e6))
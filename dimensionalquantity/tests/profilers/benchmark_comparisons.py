@@ -0,0 +1,35 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script measures the throughput of comparisons:
+    of non-dimensional quantities with plain numbers,
+    and of dimensional quantities with each other.
+    It is run with regular python:
+    $ python3 benchmark_comparisons.py"""
+
+import random
+import timeit
+
+from dimensionalquantity import DimQuant as DQ
+
+def throughput(label, statement, number=10, **namespace):
+    seconds = min(timeit.Timer(statement, globals=namespace).repeat(repeat=5, number=number))/number
+    print('{:<36} {:10.0f} comparisons/s'.format(label, len(namespace['quantities'])/seconds))
+
+if __name__=="__main__":
+    bigN = 10000
+    numbers = [random.random() for _ in range(bigN)]
+    ratios = [DQ(n) for n in numbers]
+    lengths = [DQ(n, {'L':1}) for n in numbers]
+    half = DQ(0.5)
+    half_length = DQ(0.5, {'L':1})
+    throughput('non-dimensional < number',
+               '[q for q in quantities if q<0.5]', quantities=ratios)
+    throughput('non-dimensional == number',
+               '[q for q in quantities if q==0.5]', quantities=ratios)
+    throughput('non-dimensional < non-dimensional',
+               '[q for q in quantities if q<half]', quantities=ratios, half=half)
+    throughput('dimensional < dimensional',
+               '[q for q in quantities if q<half]', quantities=lengths, half=half_length)
+    throughput('dimensional == dimensional',
+               '[q for q in quantities if q==half]', quantities=lengths, half=half_length)
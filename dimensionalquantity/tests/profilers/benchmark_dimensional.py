@@ -0,0 +1,46 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares the vector based Dimensional
+    with the plain dict based implementation it replaced.
+    Unlike the line_profiler scripts it is run with regular python:
+    $ python3 benchmark_dimensional.py"""
+
+import timeit
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity.dimensional import compatible_with_operation
+
+class DictDimensional(dict):
+    """The former implementation:
+    every operation walks the union of both key sets."""
+    def __getitem__(self, key):
+        return super(DictDimensional, self).get(key,0)
+    @compatible_with_operation('+')
+    def __add__(self, other):
+        return DictDimensional({key:self[key]+other[key] for key in set(self.keys()).union(other.keys())})
+    @compatible_with_operation('-')
+    def __sub__(self, other):
+        return DictDimensional({key:self[key]-other[key] for key in set(self.keys()).union(other.keys())})
+    def __mul__(self, other):
+        return DictDimensional({key:other*value for key, value in self.items()})
+
+def compare(label, statement, number=100000, **namespace):
+    results = []
+    for implementation in (DictDimensional, D):
+        timer = timeit.Timer(statement, globals=dict(namespace, cls=implementation,
+                                                     a=implementation(namespace['a']),
+                                                     b=implementation(namespace['b'])))
+        results.append(min(timer.repeat(repeat=5, number=number))/number)
+    print('{:<12} dict: {:8.3f} us   vector: {:8.3f} us   speed-up: {:5.1f}x'.format(
+        label, results[0]*1e6, results[1]*1e6, results[0]/results[1]))
+
+if __name__=="__main__":
+    force = {'M':1, 'L':1, 't':-2}
+    velocity = {'L':1, 't':-1}
+    compare('add', 'a+b', a=force, b=velocity)
+    compare('sub', 'a-b', a=force, b=velocity)
+    compare('scale', 'a*2', a=force, b=velocity)
+    compare('eq', 'a==b', a=force, b=velocity)
+    compare('eq (same)', 'a==a', a=force, b=velocity)
+    compare('construct', 'cls(force)', a=force, b=velocity, force=force)
@@ -0,0 +1,31 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares evaluating formulas on quantities
+    with evaluating them decorated with @formula.
+    It is run with regular python:
+    $ python3 benchmark_formulas.py"""
+
+import timeit
+
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import formula
+
+def kinetic_energy(m, v):
+    return 0.5*m*v**2
+
+def projectile_height(v, angle_factor, g, t):
+    return v*angle_factor*t-0.5*g*t**2
+
+def compare(label, function, *args, number=100000):
+    compiled = formula(function)
+    results = []
+    for f in (function, compiled):
+        timer = timeit.Timer('f(*args)', globals={'f': f, 'args': args})
+        results.append(min(timer.repeat(repeat=5, number=number))/number)
+    print('{:<20} plain: {:6.2f} us   @formula: {:6.2f} us   speed-up: {:4.1f}x'.format(
+          label, results[0]*1e6, results[1]*1e6, results[0]/results[1]))
+
+if __name__=="__main__":
+    compare('0.5*m*v**2', kinetic_energy, DQ('2 kg'), DQ('3 m/s'))
+    compare('v*a*t-0.5*g*t**2', projectile_height, DQ('20 m/s'), DQ(0.5, {}), DQ('9.81 m/s2'), DQ('1.5 s'))
@@ -0,0 +1,21 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares creating a column of quantities from strings
+    one DimQuant at a time with DimQuant.from_strings().
+    It is run with regular python (and requires numpy):
+    $ python3 benchmark_parse_many.py"""
+
+import timeit
+
+from dimensionalquantity import DimQuant as DQ
+
+def per_string(label, statement, strings, number=5):
+    seconds = min(timeit.Timer(statement, globals={'DQ': DQ, 'strings': strings}).repeat(repeat=5, number=number))/number
+    print('{:<36} {:8.3f} us/string'.format(label, seconds/len(strings)*1e6))
+
+if __name__=="__main__":
+    bigN = 100000
+    strings = ['{} {}'.format(j, ('m', 'km', 'cm')[j%3]) for j in range(bigN)]
+    per_string('[DQ(s) for s in strings]', '[DQ(s) for s in strings]', strings)
+    per_string('DQ.from_strings(strings)', 'DQ.from_strings(strings)', strings)
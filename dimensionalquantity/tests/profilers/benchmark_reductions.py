@@ -0,0 +1,28 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares summing up quantities by folding them with +
+    with dq_sum(), for a list and for a generator.
+    It is run with regular python:
+    $ python3 benchmark_reductions.py"""
+
+import operator
+import timeit
+from functools import reduce
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import dq_sum
+
+def per_call(statement, quantities, number=20):
+    timer = timeit.Timer(statement, globals={'reduce': reduce, 'add': operator.add, 'dq_sum': dq_sum,
+                                             'quantities': quantities})
+    return min(timer.repeat(repeat=5, number=number))/number
+
+if __name__=="__main__":
+    lengths = [DQ(float(n), D({'L':1})) for n in range(100000)]
+    folded = per_call('reduce(add, quantities)', lengths)
+    summed = per_call('dq_sum(quantities)', lengths)
+    streamed = per_call('dq_sum(q for q in quantities)', lengths)
+    print('{} quantities   fold with +: {:6.2f} ms   dq_sum(list): {:6.2f} ms   dq_sum(generator): {:6.2f} ms'.format(
+          len(lengths), folded*1e3, summed*1e3, streamed*1e3))
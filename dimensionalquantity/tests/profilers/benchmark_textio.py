@@ -0,0 +1,55 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script compares writing a column of quantities as text
+    one str(DimQuant) at a time with textio.write_quantities(),
+    and reading it back with DimQuant(string) and textio.read_quantities().
+    It is run with regular python (and requires numpy):
+    $ python3 benchmark_textio.py"""
+
+import io
+import random
+import timeit
+
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+from dimensionalquantity.textio import read_quantities, write_quantities
+
+def per_quantity(label, statement, number=5, **namespace):
+    seconds = min(timeit.Timer(statement, globals=namespace).repeat(repeat=5, number=number))/number
+    print('{:<48} {:8.3f} us/quantity'.format(label, seconds/len(namespace['quantities'])*1e6))
+
+def write_per_object(quantities):
+    stream = io.StringIO()
+    stream.write('force\n')
+    for q in quantities:
+        stream.write(str(q)+'\n')
+    return stream
+
+def write_bulk(quantities):
+    stream = io.StringIO()
+    write_quantities(stream, {'force': quantities})
+    return stream
+
+def read_per_object(text):
+    return [DQ(line) for line in text.splitlines()[1:]]
+
+def read_bulk(text):
+    return list(read_quantities(io.StringIO(text)))
+
+if __name__=="__main__":
+    bigN = 100000
+    quantities = [DQ(random.random(), {'M':1, 'L':1, 't':-2}) for _ in range(bigN)]
+    array = DQA(quantities)
+    per_quantity('str(q) per quantity', 'write_per_object(quantities)',
+                 quantities=quantities, write_per_object=write_per_object)
+    per_quantity('write_quantities() from a list of quantities', 'write_bulk(quantities)',
+                 quantities=quantities, write_bulk=write_bulk)
+    per_quantity('write_quantities() from a DimQuantArray', 'write_bulk(array)',
+                 quantities=quantities, array=array, write_bulk=write_bulk)
+    per_object_text = write_per_object(quantities).getvalue()
+    bulk_text = write_bulk(array).getvalue()
+    per_quantity('DimQuant(line) per quantity', 'read_per_object(text)',
+                 quantities=quantities, text=per_object_text, read_per_object=read_per_object)
+    per_quantity('read_quantities()', 'read_bulk(text)',
+                 quantities=quantities, text=bulk_text, read_bulk=read_bulk)
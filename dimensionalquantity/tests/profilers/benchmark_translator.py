@@ -0,0 +1,28 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" This script measures how fast unit strings are translated,
+    once by the parser itself (cache disabled),
+    once with the cache of the Translator.
+    It is run with regular python:
+    $ python3 benchmark_translator.py"""
+
+import timeit
+
+from dimensionalquantity import Translator
+
+UNIT_STRINGS = ('m', 'kg', 'm/s2', 'kg.m2/(s3.A)', '(kg.s)-2/((m3/K)-3/A2)')
+
+def per_call(translator, unit_string, number=20000):
+    timer = timeit.Timer('translate(unit_string)',
+                         globals={'translate': translator.translate, 'unit_string': unit_string})
+    return min(timer.repeat(repeat=5, number=number))/number
+
+if __name__=="__main__":
+    uncached = Translator(cache_size=0)
+    cached = Translator()
+    print('{:<26} {:>12} {:>12}'.format('unit string', 'parse [us]', 'cached [us]'))
+    for unit_string in UNIT_STRINGS:
+        print('{:<26} {:12.2f} {:12.2f}'.format(unit_string,
+                                                per_call(uncached, unit_string)*1e6,
+                                                per_call(cached, unit_string)*1e6))
@@ -0,0 +1,193 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import textwrap
+
+import pytest
+
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import Translator
+from dimensionalquantity.analysis import analyze_source, analyze_paths, main, Finding
+
+HEADER = 'from dimensionalquantity import DimQuant as DQ, dimensioned\n'
+
+def findings(source, **kwargs):
+    return analyze_source(HEADER+textwrap.dedent(source), **kwargs)
+
+def lines(source):
+    return [finding.line-1 for finding in findings(source)] # without the header
+
+def test_analyze_literals():
+    assert( lines("""
+        a = DQ('1 m')+DQ('2 km')
+        b = DQ('1 m')+DQ('2 s')
+        c = DQ('1 m')*DQ('2 s')-DQ(3, {'L': 1, 't': 1})
+        d = DQ('1 m')/DQ('2 s')+DQ('1 m')
+        e = DQ('1 m')**2-DQ('1 m2')
+        f = DQ('1 m')**-0.5+DQ('1 m')
+        """)==[3, 5, 7] )
+
+def test_analyze_reports_the_runtime_errors():
+    found = findings("""
+        DQ('1 m')+1
+        DQ('1 m')<DQ('1 s')
+        DQ('1 m')!=2
+        DQ('1 m')**DQ('1 m')
+        DQ('1 furlong')
+        DQ('1m')
+        """)
+    assert( [finding.line for finding in found]==[3, 4, 5, 6, 7, 8] )
+    assert( 'plain number' in found[0].message )
+    assert( '\'<\'' in found[1].message )
+    assert( 'exponent' in found[3].message )
+    assert( 'furlong' in found[4].message )
+    assert( isinstance(found[0], Finding) and found[0].column==1 )
+
+def test_analyze_allowed_mixing_with_numbers():
+    assert( lines("""
+        x = 2*DQ('1 m')/3
+        y = 1/DQ('1 s')+DQ('1 Hz')
+        DQ('1 m')/DQ('1 km')<2
+        DQ(2, {})**2.5
+        z = -x+x
+        """)==[] )
+
+def test_analyze_annotations():
+    assert( lines("""
+        def kinetic_energy(m: 'kg', v: 'm/s') -> 'J':
+            e = 0.5*m*v**2
+            e+m
+            return e/m
+
+        kinetic_energy(DQ('1 g'), DQ('1 km/s'))
+        kinetic_energy(DQ('1 g'), v=DQ('1 km'))
+        x: 'J' = kinetic_energy(DQ('1 g'), DQ('1 km/s'))
+        y: 'm' = kinetic_energy(DQ('1 g'), DQ('1 km/s'))
+        z: 'MyClass' = DQ('1 m')
+        """)==[4, 5, 8, 10] )
+
+def test_analyze_forward_references():
+    assert( lines("""
+        from typing import TypeVar
+        T = TypeVar('T')
+
+        def first(x: 'T') -> 'T':
+            return x+1
+        y: 'T' = first(DQ('1 m'))+1
+        """)==[] ) # 'T' is the type variable, not tesla
+
+def test_analyze_dimensioned():
+    assert( lines("""
+        @dimensioned(m='kg', returns='N')
+        def weight(m):
+            return m*DQ('9.81 m/s2')
+
+        weight(DQ('1 s'))+DQ('1 N')
+        """)==[6] )
+
+def test_analyze_unknown_values_are_not_reported():
+    assert( lines("""
+        import decorators
+
+        @decorators.cached
+        def f(x: 'm') -> 's':
+            return x
+        a = f(DQ('1 m'))+DQ('1 m')
+        b = DQ('1 m')+load()
+        c = DQ('1 m')+obj.attribute+DQ('1 s')
+        d = [x+DQ('1 s') for x in DQ('1 m')]
+        """)==[9] ) # only the sum of the last two terms is known
+
+def test_analyze_control_flow():
+    assert( lines("""
+        def f(condition, n):
+            x = DQ('1 m')
+            y = DQ('1 m') if condition else DQ('1 s')
+            if condition:
+                x = DQ('1 s')
+            x+DQ('1 s') # unknown
+            y+DQ('1 s') # unknown
+            z = DQ('1 m')
+            for _ in range(n):
+                z+DQ('1 m')
+                z = z*z
+            z+DQ('1 m') # unknown after the loop
+            while condition:
+                w = DQ('1 m')
+                w+DQ('1 s')
+        """)==[16] )
+
+def test_analyze_nested_scopes():
+    assert( lines("""
+        x = DQ('1 m')
+        def f(x):
+            return x+DQ('1 s')
+        def g():
+            return x+DQ('1 s')
+        class C(object):
+            x = DQ('1 s')
+            y = x+DQ('1 s')
+        h = lambda x: x+DQ('1 s')
+        """)==[6] )
+
+def test_analyze_globals_rebound_by_calls():
+    assert( lines("""
+        x = DQ('1 m')
+        def f():
+            global x
+            x = DQ('1 s')
+        def g():
+            return x+DQ('1 m') # unknown: x is rebound by f()
+        x+DQ('1 s')
+        f()
+        x+DQ('1 m') # unknown after the call
+        x = DQ('1 m')
+        x+DQ('1 s')
+        """)==[8, 12] )
+
+def test_analyze_names_rebound_after_def():
+    assert( lines("""
+        x = DQ('1 s')
+        def f():
+            return x+DQ('1 m') # unknown: x is rebound before f() is called
+        h = lambda: x+DQ('1 m')
+        x = DQ('1 m')
+        f()
+        y = DQ('1 s')
+        def g():
+            return y+DQ('1 m')
+        for n in range(3):
+            def k():
+                return n+DQ('1 m')
+        """)==[10] )
+
+def test_analyze_translator():
+    translator = Translator()
+    translator.register_unit_LUT({'furlong': DQ('201.168 m')})
+    assert( findings("y = DQ('1 furlong')+DQ('1 m')", translator=translator)==[] )
+
+def test_analyze_syntax_error():
+    with pytest.raises(SyntaxError):
+        analyze_source('x = (')
+
+@pytest.mark.parametrize('processes', (1, 2))
+def test_analyze_paths(tmp_path, processes):
+    (tmp_path/'package').mkdir()
+    (tmp_path/'package'/'good.py').write_text(HEADER+"x = DQ('1 m')+DQ('1 m')\n")
+    (tmp_path/'package'/'bad.py').write_text(HEADER+"x = DQ('1 m')+DQ('1 s')\n")
+    (tmp_path/'package'/'broken.py').write_text(HEADER+"x = (\n")
+    # annotated, without naming the package
+    (tmp_path/'package'/'plain.py').write_text("def f(x: 'm') -> 's':\n    return x\n")
+    (tmp_path/'notes.txt').write_text(HEADER+"x = DQ('1 m')+DQ('1 s')\n")
+    found = analyze_paths([str(tmp_path)], processes=processes)
+    assert( [finding.filename for finding in found]==[str(tmp_path/'package'/name)
+                                                      for name in ('bad.py', 'broken.py', 'plain.py')] )
+    assert( 'parsed' in found[1].message )
+    assert( analyze_paths(tmp_path/'package'/'good.py')==[] )
+
+def test_main(tmp_path, capsys):
+    (tmp_path/'bad.py').write_text(HEADER+"x = DQ('1 m')+DQ('1 s')\n")
+    (tmp_path/'good.py').write_text(HEADER+"x = DQ('1 m')+DQ('1 m')\n")
+    assert( main(['-j', '1', str(tmp_path/'bad.py'), str(tmp_path/'good.py')])==1 )
+    assert( capsys.readouterr().out.startswith('{}:2:5: Operation +'.format(tmp_path/'bad.py')) )
+    assert( main([str(tmp_path/'good.py')])==0 )
@@ -0,0 +1,293 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import dimensionalquantity
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import unchecked, sampled, dimensioned
+
+def test_checked_by_default():
+    with pytest.raises(ValueError):
+        DQ('1 m')+DQ('1 s')
+    with pytest.raises(NotImplementedError):
+        DQ('1 m')<DQ('1 s')
+
+def test_unchecked_skips_dimension_checks():
+    with unchecked():
+        q = DQ('1 m')+DQ('1 s')
+        assert( q.numeric==2 )
+        assert( q.dimensions is D({'L':1}) ) # of the left operand
+        assert( (DQ('3 m')-DQ('1 s')).numeric==2 )
+        assert( DQ('1 m')<DQ('2 s') )
+        assert( DQ('1 m')==DQ('1 s') )
+        q += DQ('1 s') # in place
+        assert( q.numeric==3 )
+    with pytest.raises(ValueError):
+        DQ('1 m')+DQ('1 s')
+    with pytest.raises(ValueError):
+        q += DQ('1 s')
+
+def test_unchecked_propagates_dimensions():
+    with unchecked():
+        assert( (DQ('1 m')*DQ('1 s')).dimensions is D({'L':1, 't':1}) )
+        assert( (DQ('1 m')/DQ('1 s')).dimensions is D({'L':1, 't':-1}) )
+        assert( (DQ('1 m')**2).dimensions is D({'L':2}) )
+        assert( type(DQ('1 m')+DQ('1 m')) is DQ )
+
+def test_unchecked_other_operands_as_usual():
+    with unchecked():
+        with pytest.raises(TypeError):
+            DQ('1 m')+1
+        with pytest.raises(TypeError):
+            DQ('1 m')<1
+        assert( BDQ(1)==1 )
+
+def test_unchecked_nested_and_restored_after_exception():
+    add = BDQ.__add__
+    with pytest.raises(RuntimeError):
+        with unchecked():
+            with unchecked():
+                DQ('1 m')+DQ('1 s')
+            DQ('1 m')+DQ('1 s') # still unchecked
+            raise RuntimeError
+    assert( BDQ.__add__ is add )
+
+def test_unchecked_exits_in_any_order():
+    # e.g. with-blocks of two threads, the first one entered exiting first
+    add = BDQ.__add__
+    first, second = unchecked(), unchecked()
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    DQ('1 m')+DQ('1 s') # still unchecked
+    second.__exit__(None, None, None)
+    with pytest.raises(ValueError):
+        DQ('1 m')+DQ('1 s')
+    assert( BDQ.__add__ is add )
+
+def test_unchecked_in_this_thread_only():
+    import threading
+    results = []
+    def add():
+        try:
+            results.append(DQ('1 m')+DQ('1 s'))
+        except ValueError as error:
+            results.append(error)
+    with unchecked():
+        thread = threading.Thread(target=add)
+        thread.start()
+        thread.join()
+        DQ('1 m')+DQ('1 s')
+        with sampled(every=1) as counts:
+            thread = threading.Thread(target=add)
+            thread.start()
+            thread.join()
+    assert( all(isinstance(result, ValueError) for result in results) and len(results)==2 )
+    assert( counts.checked==0 ) # nor sampled in the other thread
+
+def test_unchecked_keeps_docs():
+    with unchecked():
+        assert( BDQ.__eq__.__doc__==DQ.__eq__.__doc__ )
+        assert( BDQ.__eq__.__doc__ is not None )
+
+def test_unchecked_arrays():
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    lengths, times = DQA(np.array([1., 2.]), D({'L':1})), DQA(np.array([3., 4.]), D({'t':1}))
+    with unchecked():
+        assert( np.array_equal((lengths+times).numerics, [4, 6]) )
+        assert( np.array_equal(lengths<times, [True, True]) )
+    with pytest.raises(ValueError):
+        lengths+times
+
+def test_unchecked_exported():
+    assert( dimensionalquantity.unchecked is dimensionalquantity.checking.unchecked )
+
+def test_sampled_every():
+    a, b, s = DQ('1 m'), DQ('2 m'), DQ('1 s')
+    with sampled(every=3) as counts:
+        for _ in range(10):
+            a+b # checked in calls 3, 6, 9
+        assert( (a+s).dimensions is D({'L':1}) ) # call 10, unchecked
+        with pytest.raises(ValueError):
+            a+s # call 12
+        for _ in range(3):
+            a<b # counted separately per operation
+    assert( (counts.checked, counts.failed)==(5, 1) )
+    with pytest.raises(ValueError):
+        a+s
+
+def test_sampled_fraction():
+    a, b, s = DQ('1 m'), DQ('2 m'), DQ('1 s')
+    with sampled(fraction=0) as counts:
+        for _ in range(100):
+            a+s
+    assert( (counts.checked, counts.failed)==(0, 0) )
+    with sampled(fraction=1) as counts:
+        for _ in range(100):
+            a+b
+        with pytest.raises(NotImplementedError):
+            a<s
+    assert( (counts.checked, counts.failed)==(101, 1) )
+    with sampled(fraction=0.5) as counts:
+        for _ in range(1000):
+            a+b
+    assert( 350<counts.checked<650 )
+
+def test_sampled_counts_only_failed_dimension_checks():
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    a, b = DQA(np.ones(2), D({'L':1})), DQA(np.ones(3), D({'L':1}))
+    with sampled(every=1) as counts:
+        with pytest.raises(ValueError): # can't broadcast, but of equal dimensions
+            a+b
+        with pytest.raises(ValueError):
+            a+DQA(np.ones(2), D({'t':1}))
+    assert( (counts.checked, counts.failed)==(2, 1) )
+
+def test_sampled_other_operands_as_usual():
+    with sampled(every=1000):
+        with pytest.raises(TypeError):
+            DQ('1 m')+1
+        assert( BDQ(1)==1 )
+        assert( (BDQ(1, {'L':1})+DQ('1 m')).numeric==2 ) # different types
+
+@pytest.mark.parametrize('kwargs, error', (
+                         ({}, TypeError),
+                         ({'fraction':0.5, 'every':2}, TypeError),
+                         ({'fraction':1.5}, ValueError),
+                         ({'every':0}, ValueError),
+                         ({'every':2.5}, ValueError),
+                         ))
+def test_sampled_arguments(kwargs, error):
+    with pytest.raises(error):
+        sampled(**kwargs)
+
+def test_sampled_within_unchecked():
+    add = BDQ.__add__
+    with unchecked():
+        with sampled(every=1) as counts:
+            with pytest.raises(ValueError):
+                DQ('1 m')+DQ('1 s')
+        DQ('1 m')+DQ('1 s')
+    assert( counts.checked==1 )
+    assert( BDQ.__add__ is add )
+
+def test_sampled_overlapping_unchecked():
+    # the sampled block exits while the unchecked one, entered later, is active
+    add = BDQ.__add__
+    outer, inner = sampled(every=1), unchecked()
+    counts = outer.__enter__()
+    inner.__enter__()
+    outer.__exit__(None, None, None)
+    DQ('1 m')+DQ('1 s') # unchecked, not sampled
+    inner.__exit__(None, None, None)
+    assert( counts.checked==0 )
+    assert( BDQ.__add__ is add )
+    with pytest.raises(ValueError):
+        DQ('1 m')+DQ('1 s')
+    assert( counts.checked==0 ) # the sampler isn't installed anymore
+
+@dimensioned(m='kg', v='m/s', returns='J')
+def kinetic_energy(m, v):
+    return 0.5*m*v**2
+
+@dimensioned
+def annotated_kinetic_energy(m: 'kg', v: 'm/s', *, factor: '' = 1) -> 'J':
+    return 0.5*m*v**2*factor
+
+@pytest.mark.parametrize('function', (kinetic_energy, annotated_kinetic_energy))
+def test_dimensioned(function):
+    assert( function(DQ('2 kg'), DQ('3 m/s'))==DQ('9 J') )
+    assert( function(DQ('2 g'), v=DQ('3 km/s'))==DQ('9 kJ') )
+    with pytest.raises(ValueError) as error:
+        function(DQ('2 kg'), DQ('3 m'))
+    assert( 'argument v' in str(error.value) )
+    with pytest.raises(TypeError):
+        function(DQ('2 kg'), 3)
+
+def test_dimensioned_keyword_only_and_non_dimensional():
+    f = annotated_kinetic_energy
+    assert( f(DQ('2 kg'), DQ('3 m/s'), factor=2)==DQ('18 J') )
+    assert( f(DQ('2 kg'), DQ('3 m/s'), factor=DQ(2, {}))==DQ('18 J') )
+    with pytest.raises(ValueError):
+        f(DQ('2 kg'), DQ('3 m/s'), factor=DQ('2 m'))
+
+def test_dimensioned_result():
+    @dimensioned(x='m', returns='m2')
+    def wrong_result(x):
+        return x
+    with pytest.raises(ValueError) as error:
+        wrong_result(DQ('1 m'))
+    assert( 'result' in str(error.value) )
+
+def test_dimensioned_returns_overrides_annotation():
+    @dimensioned(returns='m2')
+    def area(x: 'm') -> 'm':
+        return x*x
+    assert( area(DQ('2 m'))==DQ('4 m2') )
+
+def test_dimensioned_caches_verdicts():
+    calls = []
+    @dimensioned(x='m')
+    def f(x):
+        calls.append(x)
+        return x
+    for _ in range(3):
+        f(DQ('1 m'))
+        with pytest.raises(ValueError):
+            f(DQ('1 s'))
+    assert( len(calls)==3 )
+    assert( len(f.__wrapped__.__name__)>0 )
+
+def test_dimensioned_translates_on_first_call():
+    translator = DQ._T
+    try:
+        @dimensioned(x='inch')
+        def f(x):
+            return x
+        from dimensionalquantity import Translator
+        custom = Translator()
+        custom.register_unit_LUT({'inch': DQ('2.54 cm')})
+        DQ.register_translator(custom)
+        assert( f(DQ('1 m'))==DQ('1 m') )
+    finally:
+        DQ.register_translator(translator)
+
+def test_dimensioned_first_calls_in_threads():
+    import threading
+    @dimensioned(x='m', returns='m')
+    def f(x):
+        return x
+    barrier = threading.Barrier(8)
+    errors = []
+    def call():
+        barrier.wait()
+        try:
+            f(DQ('1 m'))
+        except Exception as error:
+            errors.append(error)
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert( errors==[] )
+    assert( f(DQ('1 m'))==DQ('1 m') )
+
+def test_dimensioned_unknown_argument():
+    with pytest.raises(TypeError):
+        @dimensioned(y='m')
+        def f(x):
+            return x
+    with pytest.raises(TypeError):
+        @dimensioned
+        def g(*lengths: 'm'):
+            return lengths
+    with pytest.raises(TypeError):
+        @dimensioned(options='m')
+        def h(**options):
+            return options
@@ -108,3 +108,102 @@ def test_decorator_wrapping():
     assert( q0.__rsub__.__name__ == '__rsub__' )
     assert( q0.__rmul__.__name__ == '__rmul__' )
 
+
+# canonical form, interning, immutability
+
+def test_zero_exponents_dropped():
+    q0 = D({'a':1, 'b':0})
+    assert( dict(q0)=={'a':1} )
+    assert( q0 is D({'a':1}) )
+    assert( D({'a':0}) is D() )
+
+def test_integral_float_exponents():
+    q0 = D({'a':2.0})
+    assert( q0 is D({'a':2}) )
+    assert( isinstance(q0['a'], int) )
+    assert( D({'a':0.5})['a']==0.5 )
+
+def test_interned_results():
+    q0 = D({'a':1})
+    q1 = D({'b':-1})
+    assert( (q0+q1) is (q0+q1) )
+    assert( (q0+q1) is D({'b':-1, 'a':1}) )
+    assert( (q0-q0) is D() )
+
+def test_interned_while_in_use():
+    import gc
+    q0 = D({'a':0.123})
+    vector = q0._vector
+    del q0
+    for n in range(D._RECENT_SIZE+1): # pushes it out of the recently used ones
+        D({'a':1.5+n})
+    gc.collect()
+    assert( (D, vector) not in D._interned ) # no longer in use, not kept
+    q1 = D({'a':0.5})
+    for n in range(D._RECENT_SIZE+1):
+        D({'a':1.5+n})
+    assert( q1 is D({'a':0.5}) ) # in use, still the one instance
+    assert( len(D._interned)<2*D._RECENT_SIZE )
+
+def test_eq_normal_dict():
+    q0 = D({'a':1, 'b':0})
+    assert( q0=={'a':1} )
+    assert( q0=={'a':1, 'c':0} )
+    assert( q0!={'a':2} )
+    assert( q0!=1 )
+
+def test_hashable():
+    q0 = D({'a':1, 'b':0})
+    q1 = D({'a':1})
+    assert( hash(q0)==hash(q1) )
+    assert( len({q0, q1, D({'a':2})})==2 )
+
+@pytest.mark.parametrize('mutate',(
+                         lambda d: d.__setitem__('a', 2),
+                         lambda d: d.__delitem__('a'),
+                         lambda d: d.update({'a':2}),
+                         lambda d: d.pop('a'),
+                         lambda d: d.popitem(),
+                         lambda d: d.setdefault('b', 1),
+                         lambda d: d.clear(),
+                        ))
+def test_immutable(mutate):
+    q0 = D({'a':1})
+    with pytest.raises(TypeError):
+        mutate(q0)
+    assert( q0['a']==1 )
+
+def test_copy_and_pickle():
+    import copy
+    import pickle
+    q0 = D({'a':1, 'b':-2})
+    assert( copy.copy(q0) is q0 )
+    assert( copy.deepcopy(q0) is q0 )
+    assert( pickle.loads(pickle.dumps(q0)) is q0 )
+
+# exponent vector
+
+def test_base_dimension_slots():
+    for slot, name in enumerate(['L', 't', 'M', 'T', 'i', 'N', 'J']):
+        assert( D.register_dimension(name)==slot )
+
+def test_register_dimension():
+    slot = D.register_dimension('test_register_dimension')
+    assert( slot>=7 )
+    assert( D.register_dimension('test_register_dimension')==slot )
+    q0 = D({'test_register_dimension':2})
+    assert( q0['test_register_dimension']==2 )
+    assert( (q0-q0) is D() )
+
+def test_dict_read_api():
+    q0 = D({'t':-1, 'L':1, 'x':0})
+    assert( set(q0.keys())=={'L', 't'} )
+    assert( sorted(q0.values())==[-1, 1] )
+    assert( q0.get('L')==1 and q0['M']==0 )
+    assert( 'L' in q0 and 'x' not in q0 )
+    assert( len(q0)==2 )
+
+def test_mul_to_zero():
+    q0 = D({'a':1, 'b':-2})
+    assert( 0*q0 is D() )
+    assert( (0.5*(2*q0)) is q0 )
@@ -6,7 +6,9 @@ from collections import OrderedDict
 import pytest
 
 from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
 from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import unchecked
 
 def test_DQ_default_init():
     default = DQ()
@@ -37,11 +39,14 @@ def test_dimensions_settings():
     with pytest.raises(TypeError):
         test = DQ(dimensions=[1,2])
 
-def test_dimensions_settings_new_id():
+def test_dimensions_settings_shared_id():
+    # Dimensional is immutable and interned, hence shared instead of copied
     q0 = DQ()
     d0 = D({'a':1})
     q0.dimensions = d0
-    assert( id(q0.dimensions)!=id(d0) )
+    assert( q0.dimensions is d0 )
+    q0.dimensions = {'a':1, 'b':0}
+    assert( q0.dimensions is d0 )
 
 def test_add_wrong_dimensions():
     q0 = DQ(1,{'a':2})
@@ -66,7 +71,7 @@ def test_add_create_new_instances():
 
     assert(id(q0)!=id(q2) and id(q1)!=id(q2))
 
-def test_add_create_new_instance_dimensions():
+def test_add_share_instance_dimensions():
     q0 = DQ(dimensions=D({'a':-1}))
     q1 = DQ(dimensions=D({'a':-1}))
     q2 = q0+q1
@@ -74,8 +79,9 @@ def test_add_create_new_instance_dimensions():
     assert(q0.dimensions == q2.dimensions \
             and q1.dimensions == q2.dimensions)
 
-    assert(id(q0.dimensions)!=id(q2.dimensions) \
-            and id(q1.dimensions)!=id(q2.dimensions))
+    # equal dimensions share one instance
+    assert(q0.dimensions is q2.dimensions \
+            and q1.dimensions is q2.dimensions)
 
 @pytest.mark.parametrize('summand0, summand1, expectation',(
                          (DQ(1, D({'a':1, 'b':0, 'c':0})),
@@ -113,7 +119,7 @@ def test_sub_create_new_instances():
 
     assert(id(q0)!=id(q2) and id(q1)!=id(q2))
 
-def test_sub_create_new_instance_dimensions():
+def test_sub_share_instance_dimensions():
     q0 = DQ(dimensions=D({'a':-1}))
     q1 = DQ(dimensions=D({'a':-1}))
     q2 = q0-q1
@@ -121,8 +127,9 @@ def test_sub_create_new_instance_dimensions():
     assert(q0.dimensions == q2.dimensions \
             and q1.dimensions == q2.dimensions)
 
-    assert(id(q0.dimensions)!=id(q2.dimensions) \
-            and id(q1.dimensions)!=id(q2.dimensions))
+    # equal dimensions share one instance
+    assert(q0.dimensions is q2.dimensions \
+            and q1.dimensions is q2.dimensions)
 
 @pytest.mark.parametrize('minuend, subtrahend, expectation',(
                          (DQ(1, D({'a':1, 'b':0, 'c':0})),
@@ -296,6 +303,57 @@ def test_pow_other_incompat_types(other):
     with pytest.raises(TypeError):
         q1 = q0**other
 
+def test_in_place_operations_update_the_instance():
+    q0 = DQ(2, {'a':1})
+    q1 = q0
+    q0 += DQ(1, {'a':1})
+    assert( q0 is q1 and q0.numeric==3 )
+    q0 -= DQ(1, {'a':1})
+    assert( q0 is q1 and q0.numeric==2 )
+    q0 *= DQ(3, {'b':1})
+    assert( q0 is q1 and q0==DQ(6, {'a':1, 'b':1}) )
+    q0 /= DQ(2, {'a':1})
+    assert( q0 is q1 and q0==DQ(3, {'b':1}) )
+    q0 *= 2
+    q0 /= 3
+    assert( q0 is q1 and q0==DQ(2, {'b':1}) )
+    q0 **= 2
+    assert( q0 is q1 and q0==DQ(4, {'b':2}) )
+    q0 **= DQ(0.5)
+    assert( q0 is q1 and q0==DQ(2, {'b':1}) )
+    q0 *= q0
+    assert( q0 is q1 and q0==DQ(4, {'b':2}) )
+    assert( q0.dimensions is D({'b':2}) )
+
+def test_in_place_operations_wrong_operands():
+    q0 = DQ(2, {'a':1})
+    with pytest.raises(ValueError):
+        q0 += DQ(1, {'b':1})
+    with pytest.raises(TypeError):
+        q0 -= 1
+    with pytest.raises(TypeError):
+        q0 *= 'a'
+    with pytest.raises(NotImplementedError):
+        q0 **= DQ(1, {'a':1})
+    with pytest.raises(TypeError):
+        q0 **= [1]
+    # a failing operation leaves the quantity unchanged
+    assert( q0.numeric==2 and q0.dimensions is D({'a':1}) )
+
+def test_in_place_pow_of_non_dimensional():
+    q0 = DQ(2)
+    q0 **= DQ(3)
+    assert( q0==8 and not isinstance(q0, DQ) ) # as for q0**DQ(3)
+
+def test_hash_consistent_with_eq():
+    assert( hash(DQ(1, {'a':1}))==hash(DQ(1.0, {'a':1})) )
+    assert( hash(DQ(1, {'a':1}))==hash(BDQ(1, {'a':1})) )
+    assert( hash(DQ(2, {'a':0}))==hash(2) ) # DQ(2)==2
+    assert( len({DQ(1, {'a':1}), DQ(1, {'a':1}), DQ(1, {'b':1}), DQ(2, {'a':1})})==3 )
+    assert( {DQ(1, {'a':1}): 'x'}[DQ(1, {'a':1})]=='x' )
+    with unchecked():
+        assert( hash(DQ(1, {'a':1}))==hash(DQ(1.0, {'a':1})) )
+
 def test_non_dimensional():
     q0 = DQ()
     assert( q0.is_non_dimensional() )
@@ -319,3 +377,77 @@ def test_decorator_wrapping_cmp():
     assert( q0.__ge__.__name__ == '__ge__' )
     assert( q0.__lt__.__name__ == '__lt__' )
     assert( q0.__le__.__name__ == '__le__' )
+
+def test_slots():
+    q0 = DQ(1, {'a':1})
+    assert( not hasattr(q0, '__dict__') )
+    with pytest.raises(AttributeError):
+        q0.unknown_attribute = 1
+
+@pytest.mark.parametrize('result',(
+                         DQ(1, {'a':1})+DQ(2, {'a':1}),
+                         DQ(1, {'a':1})-DQ(2, {'a':1}),
+                         DQ(1, {'a':1})*DQ(2, {'b':1}),
+                         DQ(1, {'a':1})*2,
+                         DQ(1, {'a':1})/DQ(2, {'b':1}),
+                         DQ(1, {'a':1})/2,
+                         2/DQ(1, {'a':1}),
+                         DQ(2, {'a':1})**2,
+                        ))
+def test_operation_results_are_valid(result):
+    assert( type(result) is DQ )
+    assert( isinstance(result.dimensions, D) )
+    assert( result.dimensions is D(dict(result.dimensions)) )
+
+def test_pickle():
+    import pickle
+    q0 = DQ(1.5, {'a':1, 'b':-2})
+    q1 = pickle.loads(pickle.dumps(q0))
+    assert( type(q1) is DQ )
+    assert( q1.numeric==q0.numeric )
+    assert( q1.dimensions is q0.dimensions )
+
+@pytest.mark.parametrize('q0', (
+                         DQ(1.5, {'a':1, 'b':-2}),
+                         DQ(-3, {'L':1, 't':-1}),
+                         DQ(2**63-1, {}),
+                         DQ(1+2j, {'M':0.5}),
+                         DQ(1e-300, {'L':300}),
+                         ))
+def test_bytes_round_trip(q0):
+    q1 = DQ.from_bytes(q0.to_bytes())
+    assert( type(q1) is DQ )
+    assert( q1.numeric==q0.numeric )
+    assert( type(q1.numeric) is type(q0.numeric) )
+    assert( q1.dimensions is q0.dimensions )
+
+def test_bytes_compact():
+    import pickle
+    q = DQ(1.5, {'M':1, 'L':1, 't':-2})
+    assert( len(q.to_bytes())<len(pickle.dumps(q))/4 )
+
+def test_bytes_rejects():
+    data = DQ(1.5, {'L':1}).to_bytes()
+    with pytest.raises(OverflowError):
+        DQ(2**63, {}).to_bytes()
+    for corrupted in (data[:-1], data+b'\0', b'XX'+data[2:], data[:5], b''):
+        with pytest.raises(ValueError):
+            DQ.from_bytes(corrupted)
+
+def test_bytes_rejects_dimension_names(monkeypatch):
+    import struct
+    from dimensionalquantity import binaryio
+    def encoded(*names):
+        return b''.join([b'DQ\x01q', struct.pack('<Bc', len(names), b'b'),
+                         b''.join(struct.pack('<B', len(name))+name for name in names),
+                         struct.pack('<{}b'.format(len(names)), *[1]*len(names)), b'd', struct.pack('<d', 1.5)])
+    assert( DQ.from_bytes(encoded(b'L')).dimensions is D({'L':1}) )
+    for names in ((b'L', b'L'), (b'not a name',), (b'',)):
+        with pytest.raises(ValueError):
+            DQ.from_bytes(encoded(*names))
+    monkeypatch.setattr(binaryio, '_MAX_DECODED_NAMES', len(binaryio._decoded_names))
+    with pytest.raises(ValueError) as error:
+        DQ.from_bytes(encoded(b'decoded_dimension'))
+    assert( 'register' in str(error.value) )
+    from dimensionalquantity.dimensional import _slots
+    assert( 'decoded_dimension' not in _slots ) # no slot taken
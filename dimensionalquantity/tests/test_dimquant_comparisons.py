@@ -29,7 +29,7 @@ def test_ne():
     assert(q0 != q1)
     with pytest.raises(TypeError):
         a = (q1!=2)
-    q2 = DQ(3, D({'a':1}))
+    q2 = DQ(3, D({'a':2}))
     with pytest.raises(NotImplementedError):
         a = (q0!=q2)
 
@@ -84,3 +84,12 @@ def test_le():
         a = (q2<=q0)
     q0.dimensions = D({'a':1})
     assert(q2<=q0)
+
+def test_non_dimensional_with_other_types():
+    q0 = DQ(1)
+    assert( not (q0=='1') )
+    assert( q0!=None )
+    assert( q0==1.0 )
+    assert( q0==1+0j )
+    with pytest.raises(TypeError):
+        a = (q0<'1')
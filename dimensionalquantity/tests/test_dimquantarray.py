@@ -0,0 +1,295 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+
+# construction
+
+def test_init_from_quantities():
+    q = DQA([DQ('1 m'), DQ('2 m'), BDQ(3, {'L':1})])
+    assert( q.dimensions is D({'L':1}) )
+    assert( np.array_equal(q.numerics, [1, 2, 3]) )
+
+def test_init_from_ndarray_and_dimensional():
+    numerics = np.array([1., 2.])
+    q = DQA(numerics, D({'L':1}))
+    assert( q.dimensions is D({'L':1}) )
+    assert( q.numerics is numerics ) # no copy
+
+def test_init_defaults_to_non_dimensional():
+    assert( DQA().is_non_dimensional() )
+    assert( DQA([1, 2]).is_non_dimensional() )
+    assert( DQA(np.array([1, 2])).is_non_dimensional() )
+
+def test_init_mixed_dimensions_reports_position():
+    with pytest.raises(ValueError) as error:
+        q = DQA([DQ('1 m'), DQ('2 m'), DQ('3 s')])
+    assert( 'position 2' in str(error.value) )
+    with pytest.raises(TypeError):
+        q = DQA([DQ('1 m'), 2])
+
+@pytest.mark.parametrize('numerics',(
+                         np.array(['1', '2']),
+                         np.array([True, False]),
+                         [{'a':1}],
+                        ))
+def test_init_wrong_numerics(numerics):
+    with pytest.raises(TypeError):
+        q = DQA(numerics, D({'L':1}))
+
+def test_init_wrong_dimensions():
+    with pytest.raises(TypeError):
+        q = DQA(np.array([1.]), 1)
+
+# element access
+
+def test_getitem():
+    q = DQA(np.array([1., 2., 3.]), D({'L':1}))
+    q0 = q[0]
+    assert( type(q0) is DQ )
+    assert( type(q0.numeric) is float )
+    assert( q0.dimensions is q.dimensions )
+    q1 = q[1:]
+    assert( isinstance(q1, DQA) )
+    assert( np.array_equal(q1.numerics, [2., 3.]) )
+
+def test_iter_and_len():
+    q = DQA(np.array([1, 2, 3]), D({'L':1}))
+    assert( len(q)==3 )
+    assert( [e.numeric for e in q]==[1, 2, 3] )
+    assert( all(type(e) is DQ for e in q) )
+    rows = list(DQA(np.array([[1., 2.], [3., 4.]]), D({'L':1})))
+    assert( len(rows)==2 and all(type(row) is DQA for row in rows) )
+    assert( rows[1].dimensions is D({'L':1}) and np.array_equal(rows[1].numerics, [3., 4.]) )
+
+def test_setitem():
+    q = DQA(np.array([1., 2.]), D({'L':1}))
+    q[0] = DQ('5 m')
+    assert( q[0]==DQ('5 m') )
+    with pytest.raises(ValueError):
+        q[0] = DQ('5 s')
+    with pytest.raises(TypeError):
+        q[0] = 5
+    q_ = DQA(np.array([1., 2.]))
+    q_[0] = 5
+    assert( q_[0]==5 )
+
+# arithmetic
+
+@pytest.fixture(scope="function")
+def lengths():
+    yield DQA(np.array([1., 2., 4.]), D({'L':1}))
+
+def test_add_sub(lengths):
+    assert( np.array_equal((lengths+lengths).numerics, [2., 4., 8.]) )
+    assert( np.array_equal((lengths-lengths).numerics, [0., 0., 0.]) )
+    assert( np.array_equal((lengths+DQ('1 m')).numerics, [2., 3., 5.]) )
+    assert( np.array_equal((DQ('1 m')+lengths).numerics, [2., 3., 5.]) )
+    assert( np.array_equal((DQ('1 m')-lengths).numerics, [0., -1., -3.]) )
+    assert( (DQ('1 m')-lengths).dimensions is lengths.dimensions )
+
+def test_add_sub_wrong(lengths):
+    with pytest.raises(ValueError):
+        q = lengths+DQ('1 s')
+    with pytest.raises(ValueError):
+        q = DQ('1 s')-lengths
+    with pytest.raises(TypeError):
+        q = lengths+1
+    with pytest.raises(TypeError):
+        q = 1-lengths
+
+def test_mul_div(lengths):
+    area = lengths*lengths
+    assert( area.dimensions is D({'L':2}) )
+    assert( np.array_equal(area.numerics, [1., 4., 16.]) )
+    speed = lengths/DQ('2 s')
+    assert( speed.dimensions is D({'L':1, 't':-1}) )
+    assert( np.array_equal(speed.numerics, [0.5, 1., 2.]) )
+    frequency = DQ('2 s')/lengths
+    assert( frequency.dimensions is D({'L':-1, 't':1}) )
+    inverse = 4/lengths
+    assert( inverse.dimensions is D({'L':-1}) )
+    assert( np.array_equal(inverse.numerics, [4., 2., 1.]) )
+    assert( (2*lengths).dimensions is lengths.dimensions )
+    assert( (np.array([1, 2, 3])*lengths).dimensions is lengths.dimensions )
+    assert( isinstance(DQ('2 s')*lengths, DQA) )
+    assert( (lengths/lengths).is_non_dimensional() )
+
+def test_mul_incompat_types(lengths):
+    with pytest.raises(TypeError):
+        q = lengths*{'a':1}
+    with pytest.raises(TypeError):
+        q = lengths*'a'
+
+def test_pow(lengths):
+    volume = lengths**3
+    assert( volume.dimensions is D({'L':3}) )
+    assert( np.array_equal(volume.numerics, [1., 8., 64.]) )
+    assert( (lengths**DQ(2)).dimensions is D({'L':2}) )
+    with pytest.raises(NotImplementedError):
+        q = lengths**DQ('1 m')
+    with pytest.raises(ValueError):
+        q = lengths**np.array([1, 2, 3])
+    ratios = lengths/DQ('1 m')
+    assert( np.array_equal(ratios**np.array([1, 2, 3]), [1., 4., 64.]) )
+    assert( np.array_equal(2**ratios, [2., 4., 16.]) )
+    with pytest.raises(NotImplementedError):
+        q = 2**lengths
+    with pytest.raises(ValueError): # as np.power(DQ('2 m'), ratios)
+        q = DQ('2 m')**ratios
+    assert( np.array_equal(DQ(2)**ratios, [2., 4., 16.]) )
+
+def test_in_place_operations(lengths):
+    numerics, same = lengths.numerics, lengths
+    lengths += DQ('1 m')
+    lengths -= DQA(np.array([1., 1., 1.]), D({'L':1}))
+    lengths *= 2
+    lengths /= DQ(2)
+    assert( lengths is same and lengths.numerics is numerics ) # written into the numerics
+    lengths *= lengths
+    lengths /= DQ('2 s')
+    assert( lengths is same and lengths.numerics is not numerics ) # new numerics, of new dimensions
+    assert( np.array_equal(numerics, [1., 2., 4.]) )
+    assert( np.array_equal(lengths.numerics, [0.5, 2., 8.]) )
+    assert( lengths.dimensions is D({'L':2, 't':-1}) )
+    lengths **= 2
+    assert( lengths.dimensions is D({'L':4, 't':-2}) )
+    with pytest.raises(ValueError):
+        lengths += DQ('1 m')
+    with pytest.raises(TypeError):
+        lengths *= 'a'
+    with pytest.raises(ValueError):
+        lengths **= np.array([1, 2, 3])
+    assert( np.array_equal(lengths.numerics, [0.25, 4., 64.]) )
+
+def test_in_place_operations_keep_views_consistent(lengths):
+    view = lengths[0:2]
+    lengths *= DQ('2 m')
+    assert( view.dimensions is D({'L':1}) and np.array_equal(view.numerics, [1., 2.]) )
+    assert( lengths.dimensions is D({'L':2}) and np.array_equal(lengths.numerics, [2., 4., 8.]) )
+    lengths += DQ('1 m2')
+    assert( np.array_equal(lengths.numerics, [3., 5., 9.]) )
+
+def test_in_place_operations_without_numpy_in_place():
+    # numerics which can't hold the result are replaced by new ones
+    counts = DQA(np.array([1, 2, 4]), D({'L':1}))
+    numerics = counts.numerics
+    counts /= 2
+    assert( np.array_equal(counts.numerics, [0.5, 1., 2.]) and np.array_equal(numerics, [1, 2, 4]) )
+    frozen = DQA.from_bytes(DQA(np.array([1., 2.]), D({'L':1})).to_bytes())
+    frozen += DQ('1 m')
+    assert( np.array_equal(frozen.numerics, [2., 3.]) )
+    broadcast = DQA(np.array([1., 2.]), D({'L':1}))
+    broadcast += DQA(np.array([[1.], [2.]]), D({'L':1}))
+    assert( broadcast.shape==(2, 2) )
+
+def test_in_place_operations_of_scalars(lengths):
+    q = DQ('1 m')
+    q += lengths # a new array, as for q+lengths
+    assert( isinstance(q, DQA) and np.array_equal(q.numerics, [2., 3., 5.]) )
+    ratios = lengths/DQ('1 m')
+    ratios **= DQ(2)
+    assert( isinstance(ratios, np.ndarray) ) # as for ratios**DQ(2)
+
+# comparisons
+
+def test_comparisons(lengths):
+    assert( np.array_equal(lengths>DQ('1.5 m'), [False, True, True]) )
+    assert( np.array_equal(lengths<=DQ('2 m'), [True, True, False]) )
+    assert( np.array_equal(DQ('2 m')<lengths, [False, False, True]) )
+    assert( np.array_equal(lengths==lengths, [True, True, True]) )
+    assert( np.array_equal(lengths!=DQ('2 m'), [True, False, True]) )
+    with pytest.raises(NotImplementedError):
+        a = (lengths>DQ('1 s'))
+    with pytest.raises(TypeError):
+        a = (lengths>1)
+
+def test_comparisons_non_dimensional(lengths):
+    ratios = lengths/DQ('2 m')
+    assert( np.array_equal(ratios>=1, [False, True, True]) )
+    assert( np.array_equal(ratios==0.5, [True, False, False]) )
+
+# output
+
+def test_repr_and_str(lengths):
+    assert( repr(lengths)=='DimQuantArray([1. 2. 4.], Dimensional({\'L\': 1}))' )
+    assert( str(lengths)=='[1. 2. 4.] m' )
+
+# bulk parsing of strings
+
+def test_from_strings():
+    q = DQ.from_strings(['1 m', '2 km', '3 cm', '4 m'])
+    assert( isinstance(q, DQA) )
+    assert( q.dimensions is D({'L':1}) )
+    assert( np.allclose(q.numerics, [1, 2e3, 3e-2, 4]) )
+
+def test_from_strings_matches_single_strings():
+    strings = ['{} {}'.format(n, unit) for n in (0.5, 1, -2e3) for unit in ('kg.m/s2', 'N', 'mN')]
+    q = DQ.from_strings(strings)
+    assert( all(q[i]==DQ(string) for i, string in enumerate(strings)) )
+
+def test_from_strings_empty():
+    q = DQ.from_strings([])
+    assert( len(q)==0 )
+    assert( q.is_non_dimensional() )
+    assert( DQ.from_strings([], grouped=True)=={} )
+
+def test_from_strings_grouped():
+    groups = DQ.from_strings(['1 m', '2 s', '3 km', '4 ms', '5 cm'], grouped=True)
+    assert( set(groups)=={D({'L':1}), D({'t':1})} )
+    assert( np.allclose(groups[D({'L':1})].numerics, [1, 3e3, 5e-2]) )
+    assert( np.allclose(groups[D({'t':1})].numerics, [2, 4e-3]) )
+
+def test_from_strings_translates_each_unit_once():
+    translator = DQ._T
+    translator.cache_clear()
+    DQ.from_strings(['{} km'.format(n) for n in range(100)]+['{} s'.format(n) for n in range(100)],
+                    grouped=True)
+    assert( translator.cache_info().misses+translator.cache_info().hits==2 )
+
+@pytest.mark.parametrize('strings, position', (
+                         (['1 m', '2 m', '3 s'], 2),
+                         (['1 m', '2 s', '3 km', '4 s'], 1),
+                         (['1 m', '2m'], 1),
+                         (['1 m', 'x m'], 1),
+                         (['1 m', '2 m', '3 qq'], 2),
+                         ))
+def test_from_strings_reports_position(strings, position):
+    with pytest.raises((ValueError, KeyError)) as error:
+        DQ.from_strings(strings)
+    assert( 'position {}'.format(position) in str(error.value) )
+
+# binary format
+
+@pytest.mark.parametrize('q0', (
+                         DQA(np.arange(6.).reshape(2, 3), D({'L':1})),
+                         DQA(np.array([1+2j, 3]), D({'a':0.5})),
+                         DQA(np.array([1, 2], dtype='>i4'), D({'t':-1})),
+                         DQA(np.arange(10.)[::3], D({'M':1})), # not contiguous
+                         DQA(),
+                         ))
+def test_bytes_round_trip(q0):
+    q1 = DQA.from_bytes(q0.to_bytes())
+    assert( q1.dimensions is q0.dimensions )
+    assert( q1.numerics.dtype==q0.numerics.dtype )
+    assert( np.array_equal(q1.numerics, q0.numerics) )
+
+def test_from_bytes_zero_copy():
+    data = bytearray(DQA(np.array([1., 2.]), D({'L':1})).to_bytes())
+    q = DQA.from_bytes(data)
+    q.numerics[0] = 5.
+    assert( DQA.from_bytes(data).numerics[0]==5. )
+    assert( not DQA.from_bytes(bytes(data)).numerics.flags.writeable )
+
+def test_from_bytes_rejects():
+    data = DQA(np.array([1., 2.]), D({'L':1})).to_bytes()
+    for corrupted in (data[:-1], data+b'\0', DQ('1 m').to_bytes()):
+        with pytest.raises(ValueError):
+            DQA.from_bytes(corrupted)
@@ -0,0 +1,174 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the NumPy protocols (__array_ufunc__ and __array_function__) of DimQuantArray,
+i.e. whether numpy functions apply the dimension rules.
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+
+@pytest.fixture(scope="function")
+def areas():
+    yield DQA(np.array([1., 4., 9.]), D({'L':2}))
+
+@pytest.fixture(scope="function")
+def ratios():
+    yield DQA(np.array([0.1, 0.5, 0.9]))
+
+# ufuncs
+
+@pytest.mark.parametrize('ufunc,expected_dimensions',(
+                         (np.add, D({'L':2})),
+                         (np.subtract, D({'L':2})),
+                         (np.maximum, D({'L':2})),
+                         (np.multiply, D({'L':4})),
+                         (np.divide, D()),
+                        ))
+def test_binary_ufuncs(areas, ufunc, expected_dimensions):
+    result = ufunc(areas, areas)
+    assert( isinstance(result, DQA) )
+    assert( result.dimensions is expected_dimensions )
+    assert( np.array_equal(result.numerics, ufunc(areas.numerics, areas.numerics)) )
+
+@pytest.mark.parametrize('ufunc,expected_dimensions',(
+                         (np.sqrt, D({'L':1})),
+                         (np.square, D({'L':4})),
+                         (np.reciprocal, D({'L':-2})),
+                         (np.negative, D({'L':2})),
+                         (np.absolute, D({'L':2})),
+                        ))
+def test_unary_ufuncs(areas, ufunc, expected_dimensions):
+    result = ufunc(areas)
+    assert( result.dimensions is expected_dimensions )
+    assert( np.array_equal(result.numerics, ufunc(areas.numerics)) )
+
+def test_add_requires_equal_dimensions(areas):
+    with pytest.raises(ValueError):
+        np.add(areas, np.sqrt(areas))
+    with pytest.raises(TypeError):
+        np.add(areas, 1)
+    assert( np.array_equal(np.add(areas/areas, 1).numerics, [2., 2., 2.]) )
+
+def test_mixed_with_scalar_quantity(areas):
+    result = np.maximum(areas, DQ(5, {'L':2}))
+    assert( np.array_equal(result.numerics, [5., 5., 9.]) )
+    assert( result.dimensions is areas.dimensions )
+
+def test_ndarray_operand(areas):
+    result = np.array([1., 2., 3.])*areas
+    assert( result.dimensions is areas.dimensions )
+    assert( np.array_equal(result.numerics, [1., 8., 27.]) )
+
+@pytest.mark.parametrize('ufunc',(np.exp, np.log, np.sin, np.arctanh))
+def test_non_dimensional_ufuncs(areas, ratios, ufunc):
+    with pytest.raises(TypeError):
+        ufunc(areas)
+    result = ufunc(ratios)
+    assert( result.is_non_dimensional() )
+
+def test_comparison_ufuncs(areas):
+    result = np.greater(areas, DQ(2, {'L':2}))
+    assert( isinstance(result, np.ndarray) )
+    assert( np.array_equal(result, [False, True, True]) )
+    with pytest.raises(ValueError):
+        np.less(areas, DQ(2, {'L':1}))
+
+def test_power(areas, ratios):
+    assert( np.power(areas, 1.5).dimensions is D({'L':3}) )
+    with pytest.raises(ValueError):
+        np.power(areas, np.array([1, 2, 3]))
+    with pytest.raises(NotImplementedError):
+        np.power(ratios, areas)
+    assert( np.power(ratios, np.array([1, 2, 3])).is_non_dimensional() )
+
+def test_reduce(areas):
+    result = np.add.reduce(areas)
+    assert( type(result) is DQ )
+    assert( result==DQ(14, {'L':2}) )
+    accumulated = np.maximum.accumulate(areas)
+    assert( accumulated.dimensions is areas.dimensions )
+    with pytest.raises(TypeError):
+        np.multiply.reduce(areas)
+
+def test_out(areas):
+    out = DQA(np.zeros(3), D({'L':2}))
+    result = np.add(areas, areas, out=out)
+    assert( result is out )
+    assert( np.array_equal(out.numerics, [2., 8., 18.]) )
+    with pytest.raises(ValueError):
+        np.sqrt(areas, out=out)
+    with pytest.raises(TypeError):
+        np.add(areas, areas, out=np.zeros(3))
+
+def test_unsupported_ufunc(areas):
+    with pytest.raises(TypeError):
+        np.bitwise_and(areas, areas)
+
+# array functions
+
+@pytest.mark.parametrize('function,expected',(
+                         (np.sum, DQ(14, {'L':2})),
+                         (np.mean, DQ(14/3, {'L':2})),
+                         (np.median, DQ(4, {'L':2})),
+                         (np.min, DQ(1, {'L':2})),
+                         (np.max, DQ(9, {'L':2})),
+                         (np.var, DQ(np.var([1., 4., 9.]), {'L':4})),
+                        ))
+def test_reductions(areas, function, expected):
+    result = function(areas)
+    assert( type(result) is DQ )
+    assert( result.dimensions is expected.dimensions )
+    assert( result.numeric==pytest.approx(expected.numeric) )
+
+def test_reductions_along_axis():
+    q = DQA(np.arange(6.).reshape(2, 3), D({'t':1}))
+    result = np.sum(q, axis=0)
+    assert( isinstance(result, DQA) )
+    assert( np.array_equal(result.numerics, [3., 5., 7.]) )
+
+def test_plain_results(areas):
+    assert( np.argmax(areas)==2 )
+    assert( np.shape(areas)==(3,) )
+
+def test_concatenate(areas):
+    result = np.concatenate([areas, areas[:1]])
+    assert( result.dimensions is areas.dimensions )
+    assert( np.array_equal(result.numerics, [1., 4., 9., 1.]) )
+    with pytest.raises(ValueError):
+        np.concatenate([areas, np.sqrt(areas)])
+    with pytest.raises(TypeError):
+        np.stack([areas, np.zeros(3)])
+
+def test_where(areas):
+    result = np.where(areas>DQ(2, {'L':2}), areas, 2*areas)
+    assert( result.dimensions is areas.dimensions )
+    assert( np.array_equal(result.numerics, [2., 4., 9.]) )
+    with pytest.raises(TypeError):
+        np.where(areas>DQ(2, {'L':2}), areas, 0)
+    ratios = areas/DQ(2, {'L':2})
+    result = np.where(ratios, 1, 0) # a non-dimensional condition, plain values
+    assert( type(result) is np.ndarray )
+    assert( np.array_equal(result, [1, 1, 1]) )
+
+def test_clip_and_isclose(areas):
+    result = np.clip(areas, DQ(2, {'L':2}), DQ(5, {'L':2}))
+    assert( np.array_equal(result.numerics, [2., 4., 5.]) )
+    result = np.clip(areas, a_min=DQ(2, {'L':2}), a_max=None)
+    assert( np.array_equal(result.numerics, [2., 4., 9.]) )
+    if tuple(int(v) for v in np.__version__.split('.')[:2])>=(2, 1): # keywords min and max
+        result = np.clip(areas, max=DQ(5, {'L':2}))
+        assert( np.array_equal(result.numerics, [1., 4., 5.]) )
+    assert( np.allclose(areas, areas) )
+    with pytest.raises(ValueError):
+        np.isclose(areas, np.sqrt(areas))
+
+def test_unsupported_function(areas):
+    with pytest.raises(TypeError):
+        np.prod(areas)
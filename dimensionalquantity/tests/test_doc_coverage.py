@@ -10,7 +10,12 @@ from dimensionalquantity import BaseDimQuant as BDQ
 from dimensionalquantity import DimQuant as DQ
 from dimensionalquantity import BasicTranslator as BT
 from dimensionalquantity import Translator as T
+from dimensionalquantity import CompiledUnit as CU
 import dimensionalquantity
+try:
+    from dimensionalquantity import DimQuantArray as DQA
+except ImportError: # DimQuantArray requires numpy
+    DQA = None
 
 """
 Purpose of the following test(s):
@@ -61,6 +66,8 @@ def test_inspect_selected_members():
                          + inspect_selected_members(BT)
                          + inspect_selected_members(T)
                          + inspect_selected_members(DQ)
+                         + inspect_selected_members(CU)
+                         + (inspect_selected_members(DQA) if DQA is not None else [])
                          )
 def test_doc_string_coverage(name,documentable):
     """Note: `name` isn't used explicitly,
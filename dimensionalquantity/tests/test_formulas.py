@@ -0,0 +1,104 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import formula
+
+ENERGY = D({'M':1, 'L':2, 't':-2})
+
+@formula
+def kinetic_energy(m, v):
+    """0.5*m*v**2"""
+    return 0.5*m*v**2
+
+def test_formula():
+    e = kinetic_energy(DQ('2 kg'), DQ('3 m/s'))
+    assert( type(e) is DQ )
+    assert( e==DQ(9, ENERGY) )
+    assert( kinetic_energy.__doc__=='0.5*m*v**2' )
+
+def test_formula_traces_once_per_signature():
+    kinetic_energy.cache_clear()
+    for n in range(5):
+        kinetic_energy(DQ('{} kg'.format(n)), DQ('3 m/s'))
+    assert( kinetic_energy.cache_info().misses==1 )
+    assert( kinetic_energy.cache_info().hits==4 )
+    e = kinetic_energy(DQ('2 kg'), DQ('3 km/s')) # same signature
+    assert( kinetic_energy.cache_info().misses==1 )
+    e = kinetic_energy(BDQ(2, {'M':1}), DQ('3 m/s')) # another class
+    assert( type(e) is BDQ )
+    e = kinetic_energy(DQ('2 kg'), DQ('3 m')) # other dimensions
+    assert( e.dimensions is D({'M':1, 'L':2}) )
+    assert( kinetic_energy.cache_info().currsize==3 )
+
+def test_formula_checks_dimensions_when_tracing():
+    @formula
+    def inconsistent(a, b):
+        return a+b
+    with pytest.raises(ValueError):
+        inconsistent(DQ('1 m'), DQ('1 s'))
+    assert( inconsistent.cache_info().currsize==0 )
+    assert( inconsistent(DQ('1 m'), DQ('1 km'))==DQ('1001 m') )
+
+def test_formula_traces_with_distinct_numerics():
+    @formula
+    def velocity(x, x0, t, t0):
+        return (x-x0)/(t-t0)
+    assert( velocity(DQ('5 m'), DQ('1 m'), DQ('3 s'), DQ('1 s'))==DQ(2, {'L':1, 't':-1}) )
+    assert( velocity(x=DQ('5 m'), x0=DQ('1 m'), t=DQ('3 s'), t0=DQ('1 s'))==DQ(2, {'L':1, 't':-1}) )
+
+def test_formula_static_arguments():
+    @formula(static=('n',))
+    def power(x, n=2):
+        return x**n
+    assert( power(DQ('3 m'), n=3)==DQ(27, {'L':3}) )
+    assert( power(DQ('3 m'), n=2)==DQ(9, {'L':2}) )
+    assert( power(DQ('3 m'), 3)==DQ(27, {'L':3}) ) # positionally
+    assert( power(DQ('3 m'), 4)==DQ(81, {'L':4}) )
+    assert( power(DQ('3 m'))==DQ(9, {'L':2}) ) # by default
+    with pytest.raises(TypeError):
+        formula(power.__wrapped__, static=('m',))
+
+def test_formula_exponent_quantities():
+    power = formula(lambda x, n: x**n)
+    with pytest.raises(ValueError): # the dimensions depend on the value of n
+        power(DQ('2 m'), DQ(2))
+    power = formula(lambda x, n: x**n, static=('n',))
+    assert( power(DQ('2 m'), DQ(2))==DQ(4, {'L':2}) )
+    assert( power(DQ('2 m'), n=DQ(3)).dimensions is D({'L':3}) )
+    assert( power(DQ('2 m'), DQ(2)).dimensions is D({'L':2}) )
+
+def test_formula_other_results():
+    @formula
+    def several(a, b):
+        return a*b, a/b, a>b, 3
+    product, ratio, greater, three = several(DQ('2 m'), DQ('4 m'))
+    assert( product==DQ(8, {'L':2}) )
+    assert( ratio==BDQ(0.5, {}) )
+    assert( greater is False )
+    assert( three==3 )
+
+def test_formula_rejects_captured_quantities():
+    g = DQ('9.81 m/s2')
+    @formula
+    def weight(m):
+        return m*g
+    with pytest.raises(TypeError):
+        weight(DQ('1 kg'))
+
+def test_formula_arrays():
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    @formula
+    def speed(distance, time):
+        return np.sqrt(distance**2)/time
+    v = speed(DQA(np.array([3., -4.]), D({'L':1})), DQ('2 s'))
+    assert( isinstance(v, DQA) )
+    assert( v.dimensions is D({'L':1, 't':-1}) )
+    assert( np.array_equal(v.numerics, [1.5, 2]) )
+    e = kinetic_energy(DQA(np.array([2., 4.]), D({'M':1})), DQ('3 m/s'))
+    assert( np.array_equal(e.numerics, [9, 18]) )
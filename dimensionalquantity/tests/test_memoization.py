@@ -0,0 +1,80 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import memoized
+
+def counted(maxsize=128):
+    calls = []
+    @memoized(maxsize=maxsize)
+    def kinetic_energy(m, v, factor=1):
+        calls.append((m, v))
+        return 0.5*m*v**2*factor
+    return kinetic_energy, calls
+
+def test_memoized():
+    kinetic_energy, calls = counted()
+    assert( kinetic_energy(DQ('2 kg'), DQ('3 m/s'))==DQ('9 J') )
+    assert( kinetic_energy(DQ('2 kg'), DQ('3 m/s'))==DQ('9 J') ) # new but equal arguments
+    assert( kinetic_energy(DQ('2 kg'), DQ('3 m/s'), factor=2)==DQ('18 J') )
+    assert( kinetic_energy(DQ('2 kg'), DQ('3 m/s'), factor=2)==DQ('18 J') )
+    assert( len(calls)==2 )
+    assert( kinetic_energy.cache_info()==(2, 2, 0, 128, 2) )
+    assert( kinetic_energy.__name__=='kinetic_energy' )
+
+def test_memoized_keys():
+    kinetic_energy, calls = counted()
+    kinetic_energy(DQ(2, {'M':1}), DQ(3, {'L':1, 't':-1}))
+    kinetic_energy(BDQ(2, {'M':1}), BDQ(3, {'L':1, 't':-1})) # other class
+    kinetic_energy(DQ(2, {'M':1}), DQ(3, {'L':1})) # other dimensions
+    kinetic_energy(DQ(2, {'M':1}), 3)
+    kinetic_energy(DQ(2, {'M':1}), 3.0) # as for functools.lru_cache
+    assert( len(calls)==4 )
+    assert( type(kinetic_energy(BDQ(2, {'M':1}), BDQ(3, {'L':1, 't':-1}))) is BDQ )
+
+def test_memoized_arguments_and_results_changed_in_place():
+    kinetic_energy, calls = counted()
+    m, v = DQ('2 kg'), DQ('3 m/s')
+    e = kinetic_energy(m, v)
+    m *= 2 # doesn't change the cached key
+    e += DQ('1 J') # doesn't change the cached result
+    assert( kinetic_energy(DQ('2 kg'), v)==DQ('9 J') )
+    assert( kinetic_energy(m, v)==DQ('18 J') )
+    e = kinetic_energy(m, v)
+    e *= 2
+    assert( kinetic_energy(m, v)==DQ('18 J') )
+    assert( len(calls)==2 )
+
+def test_memoized_evictions():
+    kinetic_energy, calls = counted(maxsize=2)
+    for m in (1, 2, 1, 3, 1, 2):
+        kinetic_energy(DQ(m, {'M':1}), DQ('1 m/s'))
+    # 2 is evicted by 3, being the least recently used
+    assert( kinetic_energy.cache_info()==(2, 4, 2, 2, 2) )
+    kinetic_energy.cache_clear()
+    assert( kinetic_energy.cache_info()==(0, 0, 0, 2, 0) )
+
+def test_memoized_sizes():
+    unbounded, calls = counted(maxsize=None)
+    for m in range(300):
+        unbounded(DQ(m, {'M':1}), DQ('1 m/s'))
+    assert( unbounded.cache_info().currsize==300 )
+    uncached, calls = counted(maxsize=0)
+    uncached(DQ('1 kg'), DQ('1 m/s'))
+    uncached(DQ('1 kg'), DQ('1 m/s'))
+    assert( len(calls)==2 and uncached.cache_info()==(0, 2, 0, 0, 0) )
+    with pytest.raises(ValueError):
+        memoized(lambda x: x, maxsize=-1)
+
+def test_memoized_unhashable():
+    kinetic_energy, calls = counted()
+    with pytest.raises(TypeError):
+        kinetic_energy(DQ('1 kg'), [1])
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    with pytest.raises(TypeError):
+        kinetic_energy(DQ('1 kg'), DQA(np.array([1., 2.]), D({'L':1, 't':-1})))
@@ -0,0 +1,98 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+from dimensionalquantity.mmapio import write_column, open_column, read_column_header
+
+PRESSURE = D({'M':1, 'L':-1, 't':-2})
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join('column.dq'))
+
+def test_column_round_trip(path):
+    q0 = DQA(np.arange(10.), PRESSURE)
+    write_column(path, q0)
+    q1 = open_column(path)
+    assert( isinstance(q1.numerics, np.memmap) )
+    assert( q1.dimensions is PRESSURE )
+    assert( np.array_equal(q1.numerics, q0.numerics) )
+
+@pytest.mark.parametrize('q0', (
+                         DQA(np.arange(6).reshape(2, 3), D({'L':1})),
+                         DQA(np.array([1+2j]), D({'a':0.5})),
+                         DQA(np.arange(10.)[::3], D({'t':1})),
+                         DQA(np.array([]), D({'t':1})),
+                         [DQ('1 m'), DQ('2 km')],
+                         ))
+def test_column_round_trip_kinds(path, q0):
+    write_column(path, q0)
+    q0 = q0 if isinstance(q0, DQA) else DQA(q0)
+    q1 = open_column(path)
+    assert( q1.dimensions is q0.dimensions )
+    assert( q1.numerics.dtype==q0.numerics.dtype )
+    assert( np.array_equal(q1.numerics, q0.numerics) )
+
+def test_column_unit(path):
+    write_column(path, DQA(np.array([1e3, 2e3]), PRESSURE), unit='kPa')
+    assert( read_column_header(path)==(PRESSURE, 'kPa', np.dtype(float), (2,)) )
+    assert( np.allclose(np.fromfile(path, dtype=float)[-2:], [1, 2]) ) # written in kPa
+    assert( np.allclose(open_column(path).numerics, [1e3, 2e3]) )
+    with pytest.raises(ValueError):
+        write_column(path, DQA(np.array([1e3]), PRESSURE), unit='m')
+
+def test_column_slicing_and_arithmetic(path, tmpdir):
+    write_column(path, DQA(np.arange(1000.), D({'L':1})))
+    other = str(tmpdir.join('other.dq'))
+    write_column(other, DQA(np.ones(1000), D({'t':1})))
+    length, time = open_column(path), open_column(other)
+    assert( (length[10:12]==DQA(np.array([10., 11.]), D({'L':1}))).all() )
+    assert( (length/time).dimensions is D({'L':1, 't':-1}) )
+    with pytest.raises(ValueError):
+        length+time
+
+def test_column_modes(path):
+    write_column(path, DQA(np.arange(3.), D({'L':1})))
+    with pytest.raises(ValueError):
+        open_column(path).numerics[0] = 5. # read-only
+    column = open_column(path, mode='r+')
+    column.numerics[0] = 5.
+    column.numerics.flush()
+    del column
+    assert( open_column(path).numerics[0]==5. )
+    for mode in ('w+', 'readwrite', 'x'):
+        with pytest.raises(ValueError):
+            open_column(path, mode=mode)
+    assert( open_column(path).numerics[0]==5. ) # not truncated
+    write_column(path, DQA(np.array([1e3, 2e3]), PRESSURE), unit='kPa')
+    with pytest.raises(ValueError): # converted in memory, writes wouldn't reach the file
+        open_column(path, mode='r+')
+    assert( np.allclose(open_column(path, mode='c').numerics, [1e3, 2e3]) )
+
+def test_column_in_place_operations(path):
+    write_column(path, DQA(np.arange(3.), D({'L':1})))
+    column = open_column(path, mode='r+')
+    column += DQ('1 m') # same dimensions: written through to the file
+    column.numerics.flush()
+    assert( np.array_equal(open_column(path).numerics, [1., 2., 3.]) )
+    column *= DQ('3 s') # other dimensions: the file is left as it is
+    assert( column.dimensions is D({'L':1, 't':1}) and not isinstance(column.numerics, np.memmap) )
+    del column
+    assert( read_column_header(path)[0] is D({'L':1}) )
+    assert( np.array_equal(open_column(path).numerics, [1., 2., 3.]) )
+
+def test_column_rejects(path):
+    write_column(path, DQA(np.arange(3.), D({'L':1})))
+    with open(path, 'rb') as stream:
+        data = stream.read()
+    for corrupted in (b'', data[:-1], data+b'\0', DQA(np.arange(3.), D({'L':1})).to_bytes()):
+        with open(path, 'wb') as stream:
+            stream.write(corrupted)
+        with pytest.raises(ValueError):
+            open_column(path)
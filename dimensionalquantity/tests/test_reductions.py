@@ -0,0 +1,66 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import dq_sum, dq_mean, dq_min, dq_max
+
+LENGTHS = [DQ('1 m'), DQ('2 km'), DQ('3 cm')]
+
+@pytest.mark.parametrize('quantities', (LENGTHS, tuple(LENGTHS), iter(LENGTHS), (q for q in LENGTHS)))
+def test_sum(quantities):
+    total = dq_sum(quantities)
+    assert( type(total) is DQ )
+    assert( total==DQ('2001.03 m') )
+    assert( total.dimensions is D({'L':1}) )
+
+def test_mean_min_max():
+    assert( dq_mean(LENGTHS)==DQ(2001.03/3, {'L':1}) )
+    assert( dq_min(LENGTHS)==DQ('3 cm') )
+    assert( dq_max(q for q in LENGTHS)==DQ('2 km') )
+    assert( type(dq_max([BDQ(1, {'L':1}), BDQ(2, {'L':1})])) is BDQ )
+
+def test_sum_start():
+    assert( dq_sum(LENGTHS, start=DQ('1 m'))==DQ('2002.03 m') )
+    assert( dq_sum([], start=DQ('1 m'))==DQ('1 m') )
+    with pytest.raises(ValueError):
+        dq_sum(LENGTHS, start=DQ('1 s'))
+
+def test_streaming_in_chunks():
+    # more quantities than fit into one chunk
+    n = 10000
+    assert( dq_sum(DQ(k, {'t':1}) for k in range(n))==DQ(n*(n-1)//2, {'t':1}) )
+    assert( dq_mean(DQ(k, {'t':1}) for k in range(n))==DQ((n-1)/2, {'t':1}) )
+    assert( dq_min(DQ(k, {'t':1}) for k in range(n, 0, -1))==DQ(1, {'t':1}) )
+
+@pytest.mark.parametrize('reduction', (dq_sum, dq_mean, dq_min, dq_max))
+def test_wrong_quantities(reduction):
+    with pytest.raises(ValueError) as error:
+        reduction(DQ(1, {'t':1}) if k!=5000 else DQ('1 m') for k in range(6000))
+    assert( 'position 5000' in str(error.value) )
+    with pytest.raises(TypeError) as error:
+        reduction(LENGTHS+[1])
+    assert( 'position 3' in str(error.value) )
+    with pytest.raises(TypeError):
+        reduction([1, 2])
+    with pytest.raises(ValueError):
+        reduction([])
+    with pytest.raises(ValueError):
+        reduction(q for q in ())
+
+def test_arrays():
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    lengths = DQA(np.array([[1., 2.], [3., 6.]]), D({'L':1}))
+    assert( dq_sum(lengths)==DQ('12 m') and type(dq_sum(lengths)) is DQ )
+    assert( dq_mean(lengths)==DQ('3 m') )
+    assert( dq_min(lengths)==DQ('1 m') )
+    assert( dq_max(lengths)==DQ('6 m') )
+    assert( dq_sum(lengths, start=DQ('1 m'))==DQ('13 m') )
+    assert( dq_sum(DQA(np.array([]), D({'L':1})))==DQ('0 m') )
+    for reduction in (dq_mean, dq_min, dq_max):
+        with pytest.raises(ValueError):
+            reduction(DQA(np.array([]), D({'L':1})))
@@ -0,0 +1,140 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from dimensionalquantity import Dimensional as D
+from dimensionalquantity import DimQuant as DQ
+from dimensionalquantity import DimQuantArray as DQA
+from dimensionalquantity import Translator
+from dimensionalquantity.textio import read_quantities, write_quantities
+
+PRESSURE = D({'M':1, 'L':-1, 't':-2})
+
+def test_read_quantities_header_units():
+    text = 'time [s], pressure [kPa]\n0, 12.5\n1, 13\n'
+    batch, = read_quantities(io.StringIO(text))
+    assert( list(batch)==['time', 'pressure'] )
+    assert( batch['time'].dimensions is D({'t':1}) )
+    assert( np.array_equal(batch['time'].numerics, [0, 1]) )
+    assert( batch['pressure'].dimensions is PRESSURE )
+    assert( np.allclose(batch['pressure'].numerics, [12.5e3, 13e3]) )
+
+def test_read_quantities_row_units():
+    text = 'time [ms], pressure\n0, 12.5 kPa\n1, 1.3e4 Pa\n\n'
+    batch, = read_quantities(io.StringIO(text))
+    assert( np.allclose(batch['time'].numerics, [0, 1e-3]) )
+    assert( batch['pressure'].dimensions is PRESSURE )
+    assert( np.allclose(batch['pressure'].numerics, [12.5e3, 13e3]) )
+
+def test_read_quantities_without_header():
+    batch, = read_quantities(io.StringIO('1 m;2 s\n3 km;4 ms\n'), delimiter=';', header=False)
+    assert( set(batch)=={0, 1} )
+    assert( np.allclose(batch[0].numerics, [1, 3e3]) )
+    assert( np.allclose(batch[1].numerics, [2, 4e-3]) )
+
+def test_read_quantities_batches():
+    text = 'x [m]\n'+''.join('{}\n'.format(j) for j in range(25))
+    batches = list(read_quantities(io.StringIO(text), batch_size=10))
+    assert( [len(batch['x']) for batch in batches]==[10, 10, 5] )
+    assert( np.array_equal(np.concatenate([batch['x'].numerics for batch in batches]), np.arange(25)) )
+
+def test_read_quantities_is_lazy():
+    def lines():
+        yield 'x [m]\n'
+        for j in range(10):
+            yield '{}\n'.format(j)
+        raise AssertionError('read beyond the first batch')
+    batches = read_quantities(lines(), batch_size=5)
+    assert( np.array_equal(next(batches)['x'].numerics, np.arange(5)) )
+
+def test_read_quantities_columns():
+    text = 'id, time [s], pressure\na, 0, 1 Pa\nb, 1, 2 Pa\n'
+    batch, = read_quantities(io.StringIO(text), columns=['pressure'])
+    assert( list(batch)==['pressure'] )
+    with pytest.raises(ValueError):
+        list(read_quantities(io.StringIO(text), columns=['volume']))
+
+def test_read_quantities_path(tmpdir):
+    path = tmpdir.join('dump.csv')
+    path.write('l [cm]\n1\n2\n')
+    batch, = read_quantities(str(path))
+    assert( isinstance(batch['l'], DQA) )
+    assert( np.allclose(batch['l'].numerics, [0.01, 0.02]) )
+
+def test_read_quantities_empty():
+    assert( list(read_quantities(io.StringIO('')))==[] )
+    assert( list(read_quantities(io.StringIO('x [m]\n')))==[] )
+
+def test_read_quantities_translator():
+    translator = Translator()
+    translator.register_unit_LUT({'inch': DQ('2.54 cm')})
+    batch, = read_quantities(io.StringIO('l [inch]\n1\n'), translator=translator)
+    assert( np.allclose(batch['l'].numerics, [0.0254]) )
+
+@pytest.mark.parametrize('text, row', (
+                         ('x [m], y\n1, 1 s\n2, 2 s\n3\n', 2),
+                         ('x [m]\n1\n2\nthree\n', 2),
+                         ('x\n1 m\n2 m\n3 s\n', 2),
+                         ('x\n1 m\n2 m\n3 qq\n', 2),
+                         ))
+def test_read_quantities_reports_row(text, row):
+    with pytest.raises(ValueError) as error:
+        list(read_quantities(io.StringIO(text), batch_size=2))
+    assert( 'row {}'.format(row) in str(error.value) )
+
+def round_trip(columns, **kwargs):
+    stream = io.StringIO()
+    write_quantities(stream, columns, **kwargs)
+    stream.seek(0)
+    batch, = read_quantities(stream)
+    return batch
+
+def test_write_quantities():
+    stream = io.StringIO()
+    write_quantities(stream, {'time': DQA(np.array([0, 1.5]), D({'t':1})),
+                              'force': [DQ('1 N'), DQ('2 kN')]})
+    assert( stream.getvalue()=='time [s],force [N]\n0.0,1.0\n1.5,2000.0\n' )
+
+@pytest.mark.parametrize('quantities', (
+                         DQA(np.array([0.1, 1/3, 1e300, -2.5e-300]), D({'L':1, 't':-1})),
+                         DQA(np.array([0.1, 1/3]), PRESSURE),
+                         DQA(np.array([1.234e-6, 7.0]), D({'M':1})), # written in 'g'
+                         DQA(np.array([1, 2])), # non-dimensional
+                         [DQ('1 V'), DQ('2 mV')],
+                         ))
+def test_write_quantities_round_trip(quantities):
+    if not isinstance(quantities, DQA):
+        quantities = DQA(quantities)
+    batch = round_trip({'q': quantities})
+    assert( batch['q'].dimensions is quantities.dimensions )
+    assert( np.allclose(batch['q'].numerics, quantities.numerics, rtol=1e-15, atol=0) )
+
+def test_write_quantities_units():
+    stream = io.StringIO()
+    write_quantities(stream, {'p': DQA(np.array([1e3, 2e3]), PRESSURE)}, units={'p': 'kPa'})
+    assert( stream.getvalue()=='p [kPa]\n1.0\n2.0\n' )
+    with pytest.raises(ValueError):
+        write_quantities(io.StringIO(), {'p': DQA(np.array([1e3]), PRESSURE)}, units={'p': 'm'})
+
+def test_write_quantities_batches_and_path(tmpdir):
+    path = str(tmpdir.join('dump.csv'))
+    x = DQA(np.arange(25.), D({'L':1}))
+    write_quantities(path, {'x': x, 'y': x*x}, batch_size=10, delimiter=';')
+    batch, = read_quantities(path, delimiter=';')
+    assert( np.array_equal(batch['x'].numerics, x.numerics) )
+    assert( batch['y'].dimensions is D({'L':2}) )
+
+@pytest.mark.parametrize('columns', (
+                         {'x': DQA(np.array([1., 2.]), D({'L':1})), 'y': DQA(np.array([1.]), D({'L':1}))},
+                         {'x': DQA(np.array([1.]), D({'x':1}))}, # no unit registered for dimension 'x'
+                         {'x': DQA(np.ones((2, 2)), D({'L':1}))},
+                         {'x': DQA(np.array([1+2j]), D({'L':1}))}, # complex
+                         ))
+def test_write_quantities_rejects(columns):
+    with pytest.raises(ValueError):
+        write_quantities(io.StringIO(), columns)
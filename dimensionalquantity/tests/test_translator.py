@@ -15,8 +15,9 @@ for any of several equivalent strings.
 import pytest
 
 from dimensionalquantity import Dimensional as D
+from dimensionalquantity import BaseDimQuant as BDQ
 from dimensionalquantity import DimQuant as DQ
-from dimensionalquantity import Translator
+from dimensionalquantity import BasicTranslator, Translator
 
 @pytest.fixture(scope="function")
 def translator():
@@ -170,7 +171,180 @@ def test_register_prefix_LUT_with_already_existing(setup_and_clean_DQ_with_basic
         translator.register_prefix_LUT(redundant_unit_LUT)
 
 def test_register_prefix_LUT_with_more_than_1_letter(setup_and_clean_DQ_with_basic_Translator):
-    notimplemented_prefix = {'da': 10}
+    multi_letter_prefix = {'my': 1e-4}
     translator = Translator()
-    with pytest.raises(NotImplementedError):
-        translator.register_prefix_LUT(notimplemented_prefix)
+    translator.register_prefix_LUT(multi_letter_prefix)
+    DQ.register_translator(translator)
+    assert( DQ('1 mym')==DQ('0.1 mm') )
+
+def test_deca_prefix(translator):
+    assert( translator.translate('dam').numeric==10 )
+    assert( translator.translate('dam').dimensions==D({'L':1}) )
+    assert( translator.translate('dm').numeric==pytest.approx(0.1) )
+
+def test_units_take_precedence_over_prefixes(translator):
+    assert( translator.translate('cd').dimensions==D({'J':1}) ) # not centi-'d'
+    assert( translator.translate('mol').dimensions==D({'N':1}) )
+    assert( translator.translate('mmol').dimensions==D({'N':1}) )
+    assert( translator.translate('mmol').numeric==pytest.approx(1e-3) )
+
+def test_unknown_prefix_message(translator):
+    with pytest.raises(KeyError) as error:
+        translator.translate('qqmol')
+    assert( 'prefix \'qq\'' in str(error.value) )
+
+def test_registration_after_ValueError_still_registered():
+    translator = Translator()
+    with pytest.raises(ValueError):
+        translator.register_unit_LUT({'fanta': DQ('2.54 cm'), 'm': DQ('1 m')})
+    assert( translator.translate('kfanta').numeric==pytest.approx(25.4) )
+
+# cache of translate()
+
+def test_cache_hits_and_misses(translator):
+    assert( translator.cache_info()==(0, 0, 256, 0) )
+    q0 = translator.translate('kg.m/s2')
+    q1 = translator.translate('kg.m/s2')
+    assert( translator.cache_info()==(1, 1, 256, 1) )
+    assert( q0.numeric==q1.numeric and q0.dimensions is q1.dimensions )
+    assert( q0 is not q1 ) # callers get their own (mutable) BaseDimQuant
+
+def test_cache_bounded():
+    translator = Translator(cache_size=2)
+    for unit in ('m', 's', 'kg', 'm'):
+        translator.translate(unit)
+    assert( translator.cache_info()==(0, 4, 2, 2) )
+    translator.translate('kg') # still cached, 's' was evicted instead
+    assert( translator.cache_info().hits==1 )
+
+def test_cache_disabled():
+    translator = Translator(cache_size=0)
+    translator.translate('m')
+    translator.translate('m')
+    assert( translator.cache_info()==(0, 2, 0, 0) )
+
+def test_cache_invalidated_by_registration(translator):
+    translator.translate('cm')
+    assert( translator.cache_info().currsize==1 )
+    translator.register_prefix_LUT({'c': 0.5}, override=True)
+    assert( translator.cache_info().currsize==0 )
+    assert( translator.translate('cm').numeric==0.5 )
+    translator.register_unit_LUT({'fanta': DQ('2.54 cm')})
+    assert( translator.cache_info().currsize==0 )
+
+def test_cache_clear(translator):
+    translator.translate('m')
+    translator.cache_clear()
+    assert( translator.cache_info()==(0, 0, 256, 0) )
+
+# conversion factors and malformed strings
+
+@pytest.mark.parametrize('string, expected_factor',(
+                         ('cm', 1e-2),
+                         ('cm2', 1e-4),
+                         ('cm-1', 1e2),
+                         ('m/cm', 1e2),
+                         ('kg/g', 1e3),
+                         ('(km/ms)2', 1e12),
+                         ('km.(ms.ns)-1', 1e15),
+                        ))
+def test_conversion_factor_with_exponents(translator, string, expected_factor):
+    assert( translator.translate(string).numeric==pytest.approx(expected_factor) )
+
+@pytest.mark.parametrize('string',('(m', 'm)', '(m))', ')m(', '2m', '/3'))
+def test_malformed_strings_raise_ValueError(translator, string):
+    with pytest.raises(ValueError):
+        translator.translate(string)
+
+# compiled unit strings
+
+def test_compile_scalar(translator):
+    kgms2 = translator.compile('kg.m/s2')
+    q = kgms2(3)
+    assert( type(q) is BDQ )
+    assert( q.numeric==3 )
+    assert( q.dimensions is D({'M':1, 'L':1, 't':-2}) )
+    assert( translator.compile('cm')(2).numeric==pytest.approx(0.02) )
+
+def test_compile_list(translator):
+    cm = translator.compile('cm')
+    qs = cm([1, 2.5])
+    assert( [q.numeric for q in qs]==pytest.approx([0.01, 0.025]) )
+    assert( all(q.dimensions is D({'L':1}) for q in qs) )
+
+def test_compile_wrong_input(translator):
+    cm = translator.compile('cm')
+    with pytest.raises(TypeError):
+        cm('1')
+    with pytest.raises(TypeError):
+        cm(True)
+    with pytest.raises(TypeError):
+        cm(None)
+
+def test_compile_ndarray(translator):
+    np = pytest.importorskip('numpy')
+    from dimensionalquantity import DimQuantArray as DQA
+    qs = translator.compile('km')(np.array([1., 2.]))
+    assert( isinstance(qs, DQA) )
+    assert( np.array_equal(qs.numerics, [1e3, 2e3]) )
+
+def test_compile_with_registered_translator(setup_and_clean_DQ_with_basic_Translator):
+    translator = Translator()
+    translator.register_unit_LUT({'fanta': DQ('2.54 cm')})
+    DQ.register_translator(translator)
+    fanta = DQ.compile('fanta')
+    q = fanta(2)
+    assert( type(q) is DQ )
+    assert( q==DQ('5.08 cm') )
+
+def test_reverse_unit_lookup_uses_first_atomic_unit():
+    translator = Translator()
+    translator.register_unit_LUT({'fanta': DQ('2.54 cm'), 'hectare': DQ('1e4 m2')})
+    assert( translator.reverse_unit_lookup(D({'L':1}))=='m' )
+    assert( translator.reverse_unit_lookup(D({'L':2}))=='m2' )
+
+def test_reverse_unit_lookup_memo_invalidated():
+    translator = Translator()
+    assert( translator.reverse_unit_lookup({'x':1})=='' ) # no unit registered for dimension 'x'
+    translator.register_unit_LUT({'ex': DQ(1, {'x':1})})
+    assert( translator.reverse_unit_lookup({'x':1, 't':-1})=='s-1.ex' )
+
+@pytest.mark.parametrize('unit_string, expected_str', (
+                         ('kg.m/s2', 'N'),
+                         ('N.m', 'J'),
+                         ('J/s', 'W'),
+                         ('kg/(m.s2)', 'Pa'),
+                         ('W/A', 'V'),
+                         ('V/A', 'Ohm'),
+                         ('kg.m/s', 'N.s'),
+                         ('kg2.m2.s-4', 'N2'),
+                         ('m/s', 'm.s-1'), # tie: the base units are kept
+                         ('s-1', 's-1'),
+                         ('m2/s', 'm2.s-1'),
+                         ))
+def test_reverse_unit_lookup_derived_units(unit_string, expected_str):
+    translator = Translator()
+    assert( translator.reverse_unit_lookup(translator.translate(unit_string).dimensions)==expected_str )
+
+def test_translate_derived_units():
+    translator = Translator()
+    assert( translator.translate('kN')==BDQ(1e3, D({'M':1, 'L':1, 't':-2})) )
+    assert( translator.translate('kΩ')==translator.translate('kOhm') )
+    assert( translator.translate('mT')==BDQ(1e-3, D({'M':1, 't':-2, 'i':-1})) )
+
+def test_reverse_unit_lookup_ignores_derived_units_with_factor():
+    translator = Translator()
+    translator.register_unit_LUT({'bar': DQ('1e5 Pa')})
+    assert( translator.reverse_unit_lookup(D({'M':1, 'L':-1, 't':-2}))=='Pa' )
+    # only units with a conversion factor of 1 are considered
+    translator = BasicTranslator()
+    translator.register_unit_LUT({'m': DQ('1 m'), 'bar': DQ('1e5 Pa')})
+    assert( translator.reverse_unit_lookup(D({'L':2}))=='m2' )
+    assert( translator.reverse_unit_lookup(D({'M':1, 'L':-1, 't':-2}))=='m-1' )
+
+def test_reverse_unit_lookup_many_derived_units():
+    translator = Translator()
+    translator.register_unit_LUT({'u{}'.format(n): BDQ(1, D({'x':n})) for n in range(2, 300)})
+    assert( translator.reverse_unit_lookup(D({'x':150, 'L':1}))=='u150.m' )
+    assert( translator.reverse_unit_lookup(D({'x':-1}))=='' ) # not expressible
+    assert( translator.reverse_unit_lookup(D({'M':1, 'L':1, 't':-2}))=='N' )
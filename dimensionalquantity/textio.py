@@ -0,0 +1,227 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""This `textio.py` provides functions to read quantities from CSV-like text files,
+and to write them to such files.
+The files are processed in batches of rows,
+each column of a batch becoming one DimQuantArray,
+so that memory stays bounded no matter how large the file.
+
+A field is either a quantity like '12.5 kPa',
+or a plain number if its column declares the unit in the header,
+e.g. 'pressure [kPa]';
+in the latter case the unit is translated once for the whole file.
+The writer always declares the units in the header.
+This module requires NumPy.
+"""
+
+import csv
+import os
+import re
+from itertools import islice
+
+import numpy as np
+
+from . import DimQuant
+from .dimquantarray import DimQuantArray
+
+# 'name [unit]' or 'name'
+_header_field = re.compile(r'^\s*(?P<name>.*?)\s*(\[(?P<unit>[^\]]*)\])?\s*$')
+
+def _open(source, mode):
+    # a path is opened (and closed again) here, a stream is used as it is
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, mode, newline='')
+    return None
+
+def read_quantities(source, batch_size=10000, delimiter=',', header=True, columns=None, translator=None):
+    """Reads quantities column-wise from a CSV-like text file,
+    yielding one batch of (at most) `batch_size` rows at a time.
+    Example, for a file 'dump.csv' with the content
+        time [s], pressure
+        0, 12.5 kPa
+        1, 1.3e4 Pa
+    >>> for batch in read_quantities('dump.csv'):
+    ...     print(batch)
+    {'time': DimQuantArray([0. 1.], Dimensional({'t': 1})),
+     'pressure': DimQuantArray([12500. 13000.], Dimensional({'M': 1, 'L': -1, 't': -2}))}
+
+    Args:
+        source (str, path, or text stream): the file to read.
+        batch_size (int=10000): maximum number of rows per batch.
+        delimiter (str=','): separates the fields of a row.
+        header (bool=True): whether the first row names the columns.
+            A column named 'name [unit]' holds plain numbers of that unit,
+            a column named 'name' holds quantities like '12.5 kPa'.
+            Without header the columns are named by their index
+            and hold quantities.
+        columns (iterable=None): names of the columns to read;
+            by default all columns are read.
+        translator (BasicTranslator=None): translates the units,
+            by default the one registered in DimQuant.
+
+    Yields:
+        dict mapping the column names to DimQuantArray instances,
+        each with the numerics of the batch in that column.
+
+    Raises:
+        ValueError: if a row has the wrong number of fields,
+            a field can't be parsed,
+            or the dimensions within a column differ,
+            stating the row (counted from 0, without header).
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.BasicTranslator.parse_many`
+        :py:meth: `dimensionalquantity.textio.write_quantities`
+    """
+    if batch_size<1:
+        raise ValueError('batch_size has to be positive, not {}.'.format(batch_size))
+    translator = DimQuant._T if translator is None else translator
+    stream = _open(source, 'r')
+    try:
+        reader = csv.reader(source if stream is None else stream, delimiter=delimiter, skipinitialspace=True)
+        rows = (row for row in reader if row) # skip empty lines
+        first = next(rows, None)
+        if first is None:
+            return
+        if header:
+            names, units = zip(*(_header_field.match(field).group('name', 'unit') for field in first))
+        else:
+            names, units = tuple(range(len(first))), (None,)*len(first)
+            rows = _prepended(first, rows)
+        # (column index, name, None or the (factor, Dimensional) of the header unit)
+        selected = []
+        for index, (name, unit) in enumerate(zip(names, units)):
+            if columns is None or name in columns:
+                if unit is None:
+                    selected.append((index, name, None))
+                else:
+                    _DQ = translator.translate(unit)
+                    selected.append((index, name, (_DQ.numeric, _DQ.dimensions)))
+        if columns is not None:
+            missing = set(columns)-set(names)
+            if missing:
+                raise ValueError('No column(s) named {}.'.format(', '.join(repr(name) for name in sorted(missing, key=str))))
+        dimensions_of = {}
+        start = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            for position, row in enumerate(batch):
+                if len(row)!=len(names):
+                    raise ValueError('Expected {} fields but found {} in row {}.'.format(
+                                     len(names), len(row), start+position))
+            quantities = {}
+            for index, name, unit in selected:
+                column = _read_column([row[index] for row in batch], unit, translator, name, start)
+                # a column keeps the dimensions of its first batch
+                dimensions = dimensions_of.setdefault(name, column.dimensions)
+                if column.dimensions is not dimensions: # Dimensional is interned
+                    raise ValueError(' '.join(['In column {!r} the dimensions {}'.format(name, column.dimensions),
+                                               'from row {} on differ from {}.'.format(start, dimensions)]))
+                quantities[name] = column
+            yield quantities
+            start += len(batch)
+    finally:
+        if stream is not None:
+            stream.close()
+
+def _prepended(first, rows):
+    yield first
+    yield from rows
+
+def _read_column(fields, unit, translator, name, start):
+    if unit is None:
+        try:
+            return translator.parse_many(fields)
+        except (KeyError, ValueError) as error:
+            raise ValueError('In column {!r} of the batch starting at row {}: {}'.format(
+                             name, start, error.args[0]))
+    factor, dimensions = unit
+    try:
+        numerics = np.array(fields, dtype=float)
+    except ValueError:
+        for position, field in enumerate(fields):
+            try:
+                float(field)
+            except ValueError:
+                raise ValueError('In column {!r} the number \'{}\' in row {} isn\'t a valid float.'.format(
+                                 name, field, start+position))
+    if factor!=1:
+        numerics *= factor
+    return DimQuantArray._trusted(numerics, dimensions)
+
+def write_quantities(target, columns, units=None, batch_size=10000, delimiter=',', translator=None):
+    """Writes quantities column-wise to a CSV-like text file,
+    which `read_quantities()` reads back.
+    The unit of each column is looked up once and declared in the header,
+    the rows hold plain numbers of that unit,
+    formatted in batches of (at most) `batch_size` rows.
+    Example:
+    >>> write_quantities('dump.csv', {'time': DimQuantArray([0, 1], D({'t':1})),
+    ...                               'force': [DimQuant('1 N'), DimQuant('2 N')]})
+    results in the file 'dump.csv' with the content
+        time [s],force [N]
+        0.0,1.0
+        1.0,2.0
+
+    Args:
+        target (str, path, or text stream): the file to write.
+        columns (dict): maps the column names to
+            DimQuantArray instances or sequences of quantities of equal dimensions,
+            all of the same length.
+        units (dict=None): maps column names to the unit strings to write them in, e.g. 'kPa';
+            by default the translator's `reverse_unit_lookup()` is used.
+        batch_size (int=10000): number of rows formatted at once.
+        delimiter (str=','): separates the fields of a row.
+        translator (BasicTranslator=None): translates the units,
+            by default the one registered in DimQuant.
+
+    Raises:
+        ValueError: if the columns differ in length, or are complex,
+            or a unit doesn't match the dimensions of its column
+            (which includes dimensions without registered unit).
+
+    .. seealso::
+        :py:meth: `dimensionalquantity.textio.read_quantities`
+    """
+    if batch_size<1:
+        raise ValueError('batch_size has to be positive, not {}.'.format(batch_size))
+    translator = DimQuant._T if translator is None else translator
+    units = {} if units is None else units
+    header, numerics = [], []
+    for name, quantities in columns.items():
+        if not isinstance(quantities, DimQuantArray):
+            quantities = DimQuantArray(list(quantities))
+        if quantities.ndim!=1:
+            raise ValueError('Column {!r} has {} dimensions instead of 1.'.format(name, quantities.ndim))
+        if np.iscomplexobj(quantities.numerics): # read_quantities() reads real numbers only
+            raise ValueError('Column {!r} is complex, only real numerics can be written.'.format(name))
+        unit = units.get(name)
+        if unit is None:
+            unit = translator.reverse_unit_lookup(quantities.dimensions)
+        _DQ = translator.translate(unit)
+        if _DQ.dimensions is not quantities.dimensions: # Dimensional is interned
+            raise ValueError(' '.join(['Column {!r} of dimensions {}'.format(name, quantities.dimensions),
+                                       'can\'t be written in unit \'{}\'.'.format(unit)]))
+        header.append('{} [{}]'.format(name, unit))
+        numerics.append(quantities.numerics if _DQ.numeric==1 else quantities.numerics/_DQ.numeric)
+    if len(set(len(column) for column in numerics))>1:
+        raise ValueError('All columns have to have the same length, not {}.'.format(
+                         ', '.join(str(len(column)) for column in numerics)))
+    stream = _open(target, 'w')
+    try:
+        stream = target if stream is None else stream
+        csv.writer(stream, delimiter=delimiter, lineterminator='\n').writerow(header)
+        if not numerics:
+            return
+        table = np.column_stack(numerics)
+        # repr() of a (Python) float is the shortest string reading back as the same float
+        row_format = delimiter.join(['%r']*len(numerics))+'\n'
+        for start in range(0, len(table), batch_size):
+            rows = table[start:start+batch_size]
+            stream.write((row_format*len(rows)) % tuple(rows.ravel().tolist()))
+    finally:
+        if stream is not target:
+            stream.close()
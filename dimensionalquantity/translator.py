@@ -9,14 +9,16 @@ instead of the more cumbersome `BaseDimQuant` init
 with a numeric and a Dimensional argument."""
 
 import re # https://docs.python.org/3/library/re.html#writing-a-tokenizer
-from collections import namedtuple
+import sys
+from collections import namedtuple, OrderedDict
 
 from . import Dimensional as D
 from . import BaseDimQuant as DQ
+from .basedimquant import _checked_numeric
 
 
-# https://docs.python.org/3/library/re.html#writing-a-tokenizer
-Token = namedtuple('Token', ['typ', 'value'])
+# same fields as functools.lru_cache().cache_info()
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
 
 SI_unit_LUT = {'m': DQ(1, {'L':1}),
                's': DQ(1, {'t':1}),
@@ -28,6 +30,23 @@ SI_unit_LUT = {'m': DQ(1, {'L':1}),
                # but instead of creating a special case,
                # initalizing 'g' as basic seems to be cleaner.
                'g': DQ(1e-3, {'M':1}), 
+               # coherent derived units, expressed in the base units above
+               # (mass in kg, as their numerics are 1).
+               # reverse_unit_lookup() uses them to shorten its output, e.g. 'N' for 'g.m.s-2'.
+               'Hz': DQ(1, {'t':-1}),
+               'N': DQ(1, {'M':1, 'L':1, 't':-2}),
+               'Pa': DQ(1, {'M':1, 'L':-1, 't':-2}),
+               'J': DQ(1, {'M':1, 'L':2, 't':-2}),
+               'W': DQ(1, {'M':1, 'L':2, 't':-3}),
+               'C': DQ(1, {'t':1, 'i':1}),
+               'V': DQ(1, {'M':1, 'L':2, 't':-3, 'i':-1}),
+               'F': DQ(1, {'M':-1, 'L':-2, 't':4, 'i':2}),
+               'Ohm': DQ(1, {'M':1, 'L':2, 't':-3, 'i':-2}),
+               'Ω': DQ(1, {'M':1, 'L':2, 't':-3, 'i':-2}),
+               'S': DQ(1, {'M':-1, 'L':-2, 't':3, 'i':2}),
+               'Wb': DQ(1, {'M':1, 'L':2, 't':-2, 'i':-1}),
+               'T': DQ(1, {'M':1, 't':-2, 'i':-1}),
+               'H': DQ(1, {'M':1, 'L':2, 't':-2, 'i':-2}),
                }
 
 SI_prefix_LUT = {'Y': 1e24,
@@ -39,7 +58,7 @@ SI_prefix_LUT = {'Y': 1e24,
                  'M': 1e6,
                  'k': 1e3,
                  'h': 1e2,
-                 #'da': 1e1, # TBD: this is the only prefix needing more than one character
+                 'da': 1e1,
                  '': 1e0,
                  'd': 1e-1,
                  'c': 1e-2,
@@ -58,7 +77,9 @@ class BasicTranslator(object):
     This class further allows to convert back, from a Dimensional to a string.
     
     Args:
-        The init of this class takes no arguments.
+        cache_size (int=256): how many translated unit strings are remembered,
+            least recently used ones are dropped first.
+            None means no limit, 0 disables the cache.
         The main use of this class is through the two methods `translate()` and `reverse_unit_lookup()`.
         However, before you can use those two methods (e.g. to hand it the above example of '1 m.s'),
         you have to register (`register_*_LUT()`) a look-up-table.
@@ -74,7 +95,7 @@ class BasicTranslator(object):
     # for all instances of Translator()
     # https://docs.python.org/3/library/re.html#writing-a-tokenizer
     _token_specification = [
-        ('UNIT',  r'[A-Za-z]+'), # any collection of letters...
+        ('UNIT',  r'[^\W\d_]+'), # any collection of letters (including e.g. 'Ω')...
         ('HOWOFTEN', r'(\-)?(\d+(\.\d+)?)'), # a (possibly negative) (float) number
         ('SEP',r'\.'),            # '.' is a separator, has no real functionality except to help understand from where to where a unit goes
         ('NEGSEP',r'\/'),            # m/s should be the same as m.s-1; NEGSEP makes sure we don't miss the '-1'
@@ -84,79 +105,123 @@ class BasicTranslator(object):
     _token_grammar = '|'.join('(?P<%s>%s)' % pair for pair in _token_specification)
     _token_program = re.compile(_token_grammar)
 
-    def __init__(self):
+    def __init__(self, cache_size=256):
         self._unit_LUT = {}
         self._prefix_LUT = {}
+        self._build_symbol_table()
+        # unit string -> (conversion factor, Dimensional)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
 
-    @classmethod
-    def _tokenize(cls, string):
-        yield Token('GROUPOPEN','^')
-        for match in cls._token_program.finditer(string):
+    def _parse(self, string):
+        # single pass over the tokens, with an explicit stack of open groups.
+        # Each group is a list [sign, top, dimensions, factor, last_dimensions, last_factor]:
+        # `sign` applies to the units yet to come,
+        # `top` marks the outermost group, in which '.' resets the sign and '/' sets it to -1,
+        # whereas within parentheses '.' keeps the sign and '/' flips it.
+        # `last_*` is the most recent unit or group, to which a following HOWOFTEN applies,
+        # all previous units and groups have been folded into `dimensions` and `factor`
+        # (None as long as there is nothing to fold).
+        group = [1, True, None, 1, None, 1]
+        stack = []
+        for match in self._token_program.finditer(string):
             kind = match.lastgroup
-            value = match.group(kind)
             if kind=='UNIT':
-                yield Token('GROUPOPEN','(')
-                yield Token('UNIT', value)
-                yield Token('GROUPCLOSE', ')')
-            else:
-                yield Token(kind, value)
-        yield Token('GROUPCLOSE','$')
-
-    def _process_tokens(self, tokens, sign=1, parens_ineq=-1):
-        # parens_ineq starts at -1 because tokenizer wraps everything within ^...$,
-        # so that an equal parens has still one left (from ^);
-        # hence either weassume equal==1 (which looks unintuitive)
-        # or we start with a -1 offset
-        _collection = []
-        _D = D()
-        conversion_factor = 1
-        for token in tokens:
-            if token.typ=='GROUPCLOSE':
-                _collection.append( _D )
-                parens_ineq -= 1
-                return _collection, conversion_factor, parens_ineq # this return will be seen only by recursive call from GROUPOPEN
-            if token.typ=='NEGSEP':
-                if parens_ineq==0:
-                    sign = -1
-                else:
-                    sign *= -1
-            if token.typ=='GROUPOPEN':
-                parens_ineq += 1
-                lower_coll, _cf, parens_ineq = self._process_tokens(tokens, sign, parens_ineq)
-                conversion_factor *= _cf
-                lower_coll[-1] *= sign
-                _lower = D() 
-                for _d in lower_coll:
-                    _lower += _d
-                _collection.append( _lower )
-            if token.typ=='UNIT':
-                _DQ = self._process_unit(token.value)
-                _D += _DQ.dimensions
-                conversion_factor *= _DQ.numeric
-            if token.typ=='SEP':
-                if parens_ineq==0:
-                    sign = (-1)**parens_ineq
+                factor, dimensions = self._process_unit(match.group(kind))
+                if group[4] is not None:
+                    self._fold(group)
+                sign = group[0]
+                group[4] = dimensions if sign==1 else dimensions*sign
+                group[5] = factor if sign==1 else factor**sign
+            elif kind=='HOWOFTEN':
+                if group[4] is None:
+                    raise ValueError(' '.join(['The exponent \'{}\''.format(match.group(kind)),
+                                               'in \'{}\' doesn\'t follow a unit.'.format(string)]))
+                exponent = float(match.group(kind))
+                group[4] *= exponent
+                group[5] **= exponent
+            elif kind=='SEP':
+                if group[1]:
+                    group[0] = 1
+            elif kind=='NEGSEP':
+                if group[1]:
+                    group[0] = -1
                 else:
-                    pass
-            if token.typ=='HOWOFTEN':
-                _collection[-1] *= float(token.value)
-        return DQ(conversion_factor, _collection[-1])
+                    group[0] *= -1
+            elif kind=='GROUPOPEN':
+                stack.append(group)
+                group = [group[0], False, None, 1, None, 1]
+            else: # GROUPCLOSE
+                if not stack:
+                    raise ValueError('Unbalanced parentheses in \'{}\'.'.format(string))
+                self._fold(group)
+                dimensions, factor = group[2], group[3]
+                group = stack.pop()
+                if group[4] is not None:
+                    self._fold(group)
+                group[4], group[5] = (D() if dimensions is None else dimensions), factor
+        if stack:
+            raise ValueError('Unbalanced parentheses in \'{}\'.'.format(string))
+        self._fold(group)
+        return DQ._trusted(group[3], D() if group[2] is None else group[2])
+
+    @staticmethod
+    def _fold(group):
+        # fold the most recent unit or group into the ones before
+        if group[4] is None:
+            return
+        group[2] = group[4] if group[2] is None else group[2]+group[4]
+        group[3] = group[5] if group[3]==1 else group[3]*group[5]
+        group[4] = None
+
+    def _build_symbol_table(self):
+        # every combination of prefix and unit, e.g. 'km', 'dam', or 'mg',
+        # mapped to its (conversion factor, Dimensional);
+        # rebuilt (along with the index for reverse_unit_lookup())
+        # whenever a LUT is registered, so that a lookup is a single dict access.
+        # If a combination is ambiguous the longer unit wins (i.e. the shorter prefix),
+        # and an actual unit always takes precedence over a prefixed one.
+        self._symbol_table = {}
+        # base dimension -> unit expressing it, for reverse_unit_lookup();
+        # the reverse look up works only with atomic units such as 'm' = {'L': 1},
+        # of several such units the first registered one is used
+        self._reverse_index = {}
+        # all other units with a conversion factor of 1 (e.g. 'N'),
+        # which reverse_unit_lookup() combines with the atomic ones
+        self._derived_units = []
+        self._reverse_memo = {}
+        for unit, _DQ in self._unit_LUT.items():
+            if len(_DQ.dimensions)==1:
+                (dimension, value), = _DQ.dimensions.items()
+                if value==1:
+                    self._reverse_index.setdefault(dimension, unit)
+                    continue
+            if _DQ.numeric==1 and _DQ.dimensions:
+                self._derived_units.append((unit, _DQ.dimensions))
+        for prefix in sorted(self._prefix_LUT, key=len, reverse=True):
+            prefix_factor = self._prefix_LUT[prefix]
+            for unit, _DQ in self._unit_LUT.items():
+                self._symbol_table[prefix+unit] = (prefix_factor*_DQ.numeric, _DQ.dimensions)
+        for unit, _DQ in self._unit_LUT.items():
+            self._symbol_table[unit] = (_DQ.numeric, _DQ.dimensions)
 
     def _process_unit(self, unit_value):
-        if unit_value in self._unit_LUT.keys():
-            return self._unit_LUT[unit_value]
+        try:
+            return self._symbol_table[unit_value]
+        except KeyError:
+            pass
         if len(unit_value)>=2:
-            prefix = unit_value[0]
-            unit_value = unit_value[1:]
-            if unit_value not in self._unit_LUT.keys(): 
+            units = [unit for unit in self._unit_LUT if unit_value.endswith(unit) and unit!=unit_value]
+            if not units:
                 raise KeyError(' '.join(['{} doesn\'t recognize'.format(type(self).__name__),
                                          'symbol {}'.format(unit_value),
                                          'and can thus not translate it into a DimQuant.']))
-            if prefix not in self._prefix_LUT.keys():
-                raise KeyError(' '.join(['{} doesn\'t recognize'.format(type(self).__name__),
-                                         'prefix \'{}\''.format(prefix),
-                                         'of unit \'{}\'.'.format(unit_value)]))
-            return self._unit_LUT[unit_value]*self._prefix_LUT[prefix]
+            unit = max(units, key=len)
+            raise KeyError(' '.join(['{} doesn\'t recognize'.format(type(self).__name__),
+                                     'prefix \'{}\''.format(unit_value[:-len(unit)]),
+                                     'of unit \'{}\'.'.format(unit)]))
         else:
             raise ValueError(' '.join(['Cannot recognize a registered unit pattern',
                                         'in \'{}\'.'.format(unit_value),
@@ -185,8 +250,153 @@ class BasicTranslator(object):
             :py:meth: `dimensionalquantity.BasicTranslator.register_unit_LUT`
             :py:meth: `dimensionalquantity.BasicTranslator.register_prefix_LUT`
         """
-        tokens = self._tokenize(string)
-        return self._process_tokens(tokens)
+        try:
+            conversion_factor, dimensions = self._cache[string]
+        except KeyError:
+            self._cache_misses += 1
+            _DQ = self._parse(string)
+            conversion_factor, dimensions = _DQ.numeric, _DQ.dimensions
+            if self._cache_size!=0:
+                self._cache[string] = (conversion_factor, dimensions)
+                if self._cache_size is not None and len(self._cache)>self._cache_size:
+                    self._cache.popitem(last=False)
+        else:
+            self._cache_hits += 1
+            self._cache.move_to_end(string)
+        return DQ._trusted(conversion_factor, dimensions)
+
+    def compile(self, string, quantity_class=DQ):
+        """Translates a unit string once,
+        for applying it to many numbers without parsing it again.
+        Example (this of course depends on what look-up-tables (LUTs) are registered):
+        >>> kgms2 = self.compile('kg.m/s2')
+        >>> kgms2(3)
+        BaseDimQuant(3.0, Dimensional({'L': 1, 't': -2, 'M': 1}))
+        >>> kgms2([1, 2])
+        [BaseDimQuant(1.0, ...), BaseDimQuant(2.0, ...)]
+
+        Args:
+            string (str): String of units, as accepted by `translate()`.
+            quantity_class (type=BaseDimQuant): class of the quantities created,
+                e.g. DimQuant.
+
+        Return:
+            CompiledUnit, a callable turning numbers into quantities.
+
+        .. seealso::
+            :py:meth: `dimensionalquantity.CompiledUnit`
+            :py:meth: `dimensionalquantity.DimQuant.compile`
+        """
+        _DQ = self.translate(string)
+        return CompiledUnit(string, _DQ.numeric, _DQ.dimensions, quantity_class)
+
+    def parse_many(self, strings, grouped=False):
+        """Translates many string representations of quantities at once,
+        e.g. a column of a CSV file.
+        Each distinct unit string is translated only once,
+        and the numbers are converted in bulk.
+        Example (this of course depends on what look-up-tables (LUTs) are registered):
+        >>> self.parse_many(['1 m', '2 km', '3 cm'])
+        DimQuantArray([1.e+00 2.e+03 3.e-02], Dimensional({'L': 1}))
+        >>> self.parse_many(['1 m', '2 s', '3 km'], grouped=True)
+        {Dimensional({'L': 1}): DimQuantArray([1.e+00 3.e+03], ...), Dimensional({'t': 1}): DimQuantArray([2.], ...)}
+
+        Args:
+            strings (iterable of str): quantities like '1 m/s',
+                a number and a unit string separated by whitespace.
+            grouped (bool=False): if False all quantities have to have equal dimensions;
+                if True they are grouped by their dimensions.
+
+        Return:
+            DimQuantArray of all quantities, in the order of the input
+            (non-dimensional and empty if there are none);
+            or, if `grouped`, a dict mapping each Dimensional to a DimQuantArray
+            of the quantities with these dimensions, in the order of the input.
+            Requires NumPy.
+
+        Raises:
+            ValueError: if a string isn't of the form '<number> <unit>',
+                or (unless `grouped`) if the dimensions differ,
+                stating the position of the offending string.
+
+        .. seealso::
+            :py:meth: `dimensionalquantity.DimQuant.from_strings`
+        """
+        import numpy as np
+        from .dimquantarray import DimQuantArray
+        # unit string -> ([positions], [numbers]); translated in a second pass
+        by_unit = OrderedDict()
+        for position, string in enumerate(strings):
+            try:
+                number, unit = string.split()
+            except (AttributeError, ValueError):
+                raise ValueError('{!r} at position {} isn\'t of the form \'<number> <unit>\'.'.format(
+                                 string, position))
+            entry = by_unit.get(unit)
+            if entry is None:
+                entry = by_unit[unit] = ([], [])
+            entry[0].append(position)
+            entry[1].append(number)
+        # Dimensional -> [(positions, numerics)]
+        by_dimensions = OrderedDict()
+        for unit, (positions, numbers) in by_unit.items():
+            try:
+                _DQ = self.translate(unit)
+            except (KeyError, ValueError) as error:
+                raise type(error)(' '.join([str(error.args[0]),
+                                            '(unit \'{}\' at position {})'.format(unit, positions[0])]))
+            try:
+                numerics = np.array(numbers, dtype=float)
+            except ValueError:
+                for position, number in zip(positions, numbers):
+                    try:
+                        float(number)
+                    except ValueError:
+                        raise ValueError('Number \'{}\' at position {} isn\'t a valid float.'.format(
+                                         number, position))
+            if _DQ.numeric!=1:
+                numerics *= _DQ.numeric
+            by_dimensions.setdefault(_DQ.dimensions, []).append((positions, numerics))
+        if not grouped and len(by_dimensions)>1:
+            (dimensions, _), *others = by_dimensions.items()
+            position, other_dimensions = min((positions[0], other_dimensions)
+                                             for other_dimensions, parts in others
+                                             for positions, _ in parts)
+            raise ValueError(' '.join(['All quantities have to have equal dimensions,',
+                                       'but {} at position {}'.format(other_dimensions, position),
+                                       'differs from {}.'.format(dimensions)]))
+        arrays = OrderedDict()
+        for dimensions, parts in by_dimensions.items():
+            if len(parts)==1:
+                numerics = parts[0][1]
+            else: # restore the order of the input
+                positions = np.concatenate([positions for positions, _ in parts])
+                numerics = np.concatenate([numerics for _, numerics in parts])[np.argsort(positions, kind='stable')]
+            arrays[dimensions] = DimQuantArray._trusted(numerics, dimensions)
+        if grouped:
+            return dict(arrays)
+        if not arrays:
+            return DimQuantArray()
+        array, = arrays.values()
+        return array
+
+    def cache_info(self):
+        """Statistics of the cache of `translate()`,
+        in the same format as `functools.lru_cache`.
+
+        Return:
+            CacheInfo(hits, misses, maxsize, currsize)
+        """
+        return CacheInfo(self._cache_hits, self._cache_misses, self._cache_size, len(self._cache))
+
+    def cache_clear(self):
+        """Empties the cache of `translate()` and resets its statistics.
+        Registering a LUT empties the cache as well
+        (but keeps the statistics),
+        since a unit string may then translate differently."""
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def reverse_unit_lookup(self, dimensions):
         """Translates (aka converts) a Dimensional instance into a string representation.
@@ -196,6 +406,15 @@ class BasicTranslator(object):
         >>> print(s)
         'm.s-2'
         
+        Each base dimension is expressed by the first registered unit
+        consisting of only that dimension (e.g. 'm' for {'L': 1}).
+        Derived units with a conversion factor of 1 (e.g. 'N')
+        replace base units whenever this results in fewer symbols,
+        e.g. {'M':1, 'L':1, 't':-1} becomes 'N.s' instead of 'g.m.s-1';
+        on a tie the base units are kept ('m.s-1' rather than 'Hz.m').
+        The resulting strings are remembered per Dimensional
+        (until another LUT is registered).
+
         Args:
             dimensions (Dimensional, dict): the dimensions you want to convert into a string.
 
@@ -206,22 +425,63 @@ class BasicTranslator(object):
             :py:meth: `dimensionalquantity.BasicTranslator.register_unit_LUT`
             :py:meth: `dimensionalquantity.BasicTranslator.register_prefix_LUT`
         """
-        #TODO: clean up the code, yes the tests pass, but its ugly!
         if not isinstance(dimensions, (dict,D)):
             raise TypeError('Cannot lookup {}, which is of type {}'.format(
                             dimensions, type(dimensions).__name__))
+        dimensions = D(dimensions)
+        try:
+            return self._reverse_memo[dimensions]
+        except KeyError:
+            pass
         output = []
-        for dimension,value in dimensions.items():
-            if value==0: continue
-            for unit,dq in self._unit_LUT.items():
-                for _dim in dq.dimensions:
-                    if len(_dim)>1: continue # the reverse look up works only with atomic base dimensions
-                    _key = list(_dim)[0]
-                    if _key==dimension:
-                        output.append(unit)
-                        if value!=1:
-                            output[-1] += str(value)
-        return '.'.join(output)
+        chosen, residual = self._simplify(dimensions)
+        for unit, exponent in chosen:
+            output.append(unit if exponent==1 else unit+str(exponent))
+        for dimension, value in residual.items():
+            unit = self._reverse_index.get(dimension)
+            if unit is None: continue # no registered unit to express this dimension
+            output.append(unit if value==1 else unit+str(value))
+        unit_string = self._reverse_memo[dimensions] = '.'.join(output)
+        return unit_string
+
+    def _simplify(self, dimensions):
+        # greedy search for derived units shortening the output of reverse_unit_lookup():
+        # the cost of a representation is first the number of base dimensions left over
+        # for which there is no atomic unit (and which would thus be missing from the output),
+        # then its number of symbols,
+        # i.e. the number of derived units plus the number of base dimensions left over.
+        # Each round picks the derived unit (and integer exponent) lowering the cost the most,
+        # preferring the smallest exponent (and then the first registered unit) among equals,
+        # until none lowers it any further.
+        # Only exponents matching one of the residual's exponents are worth trying,
+        # so that a round takes a single pass over the derived units.
+        # Returns the chosen [(unit, exponent)] and the Dimensional left over.
+        chosen = []
+        residual = dimensions
+        while True:
+            current_cost = self._cost(residual, 0)
+            best, best_cost = None, None
+            for unit, unit_dimensions in self._derived_units:
+                if any(unit==used for used, _ in chosen):
+                    continue
+                exponents = set()
+                for dimension, value in unit_dimensions.items():
+                    exponent = residual[dimension]/value
+                    if exponent and exponent==int(exponent):
+                        exponents.add(int(exponent))
+                for exponent in sorted(exponents, key=lambda e: (abs(e), -e)):
+                    remainder = residual - unit_dimensions*exponent
+                    cost = self._cost(remainder, 1)
+                    if cost<current_cost and (best is None or (cost, abs(exponent))<best_cost):
+                        best, best_cost = (unit, exponent, remainder), (cost, abs(exponent))
+            if best is None:
+                return chosen, residual
+            unit, exponent, residual = best
+            chosen.append((unit, exponent))
+
+    def _cost(self, residual, added_units):
+        missing = sum(1 for dimension in residual if dimension not in self._reverse_index)
+        return (missing, added_units+len(residual))
 
     def register_unit_LUT(self, unit_LUT, override=False):
         """The Translator converts string representations of a dimensional quantity
@@ -252,17 +512,21 @@ class BasicTranslator(object):
         .. seealso:: 
             :py:meth: `dimensionalquantity.BaseDimQuant`
             :py:meth: `dimensionalquantity.DimQuant`"""
-        if override:
-            self._unit_LUT = dict(unit_LUT) #copy to have different pointer to avoid spooky action from a distance
-        else:
-            for (symbol, dimension) in unit_LUT.items():
-                if symbol in self._unit_LUT.keys():
-                    raise ValueError(' '.join(['Cannot register rule to translate',
-                                               'symbol \'{}\' into dimension \'{}\''.format(symbol, dimension),
-                                               'because this symbol is already registered with',
-                                               'dimension \'{}\'.'.format(symbol)]))
-                else:
-                    self._unit_LUT[symbol] = dimension
+        self._cache.clear()
+        try:
+            if override:
+                self._unit_LUT = dict(unit_LUT) #copy to have different pointer to avoid spooky action from a distance
+            else:
+                for (symbol, dimension) in unit_LUT.items():
+                    if symbol in self._unit_LUT.keys():
+                        raise ValueError(' '.join(['Cannot register rule to translate',
+                                                   'symbol \'{}\' into dimension \'{}\''.format(symbol, dimension),
+                                                   'because this symbol is already registered with',
+                                                   'dimension \'{}\'.'.format(symbol)]))
+                    else:
+                        self._unit_LUT[symbol] = dimension
+        finally: # also symbols registered before a ValueError have to be found
+            self._build_symbol_table()
 
     def register_prefix_LUT(self, prefix_LUT, override=False):
         """The Translator converts string representations of a dimensional quantity
@@ -278,7 +542,7 @@ class BasicTranslator(object):
         
         Args:
             prefix_LUT (dict): a dictionary whose keys state the string to translate
-                (currently only single letter prefixes are supported)
+                (of any length, e.g. 'k' or 'da')
                 and whose values are a float which states the relative value
                 compared to a certain baseline
                 (e.g. for regular SI units, 'k' would typically signify '1e3')
@@ -291,28 +555,60 @@ class BasicTranslator(object):
         Return:
             None or ValueError if the present LUT is not overridden and
             a key of the new LUT is already present in the current LUT.
-            NotImplementedError if the prefix_LUT contains keys whose string
-            is more than 1 letter (0 letter (empty string)) is allowed
-            and typically signifies unity 1e0.
+            The empty string is allowed as prefix,
+            it typically signifies unity 1e0.
             
         .. seealso:: 
             :py:meth: `dimensionalquantity.BaseDimQuant`
             :py:meth: `dimensionalquantity.DimQuant`"""
-        for symbol in prefix_LUT.keys():
-            if len(symbol)>1:
-                raise NotImplementedError('Prefixes have to have only 1 (one) letter,'\
-                                          + ' other string sizes are currently not supported.'\
-                                          + ' The erroneous symbol ({}) contains {} letters.'.format(
-                                              symbol, len(symbol)))
-        if override:
-            self._prefix_LUT = dict(prefix_LUT) #copy to have different pointer to avoid spooky action from a distance
-        else:
-            for (symbol, value) in prefix_LUT.items():
-                if symbol in self._prefix_LUT.keys():
-                    raise ValueError(' '.join(['Cannot register prefix \'{}\''.format(symbol),
-                                               'because this symbol is already used.']))
-                else:
-                    self._prefix_LUT[symbol] = value
+        self._cache.clear()
+        try:
+            if override:
+                self._prefix_LUT = dict(prefix_LUT) #copy to have different pointer to avoid spooky action from a distance
+            else:
+                for (symbol, value) in prefix_LUT.items():
+                    if symbol in self._prefix_LUT.keys():
+                        raise ValueError(' '.join(['Cannot register prefix \'{}\''.format(symbol),
+                                                   'because this symbol is already used.']))
+                    else:
+                        self._prefix_LUT[symbol] = value
+        finally: # also prefixes registered before a ValueError have to be found
+            self._build_symbol_table()
+
+class CompiledUnit(object):
+    """A unit string translated once, see `BasicTranslator.compile()`.
+    Calling it with numbers creates quantities without any parsing:
+    a single number results in a single quantity,
+    a NumPy ndarray in a DimQuantArray,
+    and any other iterable in a list of quantities.
+
+    Args:
+        unit_string (str): the unit string, for reference.
+        factor (int, float, complex): conversion factor of said unit string.
+        dimensions (Dimensional): dimensions of said unit string.
+        quantity_class (type=BaseDimQuant): class of the quantities created.
+    """
+
+    def __init__(self, unit_string, factor, dimensions, quantity_class=DQ):
+        self.unit_string = unit_string
+        self.factor = factor
+        self.dimensions = D(dimensions)
+        self.quantity_class = quantity_class
+
+    def __call__(self, values):
+        if isinstance(values, (int, float, complex)):
+            return self.quantity_class._trusted(_checked_numeric(values)*self.factor, self.dimensions)
+        numpy = sys.modules.get('numpy') # an ndarray can only be passed in if numpy has been imported
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            from .dimquantarray import DimQuantArray
+            return DimQuantArray(values*self.factor, self.dimensions)
+        if isinstance(values, str):
+            raise TypeError('{} is applied to numbers, not to strings like \'{}\'.'.format(
+                            type(self).__name__, values))
+        return [self(value) for value in values]
+
+    def __repr__(self):
+        return 'CompiledUnit({!r}, {}, {})'.format(self.unit_string, self.factor, self.dimensions)
 
 class Translator(BasicTranslator):
     """Class child of BasicTranslator.
@@ -320,7 +616,7 @@ class Translator(BasicTranslator):
     from a Dimensional to a string.
     
     Args:
-        The init of this class takes no arguments.
+        cache_size (int=256): see `BasicTranslator`.
         The main use of this class is through the two methods `translate()` and `reverse_unit_lookup()`.
         However, before you can use those two methods, you have to register `register_*_LUT()` a look-up-table.
         By default SI LUTs are registered (hence the 'manage out of the box' statement above.)
@@ -335,8 +631,8 @@ class Translator(BasicTranslator):
         is the key difference between `BaseDimQuant` and `DimQuant`.
         :py:meth: `dimensionalquantity.DimQuant`
     """
-    def __init__(self):
-        super(Translator, self).__init__()
+    def __init__(self, cache_size=256):
+        super(Translator, self).__init__(cache_size)
         self.register_unit_LUT(SI_unit_LUT)
         self.register_prefix_LUT(SI_prefix_LUT)
 